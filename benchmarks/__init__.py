@@ -0,0 +1 @@
+# MIRA CLI 성능 벤치마크 모음
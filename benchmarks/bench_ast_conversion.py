@@ -0,0 +1,127 @@
+# convert_to_ast_node 의 기존(재귀) 구현과 현재(TreeCursor 반복) 구현을 비교하는 벤치마크
+#
+# 사용법: python -m benchmarks.bench_ast_conversion [--scale N] [--json]
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+
+from mira_cli.parser import convert_to_ast_node, _get_parser
+
+
+# 기존 재귀 방식 변환기 (비교 기준)
+def convert_to_ast_node_recursive(sitter_node):
+    if not sitter_node:
+        return None
+
+    node_value = ""
+    if sitter_node.is_named and sitter_node.text:
+        node_value = sitter_node.text.decode('utf-8')
+
+    ast_node = {
+        "type": sitter_node.type,
+        "value": node_value,
+        "startPosition": {"row": sitter_node.start_point[0], "column": sitter_node.start_point[1]},
+        "endPosition": {"row": sitter_node.end_point[0], "column": sitter_node.end_point[1]},
+        "children": []
+    }
+
+    for child in sitter_node.children:
+        ast_node["children"].append(convert_to_ast_node_recursive(child))
+
+    return ast_node
+
+
+# 벤치마크 입력 생성 (확장자, 이름, 소스 바이트)
+def build_inputs(scale):
+    functions = "\n".join(
+        f"class C{i}:\n    def m(self, x):\n        if x > {i}:\n            return [x * {i} for x in range(10)]\n        return None\n"
+        for i in range(200 * scale)
+    )
+    minified_js = ";".join(f"var a{i}=function(b){{return b&&b.c?b.c({i}):[{i},{{d:{i}}}]}}" for i in range(500 * scale))
+    large_json = json.dumps([{"id": i, "tags": ["a", "b"], "meta": {"n": i, "ok": True}} for i in range(2000 * scale)])
+    deep_json = "[" * (2000 * scale) + "]" * (2000 * scale)
+    return [
+        ('.py', 'large_python', functions.encode('utf-8')),
+        ('.js', 'minified_js', minified_js.encode('utf-8')),
+        ('.json', 'large_json', large_json.encode('utf-8')),
+        ('.json', 'deep_json', deep_json.encode('utf-8')),
+    ]
+
+
+# 트리의 전체 노드 수 계산
+def count_nodes(tree):
+    count = 0
+    cursor = tree.walk()
+    while True:
+        count += 1
+        if cursor.goto_first_child():
+            continue
+        while not cursor.goto_next_sibling():
+            if not cursor.goto_parent():
+                return count
+
+
+# 변환 함수 하나의 처리량(nodes/sec)과 최대 메모리 사용량 측정
+# (tracemalloc 오버헤드가 시간 측정에 섞이지 않도록 두 번 나누어 실행)
+def measure(convert, root_node, node_count):
+    started = time.perf_counter()
+    try:
+        convert(root_node)
+    except RecursionError:
+        return {"error": "RecursionError"}
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    convert(root_node)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "seconds": round(elapsed, 4),
+        "nodesPerSec": round(node_count / elapsed) if elapsed else None,
+        "peakBytes": peak,
+    }
+
+
+def run(scale):
+    results = []
+    for extension, name, source in build_inputs(scale):
+        parser, _ = _get_parser(extension)
+        tree = parser.parse(source)
+        node_count = count_nodes(tree)
+        results.append({
+            "input": name,
+            "sourceBytes": len(source),
+            "nodes": node_count,
+            "before": measure(convert_to_ast_node_recursive, tree.root_node, node_count),
+            "after": measure(convert_to_ast_node, tree.root_node, node_count),
+        })
+    return results
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description='convert_to_ast_node 재귀/반복 구현 비교 벤치마크')
+    arg_parser.add_argument('--scale', type=int, default=1, help='입력 크기 배수')
+    arg_parser.add_argument('--json', action='store_true', help='결과를 JSON 으로 출력')
+    args = arg_parser.parse_args(argv)
+
+    results = run(args.scale)
+    if args.json:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+        return
+
+    def _fmt(result):
+        if "error" in result:
+            return f"{result['error']:>34}"
+        return f"{result['nodesPerSec']:>12,} n/s {result['peakBytes'] / 1e6:>9.1f} MB"
+
+    print(f"{'input':<14}{'nodes':>10}  {'before (recursive)':>34}  {'after (cursor)':>34}")
+    for result in results:
+        print(f"{result['input']:<14}{result['nodes']:>10,}  {_fmt(result['before'])}  {_fmt(result['after'])}")
+
+
+if __name__ == '__main__':
+    main()
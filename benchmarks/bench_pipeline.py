@@ -0,0 +1,173 @@
+# 파싱/전송 파이프라인 전체 처리량 벤치마크
+#
+# 합성 코드베이스(benchmarks.synthetic_repo)를 만들고 로컬 스텁 백엔드(benchmarks.stub_backend)에 대해
+# parse_codebase_and_send_to_backend, convert_to_ast_node, /query 왕복을 측정합니다.
+# 결과(files/sec, MB/sec, 최대 RSS, 전송 바이트 등)는 JSON 으로 출력하여 실행 간 회귀를 비교할 수 있습니다.
+#
+# 사용법: python -m benchmarks.bench_pipeline [--files N] [--jobs N] [--latency 초] [--output result.json]
+
+import argparse
+import json
+import os
+import platform
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.stub_backend import StubBackend
+from benchmarks.synthetic_repo import generate_repo, parse_mix
+
+
+# 현재 프로세스와 (종료된) 자식 프로세스의 최대 RSS (바이트)
+def peak_rss():
+    # Linux 의 ru_maxrss 단위는 KB, macOS 는 바이트
+    unit = 1 if sys.platform == 'darwin' else 1024
+    return {
+        "self": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * unit,
+        "children": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * unit,
+    }
+
+
+# 전체 파이프라인(스캔 → 파싱 → 변환 → 전송) 측정
+def bench_parse(repo_path, repo_stats, stub, jobs, upload_mode, ast_format):
+    from mira_cli.parser import parse_codebase_and_send_to_backend
+
+    started = time.perf_counter()
+    success = parse_codebase_and_send_to_backend(str(repo_path), full=True, jobs=jobs, upload_mode=upload_mode,
+                                                 ast_format=ast_format)
+    elapsed = time.perf_counter() - started
+    return {
+        "success": success,
+        "seconds": round(elapsed, 4),
+        "filesPerSec": round(repo_stats["files"] / elapsed, 2),
+        "mbPerSec": round(repo_stats["bytes"] / 1e6 / elapsed, 3),
+        "payloadWireBytes": sum(entry["wireBytes"] for entry in stub.requests.values()),
+        "payloadRawBytes": sum(entry["rawBytes"] for entry in stub.requests.values()),
+        "requests": {path: dict(entry) for path, entry in stub.requests.items()},
+    }
+
+
+# convert_to_ast_node 단독 처리량 측정 (파싱 시간 제외)
+def bench_convert(repo_path):
+    from mira_cli.parser import _get_parser, convert_to_ast_node, load_gitignore_patterns
+    from mira_cli.streaming import _iter_ast_node_json
+
+    total_seconds = 0.0
+    source_bytes = 0
+    payload_bytes = 0
+    for file_path in load_gitignore_patterns(repo_path).iter_files():
+        parser, _ = _get_parser(file_path.suffix)
+        if not parser:
+            continue
+        source = file_path.read_bytes()
+        tree = parser.parse(source)
+        started = time.perf_counter()
+        ast_node = convert_to_ast_node(tree.root_node)
+        total_seconds += time.perf_counter() - started
+        source_bytes += len(source)
+        # json.dumps 와 같은 JSON 을 비재귀로 인코딩 (깊게 중첩된 파일에서도 재귀 한도에 걸리지 않음)
+        payload_bytes += sum(len(text.encode('utf-8')) for text in _iter_ast_node_json(tree.root_node, source))
+    return {
+        "seconds": round(total_seconds, 4),
+        "mbPerSec": round(source_bytes / 1e6 / total_seconds, 3) if total_seconds else None,
+        "sourceBytes": source_bytes,
+        "payloadBytes": payload_bytes,
+    }
+
+
+# /query 왕복 지연 시간 측정
+def bench_query(count):
+    from mira_cli.backend_api import send_query_to_backend
+    from mira_cli.profiler import percentile
+
+    latencies = []
+    for index in range(count):
+        started = time.perf_counter()
+        send_query_to_backend(f"benchmark query {index}")
+        latencies.append(time.perf_counter() - started)
+    latencies.sort()
+    total = sum(latencies)
+    return {
+        "queries": count,
+        "queriesPerSec": round(count / total, 2) if total else None,
+        **{f"p{pct}Ms": round(percentile(latencies, pct) * 1000, 3) for pct in (50, 95, 99)},
+    }
+
+
+def run(args, work_dir):
+    import mira_cli.cache
+    import mira_cli.http_client
+    from mira_cli.manifest import current_grammar_version
+    from mira_cli.utils import console
+
+    repo_path = Path(work_dir) / "repo"
+    repo_stats = generate_repo(repo_path, files=args.files, mix=args.mix, huge_files=args.huge_files,
+                               huge_file_units=args.huge_file_units, nesting_depth=args.nesting_depth,
+                               gitignore_lines=args.gitignore_lines, seed=args.seed)
+
+    # 사용자 응답 캐시를 건드리지 않도록 임시 캐시(비활성) 사용, 진행률/디버그 출력은 숨김
+    mira_cli.cache._cache = mira_cli.cache.ResponseCache(cache_dir=Path(work_dir) / "cache", enabled=False)
+    console.quiet = True
+    try:
+        with StubBackend(latency=args.latency) as stub:
+            mira_cli.http_client._client = mira_cli.http_client.BackendClient(base_url=stub.url)
+            parse_result = bench_parse(repo_path, repo_stats, stub, args.jobs, args.upload_mode, args.ast_format)
+            query_result = bench_query(args.queries)
+    finally:
+        console.quiet = False
+        mira_cli.http_client._client = None
+    convert_result = bench_convert(repo_path)
+
+    return {
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpuCount": os.cpu_count(),
+            "grammarVersion": current_grammar_version(),
+        },
+        "config": {key: value for key, value in vars(args).items() if key not in ('output', 'keep')},
+        "repo": repo_stats,
+        "parse": parse_result,
+        "convert": convert_result,
+        "query": query_result,
+        "peakRssBytes": peak_rss(),
+    }
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description='파싱/전송 파이프라인 처리량 벤치마크')
+    arg_parser.add_argument('--files', type=int, default=200, help='작은 파일 수')
+    arg_parser.add_argument('--mix', type=parse_mix, default=None, help='언어 비율 (예: python=3,java=1)')
+    arg_parser.add_argument('--huge-files', type=int, default=1, help='큰 파일 수')
+    arg_parser.add_argument('--huge-file-units', type=int, default=2000, help='큰 파일의 클래스 수')
+    arg_parser.add_argument('--nesting-depth', type=int, default=500, help='깊은 중첩 파일의 중첩 깊이')
+    arg_parser.add_argument('--gitignore-lines', type=int, default=500, help='.gitignore 줄 수')
+    arg_parser.add_argument('--seed', type=int, default=0, help='난수 시드')
+    arg_parser.add_argument('--jobs', '-j', type=int, default=None, help='파싱 워커 프로세스 수 (기본: CPU 코어 수)')
+    arg_parser.add_argument('--upload-mode', choices=['bulk', 'single'], default=None, help='업로드 방식')
+    arg_parser.add_argument('--ast-format', choices=['nested', 'compact-v1'], default=None, help='AST 전송 형식')
+    arg_parser.add_argument('--latency', type=float, default=0.0, help='스텁 백엔드 응답 지연 (초)')
+    arg_parser.add_argument('--queries', type=int, default=50, help='/query 요청 수')
+    arg_parser.add_argument('--output', '-o', default=None, help='결과 JSON 파일 경로 (기본: 표준 출력)')
+    arg_parser.add_argument('--keep', default=None, help='합성 코드베이스를 지우지 않고 남겨 둘 디렉토리')
+    args = arg_parser.parse_args(argv)
+
+    if args.keep:
+        result = run(args, args.keep)
+    else:
+        with tempfile.TemporaryDirectory(prefix='mira-bench-') as work_dir:
+            result = run(args, work_dir)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+    else:
+        json.dump(result, sys.stdout, indent=2)
+        print()
+    return result
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+# 벤치마크용 로컬 스텁 백엔드
+#
+# 같은 프로세스의 백그라운드 스레드에서 HTTP 서버를 띄워 /parser/parse, /parser/parse/bulk,
+# /parser/remove, /query 요청에 응답합니다. 응답 지연 시간을 지정할 수 있고,
+# 엔드포인트별 요청 수와 전송(압축) 바이트 / 압축 해제 바이트를 집계합니다.
+
+import gzip
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+# Content-Encoding 에 따라 본문 압축 해제 (압축 해제 바이트 집계용)
+def _decompress(body, encoding):
+    if encoding == 'gzip':
+        return gzip.decompress(body)
+    if encoding == 'zstd':
+        import zstandard # zstd 압축 업로드는 zstandard 패키지가 있을 때만 사용됨
+        return zstandard.ZstdDecompressor().decompressobj().decompress(body)
+    return body
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1' # keep-alive 커넥션 재사용
+    disable_nagle_algorithm = True # 헤더/본문을 나눠 쓸 때 생기는 지연 ACK 대기(~40ms) 방지
+
+    def do_POST(self):
+        stub = self.server.stub
+        body = self._read_body()
+        stub.record(self.path, len(body), len(_decompress(body, self.headers.get('Content-Encoding'))))
+
+        if stub.latency:
+            time.sleep(stub.latency)
+        if self.path not in ('/parser/parse', '/parser/parse/bulk', '/parser/remove', '/query'):
+            self._reply(404, {"error": "not found"})
+        elif self.path == '/query':
+            self._reply(200, {"answer": "stub", "nodes": [{"id": "n1", "filePath": "stub.py"}]})
+        else:
+            self._reply(200, {"status": "ok"})
+
+    # 요청 본문 읽기 (스트리밍 업로드의 Transfer-Encoding: chunked 는 길이 0 인 청크까지 읽음)
+    def _read_body(self):
+        if 'chunked' not in self.headers.get('Transfer-Encoding', '').lower():
+            return self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        chunks = []
+        while True:
+            size = int(self.rfile.readline().split(b';', 1)[0].strip(), 16)
+            if size == 0:
+                # 트레일러 헤더와 마지막 빈 줄까지 읽어 keep-alive 커넥션에 남기지 않음
+                while self.rfile.readline() not in (b'\r\n', b'\n', b''):
+                    pass
+                return b''.join(chunks)
+            chunks.append(self.rfile.read(size))
+            self.rfile.readline() # 청크 끝의 CRLF
+
+    def _reply(self, status, payload):
+        data = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass # 요청마다 stderr 에 로그를 남기지 않음
+
+
+class StubBackend:
+    """지연 시간을 지정할 수 있는 프로세스 내 스텁 백엔드. with 문으로 시작/종료합니다."""
+
+    def __init__(self, latency=0.0, host='127.0.0.1', port=0):
+        self.latency = latency
+        self.requests = {}
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), _StubHandler)
+        self._server.daemon_threads = True
+        self._server.stub = self
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    # 엔드포인트별 요청 수와 바이트 집계
+    def record(self, path, wire_bytes, raw_bytes):
+        with self._lock:
+            entry = self.requests.setdefault(path, {"requests": 0, "wireBytes": 0, "rawBytes": 0})
+            entry["requests"] += 1
+            entry["wireBytes"] += wire_bytes
+            entry["rawBytes"] += raw_bytes
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
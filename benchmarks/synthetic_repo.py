@@ -0,0 +1,147 @@
+# 벤치마크용 합성 코드베이스 생성기
+#
+# 같은 시드와 옵션이면 항상 같은 파일 트리를 만들어 실행 간 결과를 비교할 수 있습니다.
+# 많은 작은 파일, 큰 파일, 깊게 중첩된 코드, 긴 .gitignore 를 크기/언어 비율별로 조합합니다.
+#
+# 사용법: python -m benchmarks.synthetic_repo OUTPUT_DIR [--files N] [--mix python=3,java=1] ...
+
+import argparse
+import json
+import random
+from pathlib import Path
+
+# 언어별 확장자와 파일 하나 분량의 코드를 만드는 함수
+_GENERATORS = {}
+
+
+def _generator(lang, extension):
+    def register(func):
+        _GENERATORS[lang] = (extension, func)
+        return func
+    return register
+
+
+@_generator('python', '.py')
+def _python_source(rng, units):
+    return "\n".join(
+        f"class Model{i}:\n    def method(self, value):\n        if value > {rng.randint(0, 99)}:\n"
+        f"            return [value * {i} for value in range({rng.randint(1, 20)})]\n        return None\n"
+        for i in range(units)
+    )
+
+
+@_generator('javascript', '.js')
+def _javascript_source(rng, units):
+    return "\n".join(
+        f"export function handler{i}(req) {{\n  const items = req.items.map(x => x * {rng.randint(1, 9)});\n"
+        f"  return {{ id: {i}, items, ok: items.length > {rng.randint(0, 5)} }};\n}}\n"
+        for i in range(units)
+    )
+
+
+@_generator('java', '.java')
+def _java_source(rng, units):
+    methods = "\n".join(
+        f"    public int method{i}(int value) {{\n        if (value > {rng.randint(0, 99)}) {{ return value * {i}; }}\n"
+        f"        return {rng.randint(0, 9)};\n    }}\n"
+        for i in range(units)
+    )
+    return f"public class Generated {{\n{methods}}}\n"
+
+
+@_generator('go', '.go')
+def _go_source(rng, units):
+    funcs = "\n".join(
+        f"func Handler{i}(value int) int {{\n\tif value > {rng.randint(0, 99)} {{\n\t\treturn value * {i}\n\t}}\n"
+        f"\treturn {rng.randint(0, 9)}\n}}\n"
+        for i in range(units)
+    )
+    return f"package generated\n\n{funcs}"
+
+
+@_generator('json', '.json')
+def _json_source(rng, units):
+    return json.dumps([{"id": i, "tags": ["a", "b"], "meta": {"n": rng.randint(0, 999), "ok": True}}
+                       for i in range(units * 5)])
+
+
+# 언어 비율 문자열 파싱 (예: "python=3,java=1")
+def parse_mix(text):
+    mix = {}
+    for item in text.split(','):
+        lang, _, weight = item.partition('=')
+        lang = lang.strip()
+        if lang not in _GENERATORS:
+            raise ValueError(f"지원하지 않는 언어입니다: {lang} (가능: {', '.join(sorted(_GENERATORS))})")
+        mix[lang] = float(weight or 1)
+    return mix
+
+
+# 합성 코드베이스를 생성하고 생성한 파일 통계를 반환
+def generate_repo(root, files=200, mix=None, units_per_file=5, huge_files=1, huge_file_units=2000,
+                  deep_nesting=1, nesting_depth=500, gitignore_lines=500, dir_fanout=20, seed=0):
+    """
+    files 개의 작은 파일을 언어 비율(mix)에 따라 dir_fanout 개씩 하위 디렉토리에 나누어 만들고,
+    huge_files 개의 큰 파일, deep_nesting 개의 깊게 중첩된 파일, gitignore_lines 줄의 .gitignore 를 추가합니다.
+    .gitignore 에 걸리는 파일(ignored/ 아래)도 함께 만들어 무시 규칙 처리 비용이 측정에 포함되도록 합니다.
+    """
+    rng = random.Random(seed)
+    root = Path(root)
+    root.mkdir(parents=True, exist_ok=True)
+    mix = mix or {'python': 3, 'javascript': 2, 'java': 1, 'go': 1}
+    languages = list(mix)
+    weights = [mix[lang] for lang in languages]
+    stats = {"files": 0, "bytes": 0, "ignoredFiles": 0, "languages": {}}
+
+    def _write(rel_path, text, lang=None):
+        path = root / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = text.encode('utf-8')
+        path.write_bytes(data)
+        if lang:
+            stats["files"] += 1
+            stats["bytes"] += len(data)
+            stats["languages"][lang] = stats["languages"].get(lang, 0) + 1
+
+    for index in range(files):
+        lang = rng.choices(languages, weights)[0]
+        extension, generate = _GENERATORS[lang]
+        _write(f"src/pkg{index // dir_fanout}/module{index}{extension}", generate(rng, units_per_file), lang)
+
+    for index in range(huge_files):
+        _write(f"huge/huge{index}.py", _python_source(rng, huge_file_units), 'python')
+
+    for index in range(deep_nesting):
+        _write(f"deep/nested{index}.json", "[" * nesting_depth + "]" * nesting_depth, 'json')
+        body = "x = " + "(" * nesting_depth + "1" + ")" * nesting_depth + "\n"
+        _write(f"deep/nested{index}.py", body, 'python')
+
+    # 대부분 매칭되지 않는 패턴으로 채운 긴 .gitignore (+ 실제로 무시되는 디렉토리)
+    patterns = [f"generated_{index}_*.{rng.choice(['py', 'js', 'tmp'])}" for index in range(max(0, gitignore_lines - 2))]
+    patterns += ["ignored/", "!ignored/keep.py"]
+    (root / ".gitignore").write_text("\n".join(patterns) + "\n", encoding='utf-8')
+    (root / "ignored").mkdir(exist_ok=True)
+    for index in range(dir_fanout):
+        (root / "ignored" / f"skip{index}.py").write_text("skipped = True\n", encoding='utf-8')
+        stats["ignoredFiles"] += 1
+    return stats
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description='벤치마크용 합성 코드베이스 생성')
+    arg_parser.add_argument('output', help='생성할 디렉토리')
+    arg_parser.add_argument('--files', type=int, default=200, help='작은 파일 수')
+    arg_parser.add_argument('--mix', type=parse_mix, default=None, help='언어 비율 (예: python=3,java=1)')
+    arg_parser.add_argument('--huge-files', type=int, default=1, help='큰 파일 수')
+    arg_parser.add_argument('--nesting-depth', type=int, default=500, help='깊은 중첩 파일의 중첩 깊이')
+    arg_parser.add_argument('--gitignore-lines', type=int, default=500, help='.gitignore 줄 수')
+    arg_parser.add_argument('--seed', type=int, default=0, help='난수 시드')
+    args = arg_parser.parse_args(argv)
+
+    stats = generate_repo(args.output, files=args.files, mix=args.mix, huge_files=args.huge_files,
+                          nesting_depth=args.nesting_depth, gitignore_lines=args.gitignore_lines, seed=args.seed)
+    print(json.dumps(stats, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,120 +1,148 @@
-import requests
-from rich.console import Console
-from mira_cli.config_loader import BACKEND_API_URL, WEB_UI_URL
-import webbrowser
-
-console = Console()
+import codecs
+import json
+from mira_cli.config_loader import HTTP_BATCH_CONCURRENCY
+from mira_cli.http_client import get_client, report_request_error, describe_request_error
 
 # 백엔드로 쿼리를 전송하는 함수
 def send_query_to_backend(query):
     try:
-        response = requests.post(f"{BACKEND_API_URL}/query", json={"query": query})
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.ConnectionError:
-        console.print("[bold red]오류:[/bold red] 백엔드 서버에 연결할 수 없습니다. 서버가 실행 중인지 확인하세요.")
-        return None
-    except requests.exceptions.HTTPError as e:
-        console.print(f"[bold red]오류:[/bold red] 백엔드에서 오류 응답: {e.response.status_code} - {e.response.text}")
-        return None
+        return get_client().post("/query", json={"query": query}).json()
     except Exception as e:
-        console.print(f"[bold red]예상치 못한 오류 발생:[/bold red] {e}")
+        report_request_error(e)
         return None
 
-# 특정 노드의 세부 정보를 백엔드에 요청하고 웹 UI를 여는 함수
-def get_node_details(node_id):
+# 백엔드에 요청을 보내고 응답 본문(JSON)을 반환하는 공통 함수
+# (실패 시 오류 출력 후 None, raise_errors=True 면 출력하지 않고 예외 발생)
+def _request_json(method, endpoint, stats_key=None, raise_errors=False, **kwargs):
     try:
-        # TODO: 백엔드로부터 노드 세부 정보를 직접 받아와 CLI에 출력하는 기능 추가 고려
-        requests.get(f"{BACKEND_API_URL}/graph/node/{node_id}").raise_for_status()
-        console.print("요청 성공. 웹 UI를 엽니다.")
-        webbrowser.open(f"{WEB_UI_URL}/node/{node_id}")
-    except requests.exceptions.ConnectionError:
-        console.print("[bold red]오류:[/bold red] 백엔드 서버에 연결할 수 없습니다. 서버가 실행 중인지 확인하세요.")
-    except requests.exceptions.HTTPError as e:
-        console.print(f"[bold red]오류:[/bold red] 백엔드에서 오류 응답: {e.response.status_code} - {e.response.text}")
+        response = get_client().request(method, endpoint, stats_key=stats_key, **kwargs)
+        return response.json() if response.content else {}
     except Exception as e:
-        console.print(f"[bold red]예상치 못한 오류 발생:[/bold red] {e}")
+        if raise_errors:
+            raise
+        report_request_error(e)
+        return None
 
-# 특정 노드의 관계 정보를 백엔드에 요청하고 웹 UI를 여는 함수
-def get_relationships_details(node_id):
-    try:
-        # TODO: 백엔드로부터 관계 세부 정보를 직접 받아와 CLI에 출력하는 기능 추가 고려
-        requests.get(f"{BACKEND_API_URL}/graph/relationships/{node_id}").raise_for_status()
-        console.print("요청 성공. 웹 UI를 엽니다.")
-        webbrowser.open(f"{WEB_UI_URL}/relationships/{node_id}")
-    except requests.exceptions.ConnectionError:
-        console.print("[bold red]오류:[/bold red] 백엔드 서버에 연결할 수 없습니다. 서버가 실행 중인지 확인하세요.")
-    except requests.exceptions.HTTPError as e:
-        console.print(f"[bold red]오류:[/bold red] 백엔드에서 오류 응답: {e.response.status_code} - {e.response.text}")
-    except Exception as e:
-        console.print(f"[bold red]예상치 못한 오류 발생:[/bold red] {e}")
+# 그래프 조회(GET) 결과를 응답 캐시를 거쳐 가져오는 함수
+def _cached_request_json(endpoint, params=None, stats_key=None, invalidate_on_any_upload=False, raise_errors=False):
+    from mira_cli.cache import get_cache
 
-# 코드 그래프 검색을 백엔드에 요청하고 웹 UI를 여는 함수
-def search_code_graph(query_text):
+    cache = get_cache()
+    found, value = cache.get(endpoint, params)
+    if found:
+        return value
+    value = _request_json("GET", endpoint, stats_key=stats_key, raise_errors=raise_errors, params=params)
+    if value is not None:
+        cache.put(endpoint, params, value, invalidate_on_any_upload=invalidate_on_any_upload)
+    return value
+
+# 스트리밍 응답 본문을 도착하는 대로 텍스트 조각으로 변환
+def _iter_response_text(response):
+    """
+    text/event-stream 응답은 "data:" 줄의 내용을, application/x-ndjson 응답은 각 줄의
+    "content"(또는 "chunk") 필드를, 그 외(text/markdown, text/plain 등)는 본문을 그대로 반환합니다.
+    """
+    content_type = response.headers.get('Content-Type', '')
+    decoder = codecs.getincrementaldecoder(response.encoding or 'utf-8')(errors='replace')
+    with response:
+        if 'text/event-stream' not in content_type and 'ndjson' not in content_type:
+            for chunk in response.iter_content(chunk_size=None):
+                text = decoder.decode(chunk)
+                if text:
+                    yield text
+            return
+
+        for line in response.iter_lines(chunk_size=None):
+            line = decoder.decode(line)
+            if 'ndjson' in content_type:
+                if line.strip():
+                    record = json.loads(line)
+                    yield record.get("content", record.get("chunk", "")) if isinstance(record, dict) else str(record)
+            elif line.startswith('data:'):
+                data = line[5:].lstrip(' ')
+                if data != '[DONE]':
+                    yield data + '\n'
+
+# 긴 생성 결과를 스트리밍으로 요청하는 공통 함수
+def _request_stream(method, endpoint, **kwargs):
+    """
+    응답 헤더를 받은 뒤 (종류, 값)을 반환합니다.
+    JSON 응답이면 ("json", 본문), 스트리밍 텍스트면 ("stream", 텍스트 조각 이터레이터), 실패 시 None.
+    """
     try:
-        # TODO: 백엔드로부터 검색 결과를 직접 받아와 CLI에 출력하는 기능 추가 고려
-        requests.get(f"{BACKEND_API_URL}/graph/search", params={"query": query_text}).raise_for_status()
-        console.print("요청 성공. 웹 UI를 엽니다.")
-        webbrowser.open(f"{WEB_UI_URL}/search?query={query_text}")
-    except requests.exceptions.ConnectionError:
-        console.print("[bold red]오류:[/bold red] 백엔드 서버에 연결할 수 없습니다. 서버가 실행 중인지 확인하세요.")
-    except requests.exceptions.HTTPError as e:
-        console.print(f"[bold red]오류:[/bold red] 백엔드에서 오류 응답: {e.response.status_code} - {e.response.text}")
+        response = get_client().request(method, endpoint, stream=True, **kwargs)
+        if 'application/json' in response.headers.get('Content-Type', ''):
+            with response:
+                return "json", response.json()
+        return "stream", _iter_response_text(response)
     except Exception as e:
-        console.print(f"[bold red]예상치 못한 오류 발생:[/bold red] {e}")
+        report_request_error(e)
+        return None
+
+# 특정 노드의 세부 정보를 백엔드에서 가져오는 함수
+def get_node_details(node_id, raise_errors=False):
+    return _cached_request_json(f"/graph/node/{node_id}", stats_key="/graph/node/{id}", raise_errors=raise_errors)
+
+# 특정 노드의 관계 정보를 백엔드에서 가져오는 함수
+def get_relationships_details(node_id, raise_errors=False):
+    return _cached_request_json(f"/graph/relationships/{node_id}", stats_key="/graph/relationships/{id}",
+                                raise_errors=raise_errors)
 
-# 코드 변경 영향 분석을 백엔드에 요청하고 웹 UI를 여는 함수
+# 코드 그래프 검색 결과를 백엔드에서 가져오는 함수
+def search_code_graph(query_text, raise_errors=False):
+    # 새로 업로드된 파일이 검색 결과에 추가될 수 있으므로 어떤 업로드에도 무효화
+    return _cached_request_json("/graph/search", params={"query": query_text}, invalidate_on_any_upload=True,
+                                raise_errors=raise_errors)
+
+# 여러 항목을 일괄 조회할 수 있는 그래프 조회 함수
+BATCH_LOOKUPS = {
+    'node': get_node_details,
+    'relationships': get_relationships_details,
+    'search': search_code_graph,
+}
+
+# 여러 노드 ID/검색어를 동시에 조회하여 완료되는 순서대로 (항목, 결과, 오류 메시지)를 반환하는 제너레이터
+def lookup_many(kind, items, concurrency=None):
+    """
+    items 는 리스트나 표준 입력처럼 지연 평가되는 반복자일 수 있으며, 동시에 진행 중인 요청은
+    concurrency(기본: config.ini 의 batch_concurrency)개를 넘지 않습니다.
+    항목 하나가 실패해도 나머지 조회는 계속하며, 실패한 항목은 결과 None 과 오류 메시지로 반환합니다.
+    """
+    from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+    lookup = BATCH_LOOKUPS[kind]
+    concurrency = max(1, concurrency or HTTP_BATCH_CONCURRENCY)
+    items = iter(items)
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        pending = {}
+        while True:
+            # 진행 중인 요청이 concurrency 개가 될 때까지 다음 항목 제출
+            for item in items:
+                pending[executor.submit(lookup, item, raise_errors=True)] = item
+                if len(pending) >= concurrency:
+                    break
+            if not pending:
+                return
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                item = pending.pop(future)
+                try:
+                    yield item, future.result(), None
+                except Exception as e:
+                    yield item, None, describe_request_error(e) or f"예상치 못한 오류 발생: {e}"
+
+# 코드 변경 영향 분석 결과를 백엔드에서 가져오는 함수
 def analyze_impact_backend(file_path):
-    try:
-        # TODO: 백엔드로부터 영향 분석 결과를 직접 받아와 CLI에 출력하는 기능 추가 고려
-        requests.get(f"{BACKEND_API_URL}/analysis/impact", params={"filePath": file_path}).raise_for_status()
-        console.print("요청 성공. 웹 UI를 엽니다.")
-        webbrowser.open(f"{WEB_UI_URL}/analyze-impact?filePath={file_path}")
-    except requests.exceptions.ConnectionError:
-        console.print("[bold red]오류:[/bold red] 백엔드 서버에 연결할 수 없습니다. 서버가 실행 중인지 확인하세요.")
-    except requests.exceptions.HTTPError as e:
-        console.print(f"[bold red]오류:[/bold red] 백엔드에서 오류 응답: {e.response.status_code} - {e.response.text}")
-    except Exception as e:
-        console.print(f"[bold red]예상치 못한 오류 발생:[/bold red] {e}")
+    return _request_json("GET", "/analysis/impact", params={"filePath": file_path})
 
-# 기술 부채 식별을 백엔드에 요청하고 웹 UI를 여는 함수
+# 기술 부채 식별 결과를 백엔드에서 가져오는 함수
 def find_tech_debt_backend(file_path):
-    try:
-        # TODO: 백엔드로부터 기술 부채 식별 결과를 직접 받아와 CLI에 출력하는 기능 추가 고려
-        requests.get(f"{BACKEND_API_URL}/analysis/tech-debt", params={"filePath": file_path}).raise_for_status()
-        console.print("요청 성공. 웹 UI를 엽니다.")
-        webbrowser.open(f"{WEB_UI_URL}/tech-debt?filePath={file_path}")
-    except requests.exceptions.ConnectionError:
-        console.print("[bold red]오류:[/bold red] 백엔드 서버에 연결할 수 없습니다. 서버가 실행 중인지 확인하세요.")
-    except requests.exceptions.HTTPError as e:
-        console.print(f"[bold red]오류:[/bold red] 백엔드에서 오류 응답: {e.response.status_code} - {e.response.text}")
-    except Exception as e:
-        console.print(f"[bold red]예상치 못한 오류 발생:[/bold red] {e}")
+    return _request_json("GET", "/analysis/tech-debt", params={"filePath": file_path})
 
-# 문서 생성을 백엔드에 요청하고 웹 UI를 여는 함수
+# 문서 생성 결과를 백엔드에서 스트리밍으로 가져오는 함수
 def generate_docs_backend(file_path):
-    try:
-        # TODO: 백엔드로부터 문서 생성 결과를 직접 받아와 CLI에 출력하는 기능 추가 고려
-        requests.post(f"{BACKEND_API_URL}/generation/docs", json={"filePath": file_path}).raise_for_status()
-        console.print("요청 성공. 웹 UI를 엽니다.")
-        webbrowser.open(f"{WEB_UI_URL}/docs?filePath={file_path}")
-    except requests.exceptions.ConnectionError:
-        console.print("[bold red]오류:[/bold red] 백엔드 서버에 연결할 수 없습니다. 서버가 실행 중인지 확인하세요.")
-    except requests.exceptions.HTTPError as e:
-        console.print(f"[bold red]오류:[/bold red] 백엔드에서 오류 응답: {e.response.status_code} - {e.response.text}")
-    except Exception as e:
-        console.print(f"[bold red]예상치 못한 오류 발생:[/bold red] {e}")
+    return _request_stream("POST", "/generation/docs", json={"filePath": file_path})
 
-# 리팩토링 제안을 백엔드에 요청하고 웹 UI를 여는 함수
+# 리팩토링 제안 결과를 백엔드에서 스트리밍으로 가져오는 함수
 def refactor_suggestions_backend(file_path):
-    try:
-        # TODO: 백엔드로부터 리팩토링 제안 결과를 직접 받아와 CLI에 출력하는 기능 추가 고려
-        requests.post(f"{BACKEND_API_URL}/generation/refactor-suggestions", json={"filePath": file_path}).raise_for_status()
-        console.print("요청 성공. 웹 UI를 엽니다.")
-        webbrowser.open(f"{WEB_UI_URL}/refactor-suggestions?filePath={file_path}")
-    except requests.exceptions.ConnectionError:
-        console.print("[bold red]오류:[/bold red] 백엔드 서버에 연결할 수 없습니다. 서버가 실행 중인지 확인하세요.")
-    except requests.exceptions.HTTPError as e:
-        console.print(f"[bold red]오류:[/bold red] 백엔드에서 오류 응답: {e.response.status_code} - {e.response.text}")
-    except Exception as e:
-        console.print(f"[bold red]예상치 못한 오류 발생:[/bold red] {e}")
+    return _request_stream("POST", "/generation/refactor-suggestions", json={"filePath": file_path})
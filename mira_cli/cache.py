@@ -0,0 +1,269 @@
+# 그래프 조회 응답을 캐시하는 모듈
+#
+# 노드/관계 조회와 검색 응답을 (엔드포인트, 파라미터) 키로 메모리(LRU)와 디스크(sqlite)에 저장합니다.
+# 항목은 TTL 이 지나면 만료되고, 디스크 항목 수가 상한을 넘으면 가장 오래 사용하지 않은 항목부터 제거합니다.
+# 파싱 결과가 업로드되면 해당 파일과 관련된 항목(및 검색 결과)을 무효화합니다.
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+from mira_cli.config_loader import (
+    BACKEND_API_URL,
+    CACHE_ENABLED,
+    CACHE_DIR,
+    CACHE_TTL_SECONDS,
+    CACHE_MAX_ENTRIES,
+    CACHE_MEMORY_ENTRIES,
+)
+
+CACHE_DB_NAME = 'responses.sqlite3'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    endpoint TEXT NOT NULL,
+    value TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    last_access REAL NOT NULL,
+    any_upload INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access);
+CREATE TABLE IF NOT EXISTS entry_files (
+    key TEXT NOT NULL,
+    file_path TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entry_files_path ON entry_files (file_path);
+CREATE INDEX IF NOT EXISTS entry_files_key ON entry_files (key);
+CREATE TABLE IF NOT EXISTS stats (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+
+# 캐시 키에 쓰기 위해 파일 경로를 정규화
+def _normalize_path(file_path):
+    return os.path.normpath(os.path.abspath(str(file_path)))
+
+
+# 응답 본문에 포함된 filePath 값을 모두 수집 (무효화 대상 파일 연결용)
+def _collect_file_paths(value, found):
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if key == 'filePath' and isinstance(item, str):
+                found.add(_normalize_path(item))
+            else:
+                _collect_file_paths(item, found)
+    elif isinstance(value, list):
+        for item in value:
+            _collect_file_paths(item, found)
+    return found
+
+
+class ResponseCache:
+    """TTL 과 LRU 상한을 가진 메모리 + 디스크 응답 캐시."""
+
+    def __init__(self, cache_dir=CACHE_DIR, ttl_seconds=CACHE_TTL_SECONDS, max_entries=CACHE_MAX_ENTRIES,
+                 memory_entries=CACHE_MEMORY_ENTRIES, enabled=CACHE_ENABLED):
+        self.db_path = Path(cache_dir).expanduser() / CACHE_DB_NAME
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.memory_entries = memory_entries
+        self.enabled = enabled
+        self._memory = OrderedDict() # 키 -> (저장 시각, 값)
+        self._pending_access = {} # 메모리 적중으로 아직 디스크에 반영하지 않은 키 -> 마지막 사용 시각
+        self._pending_hits = 0
+        self._data_version = None # 다른 프로세스의 변경을 감지하기 위한 PRAGMA data_version 값
+        self._lock = threading.Lock()
+        self._db = None
+
+    # 디스크 캐시 연결 (create=False 이고 파일이 없으면 None)
+    def _connect(self, create=True):
+        if self._db is None:
+            import sqlite3
+            if not create and not self.db_path.exists():
+                return None
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(self.db_path, timeout=5, check_same_thread=False)
+            # 캐시는 언제든 다시 받을 수 있는 데이터이므로 fsync 를 생략해 조회 지연을 줄임
+            self._db.execute("PRAGMA synchronous = OFF")
+            self._db.executescript(_SCHEMA)
+        return self._db
+
+    @staticmethod
+    def make_key(endpoint, params):
+        raw = json.dumps([BACKEND_API_URL, endpoint, params or {}], sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    # 캐시된 응답 조회. 반환값: (찾았는지 여부, 값)
+    def get(self, endpoint, params=None):
+        if not self.enabled:
+            return False, None
+        key = self.make_key(endpoint, params)
+        now = time.time()
+        with self._lock:
+            db = self._connect()
+            self._check_other_writers(db)
+            cached = self._memory.get(key)
+            if cached and now - cached[0] < self.ttl_seconds:
+                # 메모리 적중은 디스크 LRU 순서와 통계 갱신을 모아 두었다가 다음 쓰기(put, 무효화, 종료) 때 반영
+                self._memory.move_to_end(key)
+                self._pending_access[key] = now
+                self._pending_hits += 1
+                return True, cached[1]
+
+            self._flush_access(db)
+            row = db.execute("SELECT value, stored_at FROM entries WHERE key = ?", (key,)).fetchone()
+            if row and now - row[1] < self.ttl_seconds:
+                db.execute("UPDATE entries SET last_access = ? WHERE key = ?", (now, key))
+                self._bump_stat('hits')
+                db.commit()
+                value = json.loads(row[0])
+                self._remember(key, row[1], value)
+                return True, value
+
+            if row:
+                self._delete_keys(db, [key]) # 만료된 항목 정리
+            self._memory.pop(key, None)
+            self._bump_stat('misses')
+            db.commit()
+            return False, None
+
+    # 응답을 캐시에 저장
+    def put(self, endpoint, params, value, invalidate_on_any_upload=False):
+        """
+        invalidate_on_any_upload 가 True 이면(예: 검색 결과) 어떤 파일이 업로드되어도 무효화됩니다.
+        응답에 filePath 가 하나도 없으면 어떤 파일과 관련된지 알 수 없으므로 마찬가지로 처리합니다.
+        """
+        if not self.enabled:
+            return
+        key = self.make_key(endpoint, params)
+        now = time.time()
+        file_paths = _collect_file_paths(value, set())
+        any_upload = invalidate_on_any_upload or not file_paths
+        with self._lock:
+            db = self._connect()
+            self._flush_access(db)
+            self._delete_keys(db, [key])
+            db.execute("INSERT INTO entries (key, endpoint, value, stored_at, last_access, any_upload) VALUES (?, ?, ?, ?, ?, ?)",
+                       (key, endpoint, json.dumps(value, ensure_ascii=False), now, now, 1 if any_upload else 0))
+            db.executemany("INSERT INTO entry_files (key, file_path) VALUES (?, ?)",
+                           [(key, file_path) for file_path in sorted(file_paths)])
+            self._evict(db)
+            db.commit()
+            self._remember(key, now, value)
+
+    # 업로드/삭제된 파일과 관련된 항목을 무효화하고 제거한 항목 수를 반환
+    def invalidate_files(self, file_paths):
+        file_paths = [_normalize_path(file_path) for file_path in file_paths]
+        if not file_paths:
+            return 0
+        with self._lock:
+            self._memory.clear()
+            db = self._connect(create=False)
+            if db is None:
+                return 0
+            self._flush_access(db)
+            keys = {row[0] for row in db.execute("SELECT key FROM entries WHERE any_upload = 1")}
+            for start in range(0, len(file_paths), 500):
+                chunk = file_paths[start:start + 500]
+                placeholders = ','.join('?' * len(chunk))
+                keys.update(row[0] for row in db.execute(
+                    f"SELECT DISTINCT key FROM entry_files WHERE file_path IN ({placeholders})", chunk))
+            self._delete_keys(db, list(keys))
+            db.commit()
+            return len(keys)
+
+    # 모든 캐시 항목과 통계를 삭제
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            self._pending_access.clear()
+            self._pending_hits = 0
+            db = self._connect(create=False)
+            if db is not None:
+                db.executescript("DELETE FROM entries; DELETE FROM entry_files; DELETE FROM stats;")
+
+    # 적중/실패 통계와 항목 수를 반환
+    def stats(self):
+        with self._lock:
+            db = self._connect(create=False)
+            if db is None:
+                return {"hits": 0, "misses": 0, "entries": 0}
+            self._flush_access(db)
+            db.commit()
+            result = {"hits": 0, "misses": 0}
+            result.update(dict(db.execute("SELECT name, value FROM stats").fetchall()))
+            result["entries"] = db.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            return result
+
+    # 모아 둔 메모리 적중을 반영하고 디스크 연결을 닫음
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._flush_access(self._db)
+                self._db.commit()
+                self._db.close()
+                self._db = None
+                self._data_version = None
+
+    # 모아 둔 메모리 적중의 last_access 와 적중 수를 디스크에 반영 (커밋은 호출 측에서)
+    def _flush_access(self, db):
+        if self._pending_access:
+            db.executemany("UPDATE entries SET last_access = ? WHERE key = ?",
+                           [(accessed, key) for key, accessed in self._pending_access.items()])
+            self._pending_access.clear()
+        if self._pending_hits:
+            db.execute("INSERT INTO stats (name, value) VALUES ('hits', ?) "
+                       "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value", (self._pending_hits,))
+            self._pending_hits = 0
+
+    # 다른 프로세스가 디스크 캐시를 변경했다면(무효화 등) 메모리 캐시를 비움
+    def _check_other_writers(self, db):
+        data_version = db.execute("PRAGMA data_version").fetchone()[0]
+        if self._data_version is not None and data_version != self._data_version:
+            self._memory.clear()
+        self._data_version = data_version
+
+    def _remember(self, key, stored_at, value):
+        self._memory[key] = (stored_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _bump_stat(self, name):
+        self._connect().execute(
+            "INSERT INTO stats (name, value) VALUES (?, 1) ON CONFLICT(name) DO UPDATE SET value = value + 1", (name,))
+
+    # 디스크 항목 수가 상한을 넘으면 가장 오래 사용하지 않은 항목부터 제거
+    def _evict(self, db):
+        overflow = db.execute("SELECT COUNT(*) FROM entries").fetchone()[0] - self.max_entries
+        if overflow > 0:
+            keys = [row[0] for row in db.execute(
+                "SELECT key FROM entries ORDER BY last_access LIMIT ?", (overflow,))]
+            self._delete_keys(db, keys)
+
+    def _delete_keys(self, db, keys):
+        for key in keys:
+            self._memory.pop(key, None)
+        db.executemany("DELETE FROM entries WHERE key = ?", [(key,) for key in keys])
+        db.executemany("DELETE FROM entry_files WHERE key = ?", [(key,) for key in keys])
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+# 프로세스 전체에서 공유하는 응답 캐시를 반환
+def get_cache():
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            import atexit
+            _cache = ResponseCache()
+            atexit.register(_cache.close) # 모아 둔 메모리 적중을 종료 시 반영
+        return _cache
@@ -1,30 +1,230 @@
 import click
-import webbrowser
-from mira_cli.shell import MIRAShell
+import os
 from mira_cli.config_loader import WEB_UI_URL
-from mira_cli.backend_api import (
-    get_node_details,
-    get_relationships_details,
-    search_code_graph,
-    analyze_impact_backend,
-    find_tech_debt_backend,
-    generate_docs_backend,
-    refactor_suggestions_backend
-)
 from mira_cli.utils import console
 
+# 명령어별로 필요한 모듈만 불러오도록 셸, 파서(tree-sitter), 백엔드 API(requests) 모듈은
+# 각 명령어 함수 안에서 임포트합니다. (version 등 단발성 명령어의 시작 시간 단축)
+# 파싱/조회 명령어는 _run 으로 실행하여 백그라운드 데몬(mira daemon start)이 실행 중이면 데몬에 위임합니다.
+
 # MIRA CLI의 메인 그룹 정의
 @click.group()
-def MIRA():
+@click.option('--no-cache', is_flag=True, help='그래프 조회 응답 캐시를 사용하지 않습니다.')
+@click.option('--no-daemon', is_flag=True, help='백그라운드 데몬이 실행 중이어도 현재 프로세스에서 실행합니다.')
+@click.pass_context
+def MIRA(ctx, no_cache, no_daemon):
     """MIRA AI CLI"""
-    pass
+    ctx.obj = {"no_cache": no_cache, "use_daemon": not no_daemon}
+    if no_cache:
+        from mira_cli.cache import get_cache
+        get_cache().enabled = False
+
+# 명령어를 데몬이 실행 중이면 데몬에서, 아니면 현재 프로세스에서 실행하고 결과를 반환
+def _run(command, **args):
+    from mira_cli.daemon import run_command
+    options = click.get_current_context().find_root().obj or {}
+    return run_command(command, args, use_daemon=options.get("use_daemon", True),
+                       no_cache=options.get("no_cache", False))
 
 # 대화형 셸 시작 명령어
 @MIRA.command()
 def shell():
     """MIRA AI 대화형 셸을 시작합니다."""
+    from mira_cli.shell import MIRAShell
     MIRAShell().cmdloop()
 
+# 코드베이스 파싱 및 백엔드 전송 명령어
+@MIRA.command()
+@click.argument('path', required=False, type=click.Path(exists=True, file_okay=False))
+@click.option('--full', is_flag=True, help='매니페스트를 무시하고 모든 파일을 다시 파싱하여 전송합니다.')
+@click.option('--jobs', '-j', type=click.IntRange(min=1), default=None,
+              help='파싱 워커 프로세스 수 (기본: CPU 코어 수)')
+@click.option('--ast-format', type=click.Choice(['nested', 'compact-v1']), default=None,
+              help='AST 전송 형식 (기본: config.ini 설정)')
+@click.option('--profile', is_flag=True, help='단계별 소요 시간(wall/CPU)과 처리 바이트를 측정하여 요약을 출력합니다.')
+@click.option('--profile-top', type=click.IntRange(min=1), default=10, show_default=True,
+              help='요약에 표시할 가장 느린 파일 수')
+@click.option('--profile-trace', type=click.Path(dir_okay=False, writable=True), default=None,
+              help='측정 결과를 Chrome trace(JSON) 파일로 저장합니다. (--profile 포함)')
+@click.option('--prune-report', is_flag=True,
+              help='config.ini 의 [pruning] 프로필로 줄어든 전송 크기를 언어별로 측정하여 출력합니다.')
+@click.option('--resume', is_flag=True,
+              help='중단된 실행을 저널(.mira/journal.jsonl)에서 이어서 진행하고 실패한 파일을 다시 전송합니다.')
+@click.option('--spool', 'spool_path', type=click.Path(dir_okay=False), default=None,
+              help='백엔드 대신 지정한 스풀 파일에 파싱 결과를 추가합니다. (mira replay 로 나중에 전송)')
+@click.option('--shard', type=str, default=None, callback=lambda ctx, param, value: _shard_spec(value),
+              help='전체 파일을 N 개로 나눈 것 중 i 번째 샤드만 처리합니다. (예: 2/8, merge-manifests 로 합침)')
+def parse(path, full, jobs, ast_format, profile, profile_top, profile_trace, prune_report, resume, spool_path, shard):
+    """코드베이스를 파싱하여 백엔드로 전송합니다. (기본: 변경된 파일만)"""
+    path = os.path.abspath(path or os.getcwd())
+    if spool_path is not None:
+        spool_path = os.path.abspath(spool_path)
+    if not profile and profile_trace is None:
+        if not _run('parse', path=path, full=full, jobs=jobs, ast_format=ast_format, prune_report=prune_report,
+                    resume=resume, spool_path=spool_path, shard=shard):
+            raise SystemExit(1)
+        return
+
+    # 측정은 현재 프로세스의 단계별 시간을 기록하므로 데몬에 위임하지 않음
+    from mira_cli.parser import parse_codebase_and_send_to_backend
+    from mira_cli.profiler import PhaseProfiler
+    profiler = PhaseProfiler(enabled=True)
+    success = parse_codebase_and_send_to_backend(path, full=full, jobs=jobs, ast_format=ast_format, profiler=profiler,
+                                                 prune_report=prune_report, resume=resume, spool_path=spool_path,
+                                                 shard=shard)
+    if profiler.enabled:
+        profiler.print_summary(profile_top)
+        if profile_trace:
+            profiler.write_chrome_trace(profile_trace, profile_top)
+            console.print(f"Chrome trace 를 저장했습니다: {profile_trace}")
+    if not success:
+        raise SystemExit(1)
+
+# 파일 변경 감시 및 자동 전송 명령어
+@MIRA.command()
+@click.argument('path', required=False, type=click.Path(exists=True, file_okay=False))
+@click.option('--jobs', '-j', type=click.IntRange(min=1), default=None,
+              help='파싱 워커 프로세스 수 (기본: CPU 코어 수)')
+@click.option('--ast-format', type=click.Choice(['nested', 'compact-v1']), default=None,
+              help='AST 전송 형식 (기본: config.ini 설정)')
+@click.option('--polling', is_flag=True, help='inotify 대신 주기적 검사(polling)로 변경을 감지합니다.')
+@click.option('--debounce', type=click.FloatRange(min=0), default=None,
+              help='마지막 변경 후 전송까지 기다리는 시간(초) (기본: config.ini 설정)')
+@click.option('--incremental/--no-incremental', default=None,
+              help='이전 구문 트리로 증분 파싱하여 바뀐 하위 트리만 전송합니다. (기본: config.ini 설정)')
+def watch(path, jobs, ast_format, polling, debounce, incremental):
+    """코드베이스 변경을 감시하여 저장된 파일을 백엔드에 바로 반영합니다."""
+    from mira_cli.watcher import watch_codebase
+    watch_codebase(os.path.abspath(path or os.getcwd()), jobs=jobs, ast_format=ast_format, polling=polling, debounce=debounce,
+                   incremental=incremental)
+
+# --shard 옵션 값을 (i, N) 으로 변환
+def _shard_spec(value):
+    if value is None:
+        return None
+    from mira_cli.sharding import parse_shard_spec
+    try:
+        return parse_shard_spec(value)
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="'--shard'")
+
+# 샤드 매니페스트 병합 명령어
+@MIRA.command('merge-manifests')
+@click.argument('manifests', nargs=-1, required=True, type=click.Path(exists=True, dir_okay=False))
+@click.option('--path', 'codebase_path', type=click.Path(exists=True, file_okay=False), default=None,
+              help='합친 매니페스트를 저장할 코드베이스 경로 (기본: 현재 디렉토리)')
+@click.option('--no-notify', is_flag=True, help='백엔드에 인덱싱 완료를 알리지 않습니다.')
+def merge_manifests(manifests, codebase_path, no_notify):
+    """parse --shard 로 만든 샤드 매니페스트들이 모든 파일을 정확히 한 번씩 처리했는지 확인하고 합칩니다."""
+    import requests
+    from mira_cli.http_client import report_request_error
+    from mira_cli.sharding import ShardMergeError, merge_shard_manifests, notify_index_complete, save_merged_manifest
+    codebase_path = os.path.abspath(codebase_path or os.getcwd())
+    try:
+        merged = merge_shard_manifests(manifests)
+    except ShardMergeError as e:
+        for problem in e.problems:
+            console.print(f"[bold red]오류:[/bold red] {problem}")
+        raise SystemExit(1)
+    manifest_path = save_merged_manifest(codebase_path, merged)
+    console.print(f"샤드 {merged['shardCount']}개의 매니페스트를 합쳤습니다. (파일 {merged['totalFiles']}개): {manifest_path}")
+    if no_notify:
+        return
+    try:
+        notify_index_complete(codebase_path, merged)
+    except requests.exceptions.RequestException as e:
+        report_request_error(e)
+        raise SystemExit(1)
+    console.print("백엔드에 인덱싱 완료를 알렸습니다.")
+
+# 스풀 파일 전송 명령어
+@MIRA.command()
+@click.argument('spool_path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--upload-mode', type=click.Choice(['bulk', 'single']), default=None,
+              help='업로드 방식 (기본: config.ini 설정)')
+@click.option('--keep', is_flag=True, help='전송한 뒤에도 스풀 파일을 삭제하거나 다시 쓰지 않고 그대로 둡니다.')
+def replay(spool_path, upload_mode, keep):
+    """parse --spool 로 기록한 파싱 결과를 백엔드로 전송합니다."""
+    from mira_cli.spool import SpoolFormatError, replay_spool
+    try:
+        success = replay_spool(spool_path, upload_mode=upload_mode, keep=keep)
+    except SpoolFormatError as e:
+        console.print(f"[bold red]오류:[/bold red] {e}")
+        raise SystemExit(1)
+    if not success:
+        raise SystemExit(1)
+
+# 응답 캐시 관리 명령어 그룹
+@MIRA.group()
+def cache():
+    """그래프 조회 응답 캐시를 관리합니다."""
+    pass
+
+# 캐시 적중/실패 통계 표시 명령어
+@cache.command(name='stats')
+def cache_stats():
+    """응답 캐시 적중/실패 통계를 표시합니다."""
+    stats = _run('cache_stats')
+    if stats is None:
+        raise SystemExit(1)
+    lookups = stats["hits"] + stats["misses"]
+    hit_rate = f"{stats['hits'] / lookups * 100:.1f}%" if lookups else "-"
+    console.print(f"항목 수: {stats['entries']}  적중: {stats['hits']}  실패: {stats['misses']}  적중률: {hit_rate}")
+
+# 캐시 비우기 명령어
+@cache.command(name='clear')
+def cache_clear():
+    """응답 캐시를 모두 삭제합니다."""
+    if not _run('cache_clear'):
+        raise SystemExit(1)
+    console.print("응답 캐시를 삭제했습니다.")
+
+# 백그라운드 데몬 관리 명령어 그룹
+@MIRA.group()
+def daemon():
+    """파서와 HTTP 연결을 미리 준비해 두는 백그라운드 데몬을 관리합니다."""
+    pass
+
+# 데몬 시작 명령어
+@daemon.command(name='start')
+@click.option('--foreground', is_flag=True, help='백그라운드로 분리하지 않고 현재 터미널에서 실행합니다.')
+def daemon_start(foreground):
+    """백그라운드 데몬을 시작합니다."""
+    from mira_cli.daemon import MiraDaemon, DaemonError, get_socket_path, start_daemon
+    try:
+        if foreground:
+            console.print(f"데몬을 실행합니다: {get_socket_path()} (종료: Ctrl+C)")
+            try:
+                MiraDaemon().serve_forever()
+            except KeyboardInterrupt:
+                pass
+        elif start_daemon():
+            console.print(f"데몬을 시작했습니다: {get_socket_path()}")
+        else:
+            console.print("데몬이 이미 실행 중입니다.")
+    except DaemonError as e:
+        console.print(f"[bold red]데몬 오류:[/bold red] {e}")
+        raise SystemExit(1)
+
+# 데몬 종료 명령어
+@daemon.command(name='stop')
+def daemon_stop():
+    """실행 중인 백그라운드 데몬을 종료합니다."""
+    from mira_cli.daemon import stop_daemon
+    console.print("데몬을 종료했습니다." if stop_daemon() else "실행 중인 데몬이 없습니다.")
+
+# 데몬 상태 표시 명령어
+@daemon.command(name='status')
+def daemon_status():
+    """백그라운드 데몬의 실행 여부와 처리한 요청 수를 표시합니다."""
+    from mira_cli.daemon import daemon_status as get_status
+    status = get_status()
+    if status is None:
+        console.print("실행 중인 데몬이 없습니다.")
+        raise SystemExit(1)
+    console.print(f"PID: {status['pid']}  소켓: {status['socketPath']}  실행 시간: {status['uptime']}초  "
+                  f"처리한 요청: {status['requests']}")
+
 # CLI 버전 표시 명령어
 @MIRA.command()
 def version():
@@ -35,82 +235,200 @@ def version():
 @MIRA.command()
 def visualize():
     """웹 UI를 브라우저에서 엽니다."""
+    import webbrowser
     console.print(f"웹 UI를 엽니다: {WEB_UI_URL}")
     webbrowser.open(WEB_UI_URL)
 
+# 조회/분석 명령어 공통 출력 옵션
+def _output_options(command):
+    command = click.option('--web', is_flag=True, help='터미널 출력 대신 웹 UI에서 결과를 엽니다.')(command)
+    command = click.option('--json', 'as_json', is_flag=True, help='결과를 JSON 으로 출력합니다. (스크립트용)')(command)
+    return command
+
+# 백엔드 응답을 출력 모드에 맞게 표시 (요청 실패 시 종료 코드 1)
+def _show_result(result, title, as_json, web, web_ui_path):
+    if result is None:
+        raise SystemExit(1)
+    if web:
+        import webbrowser
+        console.print("요청 성공. 웹 UI를 엽니다.")
+        webbrowser.open(f"{WEB_UI_URL}{web_ui_path}")
+    elif as_json:
+        from mira_cli.render import print_json
+        print_json(result)
+    else:
+        from mira_cli.render import render_payload
+        render_payload(result, title)
+
+# 스트리밍 생성 결과를 도착하는 대로 표시 (--json 이면 전체 수신 후 한 번에 출력)
+def _show_stream(result, title, as_json, web, web_ui_path, file_path):
+    if result is None:
+        raise SystemExit(1)
+    kind, value = result
+    if kind == "json" or web:
+        if kind == "stream":
+            value = "".join(value)
+        _show_result(value, title, as_json, web, web_ui_path)
+        return
+
+    from mira_cli.http_client import report_request_error
+    try:
+        if as_json:
+            from mira_cli.render import print_json
+            print_json({"filePath": file_path, "content": "".join(value)})
+        else:
+            from mira_cli.render import render_stream
+            render_stream(value, title)
+    except Exception as e:
+        # 스트리밍 도중 연결이 끊긴 경우 등
+        report_request_error(e)
+        raise SystemExit(1)
+
+# 일괄 조회 명령어 공통 옵션
+def _batch_options(command):
+    return click.option('--concurrency', '-c', type=click.IntRange(min=1), default=None,
+                        help='여러 항목을 조회할 때 동시에 보낼 최대 요청 수 (기본: config.ini 설정)')(command)
+
+# 조회할 항목 인자가 하나뿐이면 그 항목을 반환 (여러 개이거나 표준 입력을 읽어야 하면 None)
+def _single_item(items):
+    return items[0] if len(items) == 1 and items[0] != '-' else None
+
+# 조회할 항목 목록 (인자가 없거나 '-' 이면 표준 입력에서 한 줄에 하나씩 읽음)
+def _lookup_items(items):
+    if items and items != ('-',):
+        return list(items)
+    stdin = click.get_text_stream('stdin')
+    if not items and stdin.isatty():
+        raise click.UsageError("조회할 항목을 인자나 표준 입력(한 줄에 하나)으로 지정하세요.")
+    return (line.strip() for line in iter(stdin.readline, '') if line.strip())
+
+# 여러 항목을 동시에 조회하여 완료되는 순서대로 NDJSON 한 줄씩 출력 (실패한 항목이 있으면 종료 코드 1)
+def _show_batch(kind, items, web, concurrency):
+    import json
+    from mira_cli.backend_api import lookup_many
+
+    if web:
+        raise click.UsageError("--web 은 항목을 하나만 조회할 때 사용할 수 있습니다.")
+    failed = 0
+    for item, result, error in lookup_many(kind, _lookup_items(items), concurrency):
+        record = {"input": item, "ok": error is None}
+        if error is None:
+            record["result"] = result
+        else:
+            record["error"] = error
+            failed += 1
+        click.echo(json.dumps(record, ensure_ascii=False))
+    if failed:
+        raise SystemExit(1)
+
 # 노드 세부 정보 조회 명령어
 @MIRA.command()
-@click.argument('node_id')
-def get_node(node_id):
+@click.argument('node_ids', nargs=-1)
+@_output_options
+@_batch_options
+def get_node(node_ids, as_json, web, concurrency):
     """
-    ID로 특정 노드의 세부 정보를 가져옵니다. (결과는 웹 UI에서 확인)
-    TODO: CLI에서 노드 세부 정보를 직접 출력하는 기능 추가 고려
+    ID로 노드의 세부 정보를 가져와 출력합니다.
+    ID를 여러 개 지정하거나 표준 입력(한 줄에 하나, '-')으로 넘기면 동시에 조회하여 NDJSON 으로 출력합니다.
     """
-    console.print(f"노드 ID '{node_id}' 세부 정보를 요청합니다. 결과는 웹 UI에서 확인하세요.")
-    get_node_details(node_id)
+    node_id = _single_item(node_ids)
+    if node_id is None:
+        _show_batch('node', node_ids, web, concurrency)
+        return
+    _show_result(_run('node', node_id=node_id), f"노드 {node_id}", as_json, web, f"/node/{node_id}")
 
 # 노드 관계 조회 명령어
 @MIRA.command()
-@click.argument('node_id')
-def get_relationships(node_id):
+@click.argument('node_ids', nargs=-1)
+@_output_options
+@_batch_options
+def get_relationships(node_ids, as_json, web, concurrency):
     """
-    ID로 특정 노드의 관계를 가져옵니다. (결과는 웹 UI에서 확인)
-    TODO: CLI에서 관계 세부 정보를 직접 출력하는 기능 추가 고려
+    ID로 노드의 관계를 가져와 출력합니다.
+    ID를 여러 개 지정하거나 표준 입력(한 줄에 하나, '-')으로 넘기면 동시에 조회하여 NDJSON 으로 출력합니다.
     """
-    console.print(f"노드 ID '{node_id}' 관계를 요청합니다. 결과는 웹 UI에서 확인하세요.")
-    get_relationships_details(node_id)
+    node_id = _single_item(node_ids)
+    if node_id is None:
+        _show_batch('relationships', node_ids, web, concurrency)
+        return
+    _show_result(_run('relationships', node_id=node_id), f"노드 {node_id} 관계", as_json, web, f"/relationships/{node_id}")
+
+# 로컬 심볼 인덱스에서 이름/접두사로 검색하여 출력 (인덱스가 없으면 종료 코드 1)
+def _show_local_search(query_texts, as_json, web):
+    import json
+    from mira_cli.symbols import SymbolIndex
+
+    if web:
+        raise click.UsageError("--web 은 --local 과 함께 사용할 수 없습니다.")
+    symbol_index, root = SymbolIndex.find(os.getcwd())
+    if symbol_index is None:
+        console.print("[yellow]로컬 심볼 인덱스가 없습니다. 먼저 'mira parse' 로 코드베이스를 파싱하세요.[/yellow]")
+        raise SystemExit(1)
+    try:
+        query_text = _single_item(query_texts)
+        if query_text is not None:
+            _show_result(symbol_index.lookup(query_text), f"'{query_text}' 로컬 검색 결과 ({root})", as_json, False, None)
+            return
+        for item in _lookup_items(query_texts):
+            click.echo(json.dumps({"input": item, "ok": True, "result": symbol_index.lookup(item)}, ensure_ascii=False))
+    finally:
+        symbol_index.close()
 
 # 코드 그래프 검색 명령어
 @MIRA.command()
-@click.argument('query_text')
-def search(query_text):
+@click.argument('query_texts', nargs=-1)
+@_output_options
+@_batch_options
+@click.option('--local', is_flag=True,
+              help="백엔드 대신 로컬 심볼 인덱스에서 이름으로 정의/참조를 찾습니다. (끝에 '*' 를 붙이면 접두사 검색)")
+def search(query_texts, as_json, web, concurrency, local):
     """
-    코드 그래프에서 노드와 관계를 검색합니다. (결과는 웹 UI에서 확인)
-    TODO: CLI에서 검색 결과를 직접 출력하는 기능 추가 고려
+    코드 그래프에서 노드와 관계를 검색하여 출력합니다.
+    검색어를 여러 개 지정하거나 표준 입력(한 줄에 하나, '-')으로 넘기면 동시에 검색하여 NDJSON 으로 출력합니다.
     """
-    console.print(f"검색 쿼리: '{query_text}'를 요청합니다. 결과는 웹 UI에서 확인하세요.")
-    search_code_graph(query_text)
+    if local:
+        _show_local_search(query_texts, as_json, web)
+        return
+    query_text = _single_item(query_texts)
+    if query_text is None:
+        _show_batch('search', query_texts, web, concurrency)
+        return
+    _show_result(_run('search', query_text=query_text), f"'{query_text}' 검색 결과", as_json, web, f"/search?query={query_text}")
 
 # 코드 변경 영향 분석 명령어
 @MIRA.command()
 @click.argument('file_path')
-def analyze_impact(file_path):
-    """
-    지정된 파일의 변경 사항이 코드베이스에 미치는 영향을 분석합니다. (결과는 웹 UI에서 확인)
-    TODO: CLI에서 영향 분석 결과를 직접 출력하는 기능 추가 고려
-    """
-    console.print(f"'{file_path}' 영향 분석을 요청합니다. 결과는 웹 UI에서 확인하세요.")
-    analyze_impact_backend(file_path)
+@_output_options
+def analyze_impact(file_path, as_json, web):
+    """지정된 파일의 변경 사항이 코드베이스에 미치는 영향을 분석하여 출력합니다."""
+    _show_result(_run('analyze_impact', file_path=file_path), f"'{file_path}' 영향 분석", as_json, web,
+                 f"/analyze-impact?filePath={file_path}")
 
 # 기술 부채 식별 명령어
 @MIRA.command()
 @click.argument('file_path')
-def find_tech_debt(file_path):
-    """
-    지정된 파일에서 기술 부채를 식별합니다. (결과는 웹 UI에서 확인)
-    TODO: CLI에서 기술 부채 식별 결과를 직접 출력하는 기능 추가 고려
-    """
-    console.print(f"'{file_path}' 기술 부채 식별을 요청합니다. 결과는 웹 UI에서 확인하세요.")
-    find_tech_debt_backend(file_path)
+@_output_options
+def find_tech_debt(file_path, as_json, web):
+    """지정된 파일에서 기술 부채를 식별하여 출력합니다."""
+    _show_result(_run('find_tech_debt', file_path=file_path), f"'{file_path}' 기술 부채", as_json, web,
+                 f"/tech-debt?filePath={file_path}")
 
 # 문서 생성 명령어
 @MIRA.command()
 @click.argument('file_path')
-def generate_docs(file_path):
-    """
-    지정된 파일에 대한 문서를 생성합니다. (결과는 웹 UI에서 확인)
-    TODO: CLI에서 문서 생성 결과를 직접 출력하는 기능 추가 고려
-    """
-    console.print(f"'{file_path}' 문서 생성을 요청합니다. 결과는 웹 UI에서 확인하세요.")
-    generate_docs_backend(file_path)
+@_output_options
+def generate_docs(file_path, as_json, web):
+    """지정된 파일에 대한 문서를 생성하여 도착하는 대로 출력합니다."""
+    from mira_cli.backend_api import generate_docs_backend
+    _show_stream(generate_docs_backend(file_path), f"'{file_path}' 문서", as_json, web,
+                 f"/docs?filePath={file_path}", file_path)
 
 # 리팩토링 제안 명령어
 @MIRA.command()
 @click.argument('file_path')
-def refactor_suggestions(file_path):
-    """
-    지정된 파일에 대한 리팩토링 제안을 제공합니다. (결과는 웹 UI에서 확인)
-    TODO: CLI에서 리팩토링 제안 결과를 직접 출력하는 기능 추가 고려
-    """
-    console.print(f"'{file_path}' 리팩토링 제안을 요청합니다. 결과는 웹 UI에서 확인하세요.")
-    refactor_suggestions_backend(file_path)
\ No newline at end of file
+@_output_options
+def refactor_suggestions(file_path, as_json, web):
+    """지정된 파일에 대한 리팩토링 제안을 생성하여 도착하는 대로 출력합니다."""
+    from mira_cli.backend_api import refactor_suggestions_backend
+    _show_stream(refactor_suggestions_backend(file_path), f"'{file_path}' 리팩토링 제안", as_json, web,
+                 f"/refactor-suggestions?filePath={file_path}", file_path)
@@ -1,7 +1,29 @@
 import configparser
+import os
 from pathlib import Path
 from mira_cli.utils import console
 
+# 기본 캐시 디렉토리 ($XDG_CACHE_HOME/mira 또는 ~/.cache/mira)
+def _default_cache_dir():
+    return str(Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'mira')
+
+# [pruning] 과 [pruning.<언어>] 섹션의 항목 (키: 언어 이름, 기본값 섹션은 '')
+def _pruning_profiles(config):
+    return {
+        section.partition('.')[2]: dict(config.items(section))
+        for section in config.sections()
+        if section == 'pruning' or section.startswith('pruning.')
+    }
+
+# 섹션의 <key> 와 <key>.<언어> 항목 (키: 언어 이름, 기본값은 '')
+def _per_language_ints(config, section, key, fallback):
+    values = {'': config.getint(section, key, fallback=fallback)}
+    if config.has_section(section):
+        for option in config.options(section):
+            if option.startswith(key + '.'):
+                values[option.partition('.')[2]] = config.getint(section, option)
+    return values
+
 # 설정 파일 (config.ini)을 로드하는 함수
 def load_config():
     config = configparser.ConfigParser()
@@ -9,7 +31,46 @@ def load_config():
     config.read(Path(__file__).parent.parent / 'config.ini')
     return {
         "BACKEND_API_URL": config['backend']['api_url'],
-        "WEB_UI_URL": config['frontend']['web_ui_url']
+        "WEB_UI_URL": config['frontend']['web_ui_url'],
+        "UPLOAD_MODE": config.get('upload', 'mode', fallback='bulk'),
+        "UPLOAD_BATCH_MAX_RECORDS": config.getint('upload', 'batch_max_records', fallback=500),
+        "UPLOAD_BATCH_MAX_BYTES": config.getint('upload', 'batch_max_bytes', fallback=8 * 1024 * 1024),
+        "UPLOAD_COMPRESSION": config.get('upload', 'compression', fallback='gzip'),
+        "AST_FORMAT": config.get('upload', 'ast_format', fallback='nested'),
+        "UPLOAD_STREAM_THRESHOLD_BYTES": config.getint('upload', 'stream_threshold_bytes', fallback=1024 * 1024),
+        "UPLOAD_STREAM_BUFFER_BYTES": config.getint('upload', 'stream_buffer_bytes', fallback=64 * 1024),
+        "UPLOAD_MAX_CONCURRENCY": config.getint('upload', 'max_concurrency', fallback=8),
+        "UPLOAD_TARGET_LATENCY_SECONDS": config.getfloat('upload', 'target_latency_seconds', fallback=2.0),
+        "UPLOAD_QUEUE_SIZE": config.getint('upload', 'queue_size', fallback=16),
+        "SCAN_SOURCE": config.get('scan', 'source', fallback='auto'),
+        "SCAN_INCLUDE_UNTRACKED": config.getboolean('scan', 'include_untracked', fallback=True),
+        "FILTER_MAX_FILE_BYTES": _per_language_ints(config, 'filter', 'max_file_bytes', 20 * 1024 * 1024),
+        "FILTER_BINARY_CHECK_BYTES": config.getint('filter', 'binary_check_bytes', fallback=8000),
+        "FILTER_MAX_AVERAGE_LINE_LENGTH": _per_language_ints(config, 'filter', 'max_average_line_length', 300),
+        "FILTER_MMAP_THRESHOLD_BYTES": config.getint('filter', 'mmap_threshold_bytes', fallback=1024 * 1024),
+        "HTTP_CONNECT_TIMEOUT": config.getfloat('http', 'connect_timeout', fallback=5.0),
+        "HTTP_READ_TIMEOUT": config.getfloat('http', 'read_timeout', fallback=60.0),
+        "HTTP_MAX_RETRIES": config.getint('http', 'max_retries', fallback=3),
+        "HTTP_BACKOFF_BASE": config.getfloat('http', 'backoff_base', fallback=0.5),
+        "HTTP_BACKOFF_MAX": config.getfloat('http', 'backoff_max', fallback=8.0),
+        "HTTP_POOL_SIZE": config.getint('http', 'pool_size', fallback=10),
+        "HTTP_BATCH_CONCURRENCY": config.getint('http', 'batch_concurrency', fallback=8),
+        "CACHE_ENABLED": config.getboolean('cache', 'enabled', fallback=True),
+        "CACHE_DIR": config.get('cache', 'dir', fallback='') or _default_cache_dir(),
+        "CACHE_TTL_SECONDS": config.getfloat('cache', 'ttl_seconds', fallback=300.0),
+        "CACHE_MAX_ENTRIES": config.getint('cache', 'max_entries', fallback=2000),
+        "CACHE_MEMORY_ENTRIES": config.getint('cache', 'memory_entries', fallback=256),
+        "WATCH_DEBOUNCE_SECONDS": config.getfloat('watch', 'debounce_seconds', fallback=0.3),
+        "WATCH_MAX_DELAY_SECONDS": config.getfloat('watch', 'max_delay_seconds', fallback=2.0),
+        "WATCH_POLL_INTERVAL_SECONDS": config.getfloat('watch', 'poll_interval_seconds', fallback=0.5),
+        "WATCH_RETRY_SECONDS": config.getfloat('watch', 'retry_seconds', fallback=5.0),
+        "WATCH_INCREMENTAL": config.getboolean('watch', 'incremental', fallback=True),
+        "WATCH_INCREMENTAL_CACHE_MB": config.getint('watch', 'incremental_cache_mb', fallback=256),
+        "SYMBOLS_ENABLED": config.getboolean('symbols', 'enabled', fallback=True),
+        "SYMBOLS_REFERENCES": config.getboolean('symbols', 'references', fallback=True),
+        "PRUNING_PROFILES": _pruning_profiles(config),
+        "DAEMON_SOCKET_PATH": config.get('daemon', 'socket_path', fallback=''),
+        "DAEMON_IDLE_TIMEOUT_SECONDS": config.getfloat('daemon', 'idle_timeout_seconds', fallback=1800.0),
     }
 
 # 설정 데이터 로드
@@ -18,3 +79,62 @@ config_data = load_config()
 BACKEND_API_URL = config_data["BACKEND_API_URL"]
 # 웹 UI URL
 WEB_UI_URL = config_data["WEB_UI_URL"]
+# 파싱 결과 업로드 방식 (bulk: 배치 전송, single: 파일별 전송)
+UPLOAD_MODE = config_data["UPLOAD_MODE"]
+# 배치 하나에 담을 최대 레코드 수
+UPLOAD_BATCH_MAX_RECORDS = config_data["UPLOAD_BATCH_MAX_RECORDS"]
+# 배치 하나의 최대 크기 (압축 전 바이트)
+UPLOAD_BATCH_MAX_BYTES = config_data["UPLOAD_BATCH_MAX_BYTES"]
+# 배치 압축 방식 (gzip, zstd, none)
+UPLOAD_COMPRESSION = config_data["UPLOAD_COMPRESSION"]
+# AST 전송 형식 (nested: 기존 중첩 딕셔너리, compact-v1: 소스 1회 전송 + 바이트 오프셋)
+AST_FORMAT = config_data["AST_FORMAT"]
+# 스트리밍 전송을 사용하는 최소 소스 파일 크기와 청크 크기 (바이트)
+UPLOAD_STREAM_THRESHOLD_BYTES = config_data["UPLOAD_STREAM_THRESHOLD_BYTES"]
+UPLOAD_STREAM_BUFFER_BYTES = config_data["UPLOAD_STREAM_BUFFER_BYTES"]
+# 업로드 동시 요청 수 상한, 상한을 줄이는 기준 응답 시간 (초), 전송 대기열 크기
+UPLOAD_MAX_CONCURRENCY = config_data["UPLOAD_MAX_CONCURRENCY"]
+UPLOAD_TARGET_LATENCY_SECONDS = config_data["UPLOAD_TARGET_LATENCY_SECONDS"]
+UPLOAD_QUEUE_SIZE = config_data["UPLOAD_QUEUE_SIZE"]
+# 파싱할 파일 목록을 얻는 방식 (auto, git, walk)
+SCAN_SOURCE = config_data["SCAN_SOURCE"]
+# git 인덱스 사용 시 추적하지 않는 파일 포함 여부
+SCAN_INCLUDE_UNTRACKED = config_data["SCAN_INCLUDE_UNTRACKED"]
+# 파싱 전 파일 필터: 언어별 최대 크기와 평균 줄 길이 (키: 언어 이름, 기본값은 ''), 바이너리 확인 크기, mmap 사용 크기
+FILTER_MAX_FILE_BYTES = config_data["FILTER_MAX_FILE_BYTES"]
+FILTER_BINARY_CHECK_BYTES = config_data["FILTER_BINARY_CHECK_BYTES"]
+FILTER_MAX_AVERAGE_LINE_LENGTH = config_data["FILTER_MAX_AVERAGE_LINE_LENGTH"]
+FILTER_MMAP_THRESHOLD_BYTES = config_data["FILTER_MMAP_THRESHOLD_BYTES"]
+# 백엔드 연결/응답 대기 시간 제한 (초)
+HTTP_CONNECT_TIMEOUT = config_data["HTTP_CONNECT_TIMEOUT"]
+HTTP_READ_TIMEOUT = config_data["HTTP_READ_TIMEOUT"]
+# 5xx 응답 및 연결 오류 시 최대 재시도 횟수와 지수 백오프 설정 (초)
+HTTP_MAX_RETRIES = config_data["HTTP_MAX_RETRIES"]
+HTTP_BACKOFF_BASE = config_data["HTTP_BACKOFF_BASE"]
+HTTP_BACKOFF_MAX = config_data["HTTP_BACKOFF_MAX"]
+# 커넥션 풀 크기
+HTTP_POOL_SIZE = config_data["HTTP_POOL_SIZE"]
+# 일괄 조회 시 동시 요청 수
+HTTP_BATCH_CONCURRENCY = config_data["HTTP_BATCH_CONCURRENCY"]
+# 그래프 조회 응답 캐시 사용 여부, 저장 위치, 유효 시간(초), 디스크/메모리 최대 항목 수
+CACHE_ENABLED = config_data["CACHE_ENABLED"]
+CACHE_DIR = config_data["CACHE_DIR"]
+CACHE_TTL_SECONDS = config_data["CACHE_TTL_SECONDS"]
+CACHE_MAX_ENTRIES = config_data["CACHE_MAX_ENTRIES"]
+CACHE_MEMORY_ENTRIES = config_data["CACHE_MEMORY_ENTRIES"]
+# watch 명령어의 변경 모음(debounce) 대기 시간, 최대 지연 시간, polling 주기, 실패 시 재시도 대기 시간 (초)
+WATCH_DEBOUNCE_SECONDS = config_data["WATCH_DEBOUNCE_SECONDS"]
+WATCH_MAX_DELAY_SECONDS = config_data["WATCH_MAX_DELAY_SECONDS"]
+WATCH_POLL_INTERVAL_SECONDS = config_data["WATCH_POLL_INTERVAL_SECONDS"]
+WATCH_RETRY_SECONDS = config_data["WATCH_RETRY_SECONDS"]
+# watch 명령어의 증분 파싱(AST 패치 전송) 사용 여부와 이전 소스/트리 보관 한도 (MB)
+WATCH_INCREMENTAL = config_data["WATCH_INCREMENTAL"]
+WATCH_INCREMENTAL_CACHE_MB = config_data["WATCH_INCREMENTAL_CACHE_MB"]
+# 파싱 시 로컬 심볼 인덱스 기록 여부, 참조(식별자) 포함 여부
+SYMBOLS_ENABLED = config_data["SYMBOLS_ENABLED"]
+SYMBOLS_REFERENCES = config_data["SYMBOLS_REFERENCES"]
+# 언어별 AST 가지치기 설정 항목 (mira_cli.pruning 참고)
+PRUNING_PROFILES = config_data["PRUNING_PROFILES"]
+# 백그라운드 데몬의 Unix 소켓 경로 (비어 있으면 기본 위치)와 유휴 종료 시간 (초, 0이면 종료하지 않음)
+DAEMON_SOCKET_PATH = config_data["DAEMON_SOCKET_PATH"]
+DAEMON_IDLE_TIMEOUT_SECONDS = config_data["DAEMON_IDLE_TIMEOUT_SECONDS"]
@@ -0,0 +1,328 @@
+# 명령어를 미리 준비된(warm) 상태로 실행하는 로컬 백그라운드 데몬 모듈
+#
+# 데몬은 Unix 소켓으로 요청을 받아 문법 파서, HTTP 커넥션 풀, 응답 캐시, 증분 파싱 세션을 유지한 채 명령어를 실행합니다.
+# cli.py 명령어와 MIRAShell 은 run_command 로 명령어를 실행하며, 데몬이 실행 중이면 데몬에 위임하고
+# 실행 중이 아니면 현재 프로세스에서 같은 함수를 실행합니다.
+# 클라이언트 쪽은 표준 라이브러리만 사용하므로 단발성 명령어의 시작 시간을 늘리지 않습니다.
+#
+# 프로토콜 (요청/응답 모두 한 줄에 JSON 객체 하나):
+#   요청: {"command": 명령어 이름, "args": {...}, "noCache": true/false}
+#   응답: {"output": 콘솔 출력 텍스트} 가 0개 이상 이어진 뒤 {"result": 반환값} 또는 {"error": 오류 메시지}
+
+import importlib
+import json
+import os
+import socket
+import sys
+import threading
+import time
+from pathlib import Path
+
+from mira_cli.config_loader import CACHE_DIR, DAEMON_SOCKET_PATH, DAEMON_IDLE_TIMEOUT_SECONDS
+
+DAEMON_LOG_NAME = 'daemon.log'
+# 데몬 시작 후 응답할 때까지 기다리는 최대 시간 (초)
+_START_TIMEOUT = 10.0
+# 데몬은 요청 처리/유휴 감시 스레드가 실행 중이므로 파싱 워커를 fork 대신 forkserver 로 시작 (fork 후 교착 방지)
+_PARSE_START_METHOD = 'forkserver'
+
+
+class DaemonUnavailable(Exception):
+    """데몬이 실행 중이 아니거나 연결할 수 없음 (현재 프로세스에서 실행해야 함)."""
+
+
+class DaemonError(Exception):
+    """데몬이 요청을 처리하는 도중 실패함."""
+
+
+# 데몬에 위임할 수 있는 명령어 -> (모듈, 함수 이름)
+COMMANDS = {
+    'parse': ('mira_cli.parser', 'parse_codebase_and_send_to_backend'),
+    'query': ('mira_cli.backend_api', 'send_query_to_backend'),
+    'node': ('mira_cli.backend_api', 'get_node_details'),
+    'relationships': ('mira_cli.backend_api', 'get_relationships_details'),
+    'search': ('mira_cli.backend_api', 'search_code_graph'),
+    'analyze_impact': ('mira_cli.backend_api', 'analyze_impact_backend'),
+    'find_tech_debt': ('mira_cli.backend_api', 'find_tech_debt_backend'),
+    'cache_stats': ('mira_cli.daemon', '_cache_stats'),
+    'cache_clear': ('mira_cli.daemon', '_cache_clear'),
+    'http_stats': ('mira_cli.daemon', '_http_stats'),
+}
+
+
+def _cache_stats():
+    from mira_cli.cache import get_cache
+    return get_cache().stats()
+
+
+def _cache_clear():
+    from mira_cli.cache import get_cache
+    get_cache().clear()
+    return True
+
+
+def _http_stats():
+    from mira_cli.http_client import get_client
+    return get_client().stats()
+
+
+# 명령어 이름에 해당하는 함수
+def _resolve(command):
+    if command not in COMMANDS:
+        raise ValueError(f"알 수 없는 명령어입니다: {command}")
+    module_name, function_name = COMMANDS[command]
+    return getattr(importlib.import_module(module_name), function_name)
+
+
+# 데몬 소켓 경로 (config.ini 의 socket_path 또는 $XDG_RUNTIME_DIR/mira, 캐시 디렉토리)
+def get_socket_path():
+    if DAEMON_SOCKET_PATH:
+        return Path(DAEMON_SOCKET_PATH).expanduser()
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    base_dir = Path(runtime_dir) / 'mira' if runtime_dir else Path(CACHE_DIR)
+    return base_dir / 'daemon.sock'
+
+
+# 데몬 소켓에 연결 (실행 중이 아니면 DaemonUnavailable)
+def _connect(socket_path=None):
+    socket_path = Path(socket_path or get_socket_path())
+    if not hasattr(socket, 'AF_UNIX') or not socket_path.exists():
+        raise DaemonUnavailable("데몬이 실행 중이 아닙니다.")
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(socket_path))
+    except OSError as e:
+        sock.close()
+        raise DaemonUnavailable(f"데몬에 연결할 수 없습니다: {e}") from e
+    return sock
+
+
+# 데몬에 명령어를 보내고 결과를 반환 (콘솔 출력은 도착하는 대로 on_output 으로 전달)
+def call(command, args=None, no_cache=False, on_output=None, socket_path=None):
+    if on_output is None:
+        def on_output(text):
+            sys.stdout.write(text)
+            sys.stdout.flush()
+
+    sock = _connect(socket_path)
+    with sock, sock.makefile('rwb') as stream:
+        request = {"command": command, "args": args or {}, "noCache": no_cache}
+        try:
+            stream.write(json.dumps(request, ensure_ascii=False).encode('utf-8') + b'\n')
+            stream.flush()
+        except OSError as e:
+            raise DaemonUnavailable(f"데몬에 요청을 보낼 수 없습니다: {e}") from e
+        for line in stream:
+            message = json.loads(line)
+            if "output" in message:
+                on_output(message["output"])
+            elif "error" in message:
+                raise DaemonError(message["error"])
+            else:
+                return message.get("result")
+    raise DaemonError("응답을 받기 전에 데몬 연결이 끊어졌습니다.")
+
+
+# 데몬이 실행 중이면 데몬에서, 아니면 현재 프로세스에서 명령어를 실행하고 결과를 반환
+def run_command(command, args=None, use_daemon=True, no_cache=False):
+    args = args or {}
+    if use_daemon:
+        try:
+            return call(command, args, no_cache=no_cache)
+        except DaemonUnavailable:
+            pass
+        except DaemonError as e:
+            from mira_cli.utils import console
+            console.print(f"[bold red]데몬 오류:[/bold red] {e}")
+            return None
+    return _resolve(command)(**args)
+
+
+# 실행 중인 데몬의 상태 (실행 중이 아니면 None)
+def daemon_status(socket_path=None):
+    try:
+        return call('ping', socket_path=socket_path)
+    except (DaemonUnavailable, DaemonError):
+        return None
+
+
+# 데몬을 백그라운드 프로세스로 시작하고 응답할 때까지 대기 (이미 실행 중이면 False)
+def start_daemon(socket_path=None):
+    import subprocess
+
+    if daemon_status(socket_path) is not None:
+        return False
+    log_path = Path(CACHE_DIR) / DAEMON_LOG_NAME
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    command = [sys.executable, '-m', 'mira_cli.daemon']
+    if socket_path:
+        command.append(str(socket_path))
+    with open(log_path, 'ab') as log:
+        process = subprocess.Popen(command, stdin=subprocess.DEVNULL, stdout=log, stderr=subprocess.STDOUT,
+                                   start_new_session=True, cwd=Path(__file__).resolve().parent.parent)
+    deadline = time.monotonic() + _START_TIMEOUT
+    while time.monotonic() < deadline:
+        if daemon_status(socket_path) is not None:
+            return True
+        if process.poll() is not None:
+            break
+        time.sleep(0.05)
+    raise DaemonError(f"데몬을 시작하지 못했습니다. 로그를 확인하세요: {log_path}")
+
+
+# 실행 중인 데몬을 종료 (실행 중이 아니면 False)
+def stop_daemon(socket_path=None):
+    try:
+        call('shutdown', socket_path=socket_path)
+    except (DaemonUnavailable, DaemonError):
+        return False
+    socket_path = Path(socket_path or get_socket_path())
+    deadline = time.monotonic() + _START_TIMEOUT
+    while socket_path.exists() and time.monotonic() < deadline:
+        time.sleep(0.05)
+    return True
+
+
+class _OutputWriter:
+    """데몬의 콘솔 출력을 요청한 클라이언트로 전달하는 파일 객체."""
+
+    def __init__(self, send):
+        self._send = send
+
+    def write(self, text):
+        if text:
+            self._send({"output": text})
+        return len(text)
+
+    def flush(self):
+        pass
+
+    def isatty(self):
+        return False
+
+
+class MiraDaemon:
+    """
+    Unix 소켓에서 요청을 받아 명령어를 실행하는 데몬.
+    명령어는 콘솔 출력과 매니페스트를 공유하므로 한 번에 하나씩 실행하며,
+    코드베이스별 증분 파싱 세션을 유지해 parse 요청에서도 이전 구문 트리를 재사용합니다.
+    """
+
+    def __init__(self, socket_path=None, idle_timeout=None):
+        self.socket_path = Path(socket_path or get_socket_path())
+        self.idle_timeout = DAEMON_IDLE_TIMEOUT_SECONDS if idle_timeout is None else idle_timeout
+        self.started_at = time.time()
+        self.request_count = 0
+        self._lock = threading.Lock()
+        self._sessions = {}
+        self._last_active = time.monotonic()
+        self._server = None
+
+    # 요청 하나를 처리하고 결과를 반환 (콘솔 출력은 send 로 전달)
+    def handle(self, request, send):
+        command = request.get("command")
+        if command == 'ping':
+            return {"pid": os.getpid(), "uptime": round(time.time() - self.started_at, 1),
+                    "requests": self.request_count, "socketPath": str(self.socket_path)}
+        if command == 'shutdown':
+            threading.Thread(target=self._server.shutdown, daemon=True).start()
+            return True
+
+        function = _resolve(command)
+        args = dict(request.get("args") or {})
+        from mira_cli.cache import get_cache
+        from mira_cli.utils import console
+
+        with self._lock:
+            self.request_count += 1
+            if command == 'parse':
+                args['session'] = self._session_for(args['path'])
+                args['mp_start_method'] = _PARSE_START_METHOD
+            cache = get_cache()
+            cache_enabled = cache.enabled
+            console.file = _OutputWriter(send)
+            if request.get("noCache"):
+                cache.enabled = False
+            try:
+                return function(**args)
+            finally:
+                console.file = None # 기본 출력(sys.stdout)으로 복원
+                cache.enabled = cache_enabled
+                self._last_active = time.monotonic()
+
+    # 코드베이스별 증분 파싱 세션
+    def _session_for(self, path):
+        from mira_cli.incremental import IncrementalSession
+        key = os.path.realpath(path)
+        if key not in self._sessions:
+            self._sessions[key] = IncrementalSession()
+        return self._sessions[key]
+
+    # 자주 쓰는 모듈과 HTTP 클라이언트를 미리 로드
+    def _warm_up(self):
+        import mira_cli.backend_api
+        import mira_cli.incremental
+        import mira_cli.parser
+        from mira_cli.cache import get_cache
+        from mira_cli.http_client import get_client
+        import rich.progress
+        get_cache()
+        get_client()
+
+    # 유휴 시간이 지나면 데몬 종료
+    def _watch_idle(self):
+        while True:
+            time.sleep(min(self.idle_timeout, 30.0))
+            if not self._lock.locked() and time.monotonic() - self._last_active >= self.idle_timeout:
+                self._server.shutdown()
+                return
+
+    def serve_forever(self):
+        import signal
+        import socketserver
+
+        daemon = self
+
+        class _Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                def send(message):
+                    self.wfile.write(json.dumps(message, ensure_ascii=False).encode('utf-8') + b'\n')
+
+                try:
+                    request = json.loads(self.rfile.readline() or b'{}')
+                    send({"result": daemon.handle(request, send)})
+                except (BrokenPipeError, ConnectionResetError):
+                    pass # 클라이언트가 먼저 종료한 경우
+                except Exception as e:
+                    try:
+                        send({"error": f"{type(e).__name__}: {e}"})
+                    except OSError:
+                        pass
+
+        class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+            daemon_threads = True
+
+        if daemon_status(self.socket_path) is not None:
+            raise DaemonError(f"이미 실행 중인 데몬이 있습니다: {self.socket_path}")
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+        self.socket_path.unlink(missing_ok=True) # 비정상 종료로 남은 소켓 파일
+        old_umask = os.umask(0o177) # 소켓은 현재 사용자만 접근 가능
+        try:
+            self._server = _Server(str(self.socket_path), _Handler)
+        finally:
+            os.umask(old_umask)
+
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, lambda *_: threading.Thread(target=self._server.shutdown, daemon=True).start())
+        self._warm_up()
+        if self.idle_timeout:
+            threading.Thread(target=self._watch_idle, daemon=True).start()
+        try:
+            self._server.serve_forever(poll_interval=0.5)
+        finally:
+            self._server.server_close()
+            self.socket_path.unlink(missing_ok=True)
+
+
+if __name__ == '__main__':
+    MiraDaemon(sys.argv[1] if len(sys.argv) > 1 else None).serve_forever()
@@ -0,0 +1,84 @@
+# 파싱 전에 건너뛸 파일(크기 제한 초과, 바이너리, 압축/생성된 파일)을 분류하고 소스를 읽는 모듈
+#
+# 크기 제한은 stat 정보만으로 확인하므로 파일을 읽기 전에 적용하고,
+# 바이너리와 압축(minified) 여부는 파일 앞부분만 읽어 확인하고, 건너뛰지 않는 파일만 나머지를 읽습니다.
+# (설정은 config.ini 의 [filter] 섹션)
+# 큰 파일은 mmap 으로 읽어 소스를 프로세스 메모리로 복사하지 않고 해시 계산과 파싱에 그대로 사용합니다.
+
+import mmap
+import os
+
+from mira_cli.config_loader import (FILTER_BINARY_CHECK_BYTES, FILTER_MAX_AVERAGE_LINE_LENGTH, FILTER_MAX_FILE_BYTES,
+                                    FILTER_MMAP_THRESHOLD_BYTES)
+
+SKIP_TOO_LARGE = 'too-large'
+SKIP_BINARY = 'binary'
+SKIP_GENERATED = 'generated'
+# 건너뛴 사유별 출력 이름
+SKIP_REASON_LABELS = {
+    SKIP_TOO_LARGE: '크기 제한 초과',
+    SKIP_BINARY: '바이너리',
+    SKIP_GENERATED: '압축/생성된 파일',
+}
+
+# 평균 줄 길이를 계산할 파일 앞부분의 크기와, 이보다 짧은 파일은 압축 여부를 확인하지 않는 최소 크기 (바이트)
+_LINE_SAMPLE_BYTES = 64 * 1024
+_LINE_SAMPLE_MIN_BYTES = 4096
+
+
+def _language_limit(limits, lang_name):
+    return limits.get(lang_name, limits[''])
+
+
+# 파일 크기가 언어별 제한 이상이면 건너뛴 사유를 반환 (아니면 None)
+def check_size(lang_name, size):
+    limit = _language_limit(FILTER_MAX_FILE_BYTES, lang_name)
+    return SKIP_TOO_LARGE if limit > 0 and size >= limit else None
+
+
+# 읽은 소스(bytes 또는 mmap)가 바이너리이거나 압축/생성된 파일이면 건너뛴 사유를 반환 (아니면 None)
+def classify_source(lang_name, source_code):
+    if FILTER_BINARY_CHECK_BYTES > 0 and source_code.find(b'\0', 0, FILTER_BINARY_CHECK_BYTES) != -1:
+        return SKIP_BINARY
+    max_average = _language_limit(FILTER_MAX_AVERAGE_LINE_LENGTH, lang_name)
+    if max_average > 0:
+        sample = source_code[:_LINE_SAMPLE_BYTES]
+        if len(sample) >= _LINE_SAMPLE_MIN_BYTES and len(sample) / (sample.count(b'\n') + 1) > max_average:
+            return SKIP_GENERATED
+    return None
+
+
+# 파일 앞부분으로 건너뛸지 먼저 확인한 뒤 소스를 읽음. 반환값: (소스 또는 None, 건너뛴 사유 또는 None)
+def read_classified_source(file_path, lang_name, allow_mmap=True):
+    """
+    건너뛰는 파일은 분류에 필요한 앞부분(binary_check_bytes 와 64KB 중 큰 크기)만 읽습니다.
+    allow_mmap 이면 mmap_threshold_bytes 이상인 파일은 read_source 와 같이 mmap 으로 반환합니다. (앞부분 페이지만 접근해 분류)
+    """
+    with open(file_path, 'rb') as f:
+        if allow_mmap and FILTER_MMAP_THRESHOLD_BYTES > 0:
+            if os.fstat(f.fileno()).st_size >= FILTER_MMAP_THRESHOLD_BYTES:
+                source_code = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                skip_reason = classify_source(lang_name, source_code)
+                if skip_reason is not None:
+                    source_code.close()
+                    return None, skip_reason
+                return source_code, None
+        head = f.read(max(_LINE_SAMPLE_BYTES, FILTER_BINARY_CHECK_BYTES))
+        skip_reason = classify_source(lang_name, head)
+        if skip_reason is not None:
+            return None, skip_reason
+        return head + f.read(), None
+
+
+# 파일 소스를 읽음 (mmap_threshold_bytes 이상이면 읽기 전용 mmap 을 반환)
+def read_source(file_path):
+    """
+    mmap 은 bytes 처럼 슬라이싱, find, 해시 계산, tree-sitter 파싱에 사용할 수 있으며
+    마지막 참조가 사라질 때 해제됩니다. (str(source, 'utf-8') 로 디코딩)
+    """
+    with open(file_path, 'rb') as f:
+        if FILTER_MMAP_THRESHOLD_BYTES > 0:
+            size = os.fstat(f.fileno()).st_size
+            if size >= FILTER_MMAP_THRESHOLD_BYTES:
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return f.read()
@@ -0,0 +1,129 @@
+# git 인덱스(.git/index)에서 추적 중인 파일 목록을 읽는 모듈
+#
+# 코드베이스 루트가 git 저장소이면 디렉토리를 순회하며 모든 항목을 stat 하는 대신
+# 인덱스 파일(DIRC 형식 버전 2~4)을 한 번 읽어 추적 중인 일반 파일의 경로를 얻습니다.
+# 분할(split) 인덱스나 sparse 인덱스처럼 인덱스만으로 전체 목록을 알 수 없는 경우는
+# GitIndexError 를 발생시키며, 호출 측은 디렉토리 순회로 대체합니다.
+
+import os
+import struct
+import subprocess
+from pathlib import Path
+
+from mira_cli.ignore import GIT_DIR_NAME
+
+_HEADER = struct.Struct('>4sII')
+_ENTRY_FIXED_SIZE = 62 # ctime, mtime, dev, ino, mode, uid, gid, size, SHA-1, flags
+_MODE_OFFSET = 24
+_FLAGS_OFFSET = 60
+_EXTENDED_FLAG = 0x4000
+_SKIP_WORKTREE_FLAG = 0x4000 # 확장 플래그
+_REGULAR_FILE_TYPE = 0o10 # mode >> 12 (일반 파일), 심볼릭 링크(0o12)와 서브모듈(0o16)은 제외
+_DIRECTORY_TYPE = 0o04 # sparse 인덱스의 디렉토리 항목
+_UNSUPPORTED_EXTENSIONS = (b'link', b'sdir')
+
+
+class GitIndexError(Exception):
+    """git 인덱스를 읽을 수 없거나 인덱스만으로 파일 목록을 알 수 없는 경우 발생하는 예외."""
+
+
+# 코드베이스 루트의 git 디렉토리 (루트가 git 저장소가 아니면 None, 워크트리의 ".git" 파일도 지원)
+def find_git_dir(base_path):
+    git_path = Path(base_path) / GIT_DIR_NAME
+    if git_path.is_dir():
+        return git_path
+    if git_path.is_file():
+        try:
+            content = git_path.read_text(encoding='utf-8').strip()
+        except OSError:
+            return None
+        if content.startswith('gitdir:'):
+            git_dir = Path(content[len('gitdir:'):].strip())
+            return git_dir if git_dir.is_absolute() else (Path(base_path) / git_dir)
+    return None
+
+
+def _read_varint(data, pos):
+    # 인덱스 버전 4 의 경로 접두사 길이 (git 의 offset varint 인코딩)
+    byte = data[pos]
+    value = byte & 0x7f
+    pos += 1
+    while byte & 0x80:
+        byte = data[pos]
+        value = ((value + 1) << 7) | (byte & 0x7f)
+        pos += 1
+    return value, pos
+
+
+# 인덱스 파일에서 작업 트리에 있어야 하는 추적 파일의 상대 경로 목록을 읽음
+def read_index_paths(git_dir):
+    """
+    병합 충돌로 여러 stage 가 있는 경로는 한 번만 포함하며, skip-worktree 항목은 제외합니다.
+    반환값: 루트 기준 '/' 구분 상대 경로 목록 (인덱스 순서, 즉 경로 정렬 순)
+    """
+    try:
+        with open(Path(git_dir) / 'index', 'rb') as f:
+            data = f.read()
+    except FileNotFoundError:
+        return [] # 아직 커밋/추가한 파일이 없는 저장소
+    except OSError as e:
+        raise GitIndexError(f"git 인덱스를 읽을 수 없습니다: {e}")
+    if len(data) < _HEADER.size:
+        raise GitIndexError("git 인덱스가 손상되었습니다.")
+    signature, version, count = _HEADER.unpack_from(data)
+    if signature != b'DIRC' or version not in (2, 3, 4):
+        raise GitIndexError(f"지원하지 않는 git 인덱스 형식입니다. (버전 {version})")
+
+    paths = []
+    previous_path = b''
+    pos = _HEADER.size
+    try:
+        for _ in range(count):
+            entry_start = pos
+            mode = struct.unpack_from('>I', data, pos + _MODE_OFFSET)[0]
+            flags = struct.unpack_from('>H', data, pos + _FLAGS_OFFSET)[0]
+            pos += _ENTRY_FIXED_SIZE
+            extended_flags = 0
+            if version >= 3 and flags & _EXTENDED_FLAG:
+                extended_flags = struct.unpack_from('>H', data, pos)[0]
+                pos += 2
+            if version == 4:
+                strip, pos = _read_varint(data, pos)
+                end = data.index(b'\0', pos)
+                path = previous_path[:len(previous_path) - strip] + data[pos:end]
+                pos = end + 1
+            else:
+                end = data.index(b'\0', pos)
+                path = data[pos:end]
+                # 항목은 1~8 바이트의 NUL 로 8 바이트 경계에 맞춰짐
+                pos = entry_start + ((end - entry_start + 8) & ~7)
+            previous_path = path
+
+            file_type = mode >> 12
+            if file_type == _DIRECTORY_TYPE:
+                raise GitIndexError("sparse 인덱스는 지원하지 않습니다.")
+            if file_type != _REGULAR_FILE_TYPE or extended_flags & _SKIP_WORKTREE_FLAG:
+                continue
+            if paths and paths[-1] == path:
+                continue # 병합 충돌 중인 경로의 다른 stage
+            paths.append(path)
+    except (struct.error, ValueError, IndexError):
+        raise GitIndexError("git 인덱스가 손상되었습니다.")
+
+    # 확장 영역 확인 (마지막 20 바이트는 인덱스 체크섬)
+    while pos + 8 <= len(data) - 20:
+        extension, size = struct.unpack_from('>4sI', data, pos)
+        if extension in _UNSUPPORTED_EXTENSIONS:
+            raise GitIndexError(f"git 인덱스 확장({extension.decode('ascii', 'replace')})은 지원하지 않습니다.")
+        pos += 8 + size
+    return [os.fsdecode(path) for path in paths]
+
+
+# 추적하지 않지만 무시되지 않은 파일 목록 (git 실행 파일 필요)
+def list_untracked_paths(base_path):
+    try:
+        output = subprocess.run(['git', '-C', str(base_path), 'ls-files', '-z', '--others', '--exclude-standard'],
+                                capture_output=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError) as e:
+        raise GitIndexError(f"추적하지 않는 파일 목록을 가져올 수 없습니다: {e}")
+    return [os.fsdecode(path) for path in output.split(b'\0') if path]
@@ -0,0 +1,139 @@
+# 백엔드와 통신하는 공용 HTTP 클라이언트 모듈
+#
+# 모든 백엔드 호출(backend_api, parser 업로드, 셸 쿼리)은 이 모듈의 클라이언트를 사용합니다.
+# keep-alive 커넥션 풀, 연결/응답 시간 제한, 5xx 및 연결 오류에 대한 지터 백오프 재시도,
+# 엔드포인트별 지연 시간/오류 카운터를 제공합니다.
+
+import random
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from mira_cli.config_loader import (
+    BACKEND_API_URL,
+    HTTP_CONNECT_TIMEOUT,
+    HTTP_READ_TIMEOUT,
+    HTTP_MAX_RETRIES,
+    HTTP_BACKOFF_BASE,
+    HTTP_BACKOFF_MAX,
+    HTTP_POOL_SIZE,
+)
+from mira_cli.utils import console
+
+
+class BackendClient:
+    """커넥션 풀과 재시도를 갖춘 백엔드 API 클라이언트."""
+
+    def __init__(self, base_url=BACKEND_API_URL, connect_timeout=HTTP_CONNECT_TIMEOUT, read_timeout=HTTP_READ_TIMEOUT,
+                 max_retries=HTTP_MAX_RETRIES, backoff_base=HTTP_BACKOFF_BASE, backoff_max=HTTP_BACKOFF_MAX,
+                 pool_size=HTTP_POOL_SIZE):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self._stats = {}
+        self._stats_lock = threading.Lock()
+
+    # 백엔드에 요청을 보내고 성공 응답을 반환 (실패 시 requests 예외 발생)
+    def request(self, method, endpoint, stats_key=None, no_retry_status=(), **kwargs):
+        """
+        endpoint 는 BACKEND_API_URL 기준 경로입니다. (예: "/parser/parse")
+        stats_key 는 통계 집계용 엔드포인트 이름으로, 경로에 ID 가 포함될 때 템플릿을 넘깁니다.
+        5xx 응답과 연결 오류는 max_retries 만큼 재시도하며, 최종 실패 시
+        requests.exceptions.HTTPError 또는 ConnectionError 가 발생합니다.
+        no_retry_status 의 상태 코드는 재시도하지 않고 바로 HTTPError 를 발생시킵니다. (호출 측이 직접 재시도하는 경우)
+        """
+        kwargs.setdefault('timeout', self.timeout)
+        stats_key = f"{method.upper()} {stats_key or endpoint}"
+        # 제너레이터 본문(스트리밍 업로드)은 다시 보낼 수 없으므로 재시도하지 않음
+        retryable = not hasattr(kwargs.get('data'), '__next__')
+        attempts = self.max_retries + 1 if retryable else 1
+
+        for attempt in range(attempts):
+            started = time.perf_counter()
+            try:
+                response = self.session.request(method, f"{self.base_url}{endpoint}", **kwargs)
+            except requests.exceptions.ConnectionError:
+                self._record(stats_key, time.perf_counter() - started, error=True, retried=attempt > 0)
+                if attempt + 1 >= attempts:
+                    raise
+                self.sleep_before_retry(attempt)
+                continue
+
+            failed = response.status_code >= 500
+            self._record(stats_key, time.perf_counter() - started, error=failed or response.status_code >= 400,
+                         retried=attempt > 0)
+            if failed and attempt + 1 < attempts and response.status_code not in no_retry_status:
+                response.close()
+                self.sleep_before_retry(attempt)
+                continue
+            response.raise_for_status()
+            return response
+
+    def get(self, endpoint, **kwargs):
+        return self.request('GET', endpoint, **kwargs)
+
+    def post(self, endpoint, **kwargs):
+        return self.request('POST', endpoint, **kwargs)
+
+    # 엔드포인트별 호출 통계 사본을 반환
+    def stats(self):
+        with self._stats_lock:
+            return {key: dict(value) for key, value in self._stats.items()}
+
+    def close(self):
+        self.session.close()
+
+    # 지터가 적용된 지수 백오프만큼 대기 (full jitter)
+    def sleep_before_retry(self, attempt):
+        time.sleep(random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt))))
+
+    def _record(self, stats_key, elapsed, error, retried):
+        with self._stats_lock:
+            entry = self._stats.setdefault(stats_key, {
+                "calls": 0, "errors": 0, "retries": 0, "totalSeconds": 0.0, "maxSeconds": 0.0,
+            })
+            entry["calls"] += 1
+            entry["errors"] += 1 if error else 0
+            entry["retries"] += 1 if retried else 0
+            entry["totalSeconds"] += elapsed
+            entry["maxSeconds"] = max(entry["maxSeconds"], elapsed)
+
+
+_client = None
+_client_lock = threading.Lock()
+
+# 프로세스 전체에서 공유하는 클라이언트를 반환
+def get_client():
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = BackendClient()
+        return _client
+
+
+# 백엔드 요청 중 발생한 예외를 설명하는 메시지 (예상하지 못한 예외면 None)
+def describe_request_error(e):
+    if isinstance(e, requests.exceptions.ConnectionError):
+        return "백엔드 서버에 연결할 수 없습니다. 서버가 실행 중인지 확인하세요."
+    if isinstance(e, requests.exceptions.HTTPError):
+        return f"백엔드에서 오류 응답: {e.response.status_code} - {e.response.text}"
+    if isinstance(e, requests.exceptions.Timeout):
+        return "백엔드 응답 시간이 초과되었습니다."
+    return None
+
+
+# 백엔드 요청 중 발생한 예외를 공통 형식으로 출력
+def report_request_error(e):
+    message = describe_request_error(e)
+    if message is not None:
+        console.print(f"[bold red]오류:[/bold red] {message}")
+    else:
+        console.print(f"[bold red]예상치 못한 오류 발생:[/bold red] {e}")
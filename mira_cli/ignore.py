@@ -0,0 +1,197 @@
+# git 호환 무시(ignore) 규칙 엔진
+#
+# .gitignore 규칙(부정 '!', 디렉토리 전용 '/', 루트 고정 패턴, '**', 문자 클래스)을 지원하며
+# 하위 디렉토리의 .gitignore 와 .git/info/exclude 도 함께 적용합니다.
+# 디렉토리별 패턴은 하나의 정규식으로 미리 컴파일되며, 무시된 디렉토리는 순회 중에 통째로 건너뜁니다.
+
+import os
+import re
+from pathlib import Path
+
+# git 저장소 메타데이터 디렉토리 (git 과 마찬가지로 항상 제외)
+GIT_DIR_NAME = '.git'
+
+
+# glob 패턴 하나를 정규식 문자열로 변환
+def _translate_glob(pattern):
+    result = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if c == '*':
+            if pattern.startswith('**', i):
+                at_segment_start = i == 0 or pattern[i - 1] == '/'
+                at_segment_end = i + 2 == n or pattern[i + 2] == '/'
+                if at_segment_start and at_segment_end:
+                    if i + 2 == n:
+                        result.append('.*') # 끝의 '/**': 하위 모든 경로
+                        i += 2
+                    else:
+                        result.append('(?:.*/)?') # '**/': 0개 이상의 디렉토리
+                        i += 3
+                    continue
+                # 경로 구분자에 붙어 있지 않은 '**' 는 '*' 와 같음
+                result.append('[^/]*')
+                i += 2
+                continue
+            result.append('[^/]*')
+        elif c == '?':
+            result.append('[^/]')
+        elif c == '[':
+            j = i + 1
+            if j < n and pattern[j] in '!^':
+                j += 1
+            if j < n and pattern[j] == ']':
+                j += 1
+            while j < n and pattern[j] != ']':
+                j += 1
+            if j >= n:
+                result.append(re.escape(c)) # 닫히지 않은 '[' 는 문자 그대로
+            else:
+                body = pattern[i + 1:j]
+                if body[:1] in ('!', '^'):
+                    body = '^' + body[1:]
+                result.append('[' + body.replace('\\', '\\\\').replace('[', '\\[') + ']')
+                i = j
+        elif c == '\\' and i + 1 < n:
+            i += 1
+            result.append(re.escape(pattern[i]))
+        else:
+            result.append(re.escape(c))
+        i += 1
+    return ''.join(result)
+
+
+# .gitignore 한 줄을 (정규식, 부정 여부, 디렉토리 전용 여부)로 변환 (주석/빈 줄은 None)
+def _parse_line(line):
+    line = line.rstrip('\n').rstrip('\r')
+    # 이스케이프되지 않은 끝 공백 제거
+    while line.endswith(' ') and not line.endswith('\\ '):
+        line = line[:-1]
+    if not line or line.startswith('#'):
+        return None
+
+    negated = line.startswith('!')
+    if negated:
+        line = line[1:]
+    elif line.startswith('\\!') or line.startswith('\\#'):
+        line = line[1:]
+
+    dir_only = line.endswith('/')
+    if dir_only:
+        line = line.rstrip('/')
+    if not line:
+        return None
+
+    # 중간이나 앞에 '/' 가 있으면 .gitignore 위치 기준으로 고정, 아니면 모든 깊이에서 매칭
+    anchored = '/' in line
+    line = line.lstrip('/')
+    regex = _translate_glob(line)
+    if not anchored:
+        regex = '(?:.*/)?' + regex
+    return regex, negated, dir_only
+
+
+class _PatternSet:
+    """한 디렉토리(또는 전역 제외 목록)의 패턴들을 컴파일한 매처."""
+
+    def __init__(self, lines):
+        rules = [rule for rule in (_parse_line(line) for line in lines) if rule]
+        self._negated = [negated for _, negated, _ in rules]
+        # 마지막에 일치한 패턴이 우선하므로 역순으로 나열해 첫 번째 일치가 곧 마지막 패턴이 되도록 함
+        self._file_regex = self._compile([(i, rule) for i, rule in enumerate(rules) if not rule[2]])
+        self._dir_regex = self._compile(list(enumerate(rules)))
+
+    @staticmethod
+    def _compile(indexed_rules):
+        if not indexed_rules:
+            return None
+        alternatives = [f'(?P<p{i}>{regex})' for i, (regex, _, _) in reversed(indexed_rules)]
+        return re.compile('|'.join(alternatives), re.DOTALL)
+
+    # 일치하는 패턴이 없으면 None, 무시 대상이면 True, 부정 패턴으로 포함되면 False
+    def match(self, rel_path, is_dir):
+        regex = self._dir_regex if is_dir else self._file_regex
+        if regex is None:
+            return None
+        m = regex.fullmatch(rel_path)
+        if m is None:
+            return None
+        return not self._negated[int(m.lastgroup[1:])]
+
+
+# 파일에서 무시 패턴 줄을 읽음 (파일이 없으면 빈 목록)
+def _read_lines(path):
+    try:
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            return f.readlines()
+    except OSError:
+        return []
+
+
+class IgnoreMatcher:
+    """
+    코드베이스 루트 기준의 git 호환 무시 규칙 매처.
+    우선순위(낮음 -> 높음): default_patterns < .git/info/exclude < 루트 .gitignore < 하위 디렉토리 .gitignore
+    """
+
+    def __init__(self, base_path, default_patterns=()):
+        self.base_path = Path(base_path)
+        self._global_sets = [
+            _PatternSet(default_patterns),
+            _PatternSet(_read_lines(self.base_path / GIT_DIR_NAME / 'info' / 'exclude')),
+        ]
+        self._dir_sets = {} # 디렉토리 상대 경로 -> _PatternSet 또는 None
+        self._ignored_dirs = {}
+
+    # 디렉토리의 .gitignore 를 한 번만 읽어 컴파일
+    def _pattern_set_for(self, rel_dir):
+        if rel_dir not in self._dir_sets:
+            lines = _read_lines(self.base_path / rel_dir / '.gitignore')
+            self._dir_sets[rel_dir] = _PatternSet(lines) if lines else None
+        return self._dir_sets[rel_dir]
+
+    # 조상 디렉토리는 무시되지 않았다고 가정하고 경로 자체만 판정 (순회 중 사용)
+    def match(self, rel_path, is_dir):
+        """rel_path 는 루트 기준 '/' 구분 상대 경로입니다."""
+        parts = rel_path.split('/')
+        if is_dir and parts[-1] == GIT_DIR_NAME:
+            return True
+        # 가장 깊은 .gitignore 부터 확인 (더 깊은 규칙이 우선)
+        for depth in range(len(parts) - 1, -1, -1):
+            pattern_set = self._pattern_set_for('/'.join(parts[:depth]))
+            if pattern_set is not None:
+                result = pattern_set.match('/'.join(parts[depth:]), is_dir)
+                if result is not None:
+                    return result
+        for pattern_set in reversed(self._global_sets):
+            result = pattern_set.match(rel_path, is_dir)
+            if result is not None:
+                return result
+        return False
+
+    # 임의의 경로가 무시 대상인지 확인 (무시된 디렉토리 아래의 경로도 무시로 판정)
+    def is_ignored(self, rel_path, is_dir=False):
+        parts = rel_path.split('/')
+        for depth in range(1, len(parts)):
+            ancestor = '/'.join(parts[:depth])
+            if ancestor not in self._ignored_dirs:
+                self._ignored_dirs[ancestor] = self.match(ancestor, True)
+            if self._ignored_dirs[ancestor]:
+                return True
+        return self.match(rel_path, is_dir)
+
+    # 무시되지 않은 파일을 순회 (무시된 디렉토리는 하위 트리 전체를 건너뜀)
+    def iter_files(self, rel_dir=''):
+        """rel_dir 을 지정하면 해당 하위 디렉토리만 순회합니다. (디렉토리 자체가 무시 대상이면 순회하지 않음)"""
+        if rel_dir and self.is_ignored(rel_dir, is_dir=True):
+            return
+        base = str(self.base_path)
+        top = os.path.join(base, *rel_dir.split('/')) if rel_dir else base
+        for root, dirs, files in os.walk(top):
+            rel_root = os.path.relpath(root, base).replace(os.sep, '/')
+            prefix = '' if rel_root == '.' else rel_root + '/'
+            dirs[:] = [d for d in dirs if not self.match(prefix + d, True)]
+            for file in files:
+                if not self.match(prefix + file, False):
+                    yield Path(root) / file
@@ -0,0 +1,341 @@
+# 장시간 실행되는 세션(mira watch)에서 파일별 이전 구문 트리를 보관하여 증분 파싱하는 모듈
+#
+# 이전 소스와 새 소스를 비교해 편집 범위를 구하고 Tree.edit 와 parse(old_tree=...) 로 바뀐 부분만 다시 파싱합니다.
+# changed_ranges 로 구조가 바뀐 하위 트리만 찾아 AST 패치(ast-patch-v1)로 /parser/patch 에 전송하며,
+# 패치를 만들 수 없거나 백엔드가 패치를 받지 못하면 기존 전체 parse_result 를 전송합니다.
+
+import base64
+import functools
+from collections import OrderedDict
+
+import requests
+
+from mira_cli.config_loader import SYMBOLS_REFERENCES, WATCH_INCREMENTAL_CACHE_MB
+from mira_cli.filefilter import read_classified_source
+from mira_cli.http_client import get_client, report_request_error
+from mira_cli.manifest import hash_bytes
+from mira_cli.parser import (
+    COMPACT_FORMAT,
+    NESTED_MAX_DEPTH,
+    PATCH_FORMAT,
+    TreeTooDeepError,
+    _build_parse_result,
+    _get_parser,
+    convert_to_ast_node,
+    convert_to_compact_ast,
+)
+from mira_cli.profiler import PhaseProfiler
+from mira_cli.pruning import get_prune_profile
+from mira_cli.symbols import extract_symbols
+from mira_cli.utils import console
+
+# 패치 경로를 지원하지 않는 백엔드가 돌려주는 상태 코드
+_PATCH_UNSUPPORTED_STATUS_CODES = (404, 405, 501)
+# 교체할 하위 트리의 노드 수가 전체의 이 비율을 넘으면 패치 대신 전체 전송
+_MAX_PATCH_NODE_RATIO = 0.5
+# 바이트 비교 단위 (공통 접두사/접미사 계산)
+_COMPARE_BLOCK = 4096
+
+
+# 두 바이트열의 공통 접두사 길이 (블록 단위로 비교한 뒤 첫 번째 다른 블록 안에서 위치를 찾음)
+def _common_prefix_length(a, b, limit):
+    start = 0
+    while start < limit:
+        end = min(start + _COMPARE_BLOCK, limit)
+        if a[start:end] != b[start:end]:
+            for index in range(start, end):
+                if a[index] != b[index]:
+                    return index
+        start = end
+    return limit
+
+
+# 바이트 오프셋의 (row, column) 위치 (column 은 tree-sitter 와 같이 바이트 단위)
+def _point(source, offset):
+    return source.count(b'\n', 0, offset), offset - (source.rfind(b'\n', 0, offset) + 1)
+
+
+# UTF-8 연속 바이트인지 확인 (편집 경계가 문자 중간에 오지 않도록 조정할 때 사용)
+def _is_continuation(source, offset):
+    return offset < len(source) and source[offset] & 0xC0 == 0x80
+
+
+# 이전 소스와 새 소스의 차이를 하나의 편집(Tree.edit 인자)으로 계산
+def compute_edit(old_source, new_source):
+    """
+    공통 접두사/접미사를 제외한 가운데 부분을 바뀐 범위로 보고
+    start_byte, old_end_byte, new_end_byte 와 각 위치의 (row, column)을 딕셔너리로 반환합니다.
+    """
+    limit = min(len(old_source), len(new_source))
+    start = _common_prefix_length(old_source, new_source, limit)
+    suffix = _common_prefix_length(old_source[::-1], new_source[::-1], limit - start)
+    old_end = len(old_source) - suffix
+    new_end = len(new_source) - suffix
+
+    # 멀티바이트 문자 중간에서 나뉘지 않도록 경계를 문자 단위로 맞춤
+    while start > 0 and _is_continuation(new_source, start):
+        start -= 1
+    while _is_continuation(new_source, new_end):
+        new_end += 1
+        old_end += 1
+    return {
+        "start_byte": start,
+        "old_end_byte": old_end,
+        "new_end_byte": new_end,
+        "start_point": _point(new_source, start),
+        "old_end_point": _point(old_source, old_end),
+        "new_end_point": _point(new_source, new_end),
+    }
+
+
+# 부모 노드의 자식 목록에서 노드의 위치
+def _child_index(parent, child):
+    for index, candidate in enumerate(parent.children):
+        if candidate == child:
+            return index
+    raise ValueError("자식 노드를 찾을 수 없습니다.")
+
+
+# 바뀐 범위를 덮는 노드 중 이전 트리에서도 같은 경로로 찾을 수 있는 가장 깊은 노드의 경로
+def _stable_path(old_root, new_root, start, end):
+    """
+    새 트리에서 [start, end) 범위를 덮는 가장 작은 노드까지 내려가되,
+    각 단계에서 부모의 자식 수가 이전(편집된) 트리와 같고 같은 위치의 자식이 같은 타입이며
+    그 범위를 덮는 경우에만 더 내려갑니다. (그 외에는 현재 노드 전체를 교체)
+    반환값은 루트부터의 자식 인덱스 목록입니다. (빈 목록이면 루트 전체)
+    """
+    node = new_root.descendant_for_byte_range(start, end)
+    chain = []
+    while node is not None:
+        chain.append(node)
+        node = node.parent
+    chain.reverse()
+
+    path = []
+    old_node = old_root
+    for parent, child in zip(chain, chain[1:]):
+        if parent.child_count != old_node.child_count:
+            break
+        index = _child_index(parent, child)
+        old_child = old_node.children[index]
+        if old_child.type != child.type or old_child.start_byte > start or old_child.end_byte < end:
+            break
+        path.append(index)
+        old_node = old_child
+    return path
+
+
+# 경로의 노드
+def _node_at(root, path):
+    node = root
+    for index in path:
+        node = node.children[index]
+    return node
+
+
+# 텍스트를 전송용 문자열과 인코딩으로 변환 (UTF-8 이 아니면 base64)
+def _encode_text(data):
+    try:
+        return data.decode('utf-8'), 'utf-8'
+    except UnicodeDecodeError:
+        return base64.b64encode(data).decode('ascii'), 'base64'
+
+
+class _Snapshot:
+    """백엔드에 반영된(또는 반영 대기 중인) 파일 하나의 소스와 구문 트리."""
+
+    __slots__ = ('file_path', 'source', 'tree', 'lang_name', 'content_hash', 'ast_format')
+
+    def __init__(self, file_path, source, tree, lang_name, content_hash, ast_format):
+        self.file_path = file_path
+        self.source = source
+        self.tree = tree
+        self.lang_name = lang_name
+        self.content_hash = content_hash
+        self.ast_format = ast_format
+
+
+# 편집된 이전 트리와 새 트리를 비교해 AST 패치를 생성 (패치가 적합하지 않으면 None)
+def build_patch(previous, old_tree, current, edit):
+    """
+    패치(format: ast-patch-v1)는 다음 순서로 적용합니다.
+    1. edit: 이전 소스의 [startByte, oldEndByte) 를 text 로 바꾸고, 그 뒤의 노드 위치를 Tree.edit 와 같은 규칙으로 옮깁니다.
+       (nested 형식은 편집 범위를 포함하는 노드의 value 에도 같은 편집을 적용합니다.)
+    2. replacements: path(루트부터의 자식 인덱스)의 노드를 baseFormat 형식의 하위 트리로 교체합니다.
+    baseHash 는 패치를 적용할 이전 내용의 해시이며, 백엔드의 내용과 다르면 적용하지 않아야 합니다.
+    """
+    if get_prune_profile(current.lang_name) is not None:
+        return None # 가지치기한 AST 는 자식 인덱스 경로가 구문 트리와 달라 전체 전송
+    tree = current.tree
+    ranges = [(changed.start_byte, changed.end_byte) for changed in old_tree.changed_ranges(tree)]
+    # 구조는 같고 토큰 내용만 바뀐 경우에도 해당 노드의 value 가 바뀌므로 편집 범위도 포함
+    # (빈 범위는 앞뒤 노드 중 어느 쪽이 바뀌었는지 모호하므로 양쪽을 모두 덮도록 넓힘)
+    start, end = edit["start_byte"], edit["new_end_byte"]
+    if start == end:
+        start, end = max(0, start - 1), min(len(current.source), end + 1)
+    ranges.append((start, end))
+
+    paths = []
+    for start, end in sorted(ranges):
+        path = _stable_path(old_tree.root_node, tree.root_node, start, end)
+        if not path:
+            return None # 루트 전체가 바뀐 경우
+        paths.append(tuple(path))
+    # 다른 교체 대상에 포함되는 경로는 제외
+    paths = sorted(set(paths))
+    paths = [path for path in paths if not any(other != path and path[:len(other)] == other for other in paths)]
+
+    nodes = [_node_at(tree.root_node, path) for path in paths]
+    replaced_count = sum(node.descendant_count for node in nodes)
+    if replaced_count > tree.root_node.descendant_count * _MAX_PATCH_NODE_RATIO:
+        return None
+
+    if current.ast_format == COMPACT_FORMAT:
+        convert = convert_to_compact_ast
+    else:
+        convert = functools.partial(convert_to_ast_node, max_depth=NESTED_MAX_DEPTH)
+    text, text_encoding = _encode_text(current.source[edit["start_byte"]:edit["new_end_byte"]])
+    return {
+        "filePath": str(current.file_path),
+        "language": current.lang_name,
+        "format": PATCH_FORMAT,
+        "baseFormat": current.ast_format,
+        "baseHash": previous.content_hash,
+        "contentHash": current.content_hash,
+        "edit": {
+            "startByte": edit["start_byte"],
+            "oldEndByte": edit["old_end_byte"],
+            "newEndByte": edit["new_end_byte"],
+            "startPosition": {"row": edit["start_point"][0], "column": edit["start_point"][1]},
+            "oldEndPosition": {"row": edit["old_end_point"][0], "column": edit["old_end_point"][1]},
+            "newEndPosition": {"row": edit["new_end_point"][0], "column": edit["new_end_point"][1]},
+            "text": text,
+            "textEncoding": text_encoding,
+        },
+        "replacements": [{"path": list(path), "node": convert(node)} for path, node in zip(paths, nodes)],
+    }
+
+
+class IncrementalSession:
+    """
+    파일별로 마지막으로 백엔드에 반영된 소스와 구문 트리를 보관하는 증분 파싱 세션.
+    파싱 결과는 업로드가 성공했을 때(commit)만 다음 비교의 기준이 되며,
+    보관하는 소스의 총 크기가 max_bytes 를 넘으면 가장 오래 사용하지 않은 파일부터 제거합니다.
+    """
+
+    def __init__(self, max_bytes=None):
+        self.max_bytes = max_bytes or WATCH_INCREMENTAL_CACHE_MB * 1024 * 1024
+        self.enabled = True # 백엔드가 패치를 지원하지 않으면 False (전체 전송만 사용)
+        self._snapshots = OrderedDict() # 상대 경로 -> 백엔드에 반영된 _Snapshot
+        self._pending = {} # 상대 경로 -> 업로드 대기 중인 _Snapshot
+        self._bytes = 0
+
+    # 파일 하나를 (가능하면 증분) 파싱하여 패치 또는 전체 parse_result 를 생성
+    def parse_file(self, file_path, rel_path, known_hash=None, ast_format=None, profile=False, symbols=False):
+        """반환값은 parser._parse_file 과 같은 (상태, 내용 해시, 결과 또는 오류 메시지, 심볼 목록, 측정 이벤트 목록)입니다."""
+        profiler = PhaseProfiler(enabled=profile)
+        try:
+            parser, lang_name = _get_parser(file_path.suffix)
+            if not parser:
+                return 'error', None, f"언어 파서 로드 실패: {file_path}", None, profiler.events
+
+            with profiler.phase('read', file_path, lang_name) as event:
+                # 세션에 보관하는 이전 소스는 bytes 연산을 사용하므로 mmap 없이 읽음
+                source_code, skip_reason = read_classified_source(file_path, lang_name, allow_mmap=False)
+                event['bytes'] = len(source_code) if source_code is not None else 0
+            if skip_reason is not None:
+                self.forget(rel_path)
+                return 'skipped', None, skip_reason, None, profiler.events
+            with profiler.phase('hash', file_path, lang_name) as event:
+                content_hash = hash_bytes(source_code)
+                event['bytes'] = len(source_code)
+            if content_hash == known_hash:
+                return 'unchanged', content_hash, None, None, profiler.events
+
+            # 이전 트리는 제자리에서 편집되므로 세션에서 꺼냄 (업로드가 실패하면 다음 변경은 전체 전송)
+            previous = self.forget(rel_path)
+            if previous is not None and not (self.enabled and previous.lang_name == lang_name
+                                             and previous.ast_format == ast_format):
+                previous = None
+
+            old_tree = edit = None
+            with profiler.phase('parse', file_path, lang_name) as event:
+                if previous is not None:
+                    edit = compute_edit(previous.source, source_code)
+                    old_tree = previous.tree
+                    old_tree.edit(**edit)
+                    tree = parser.parse(source_code, old_tree=old_tree)
+                else:
+                    tree = parser.parse(source_code)
+                event['bytes'] = len(source_code)
+
+            current = _Snapshot(file_path, source_code, tree, lang_name, content_hash, ast_format)
+            self._pending[rel_path] = current
+            file_symbols = None
+            if symbols:
+                with profiler.phase('symbols', file_path, lang_name):
+                    file_symbols = extract_symbols(tree, source_code, SYMBOLS_REFERENCES)
+            try:
+                with profiler.phase('convert', file_path, lang_name):
+                    result = build_patch(previous, old_tree, current, edit) if previous is not None else None
+                    if result is None:
+                        result = _build_parse_result(file_path, lang_name, tree, source_code, ast_format)
+            except TreeTooDeepError:
+                # 너무 깊은 트리는 세션에 보관하지 않고 호출 측에서 스트리밍 전송
+                self._pending.pop(rel_path, None)
+                return 'deep', content_hash, None, file_symbols, profiler.events
+            return 'parsed', content_hash, result, file_symbols, profiler.events
+        except Exception as e:
+            return 'error', None, str(e), None, profiler.events
+
+    # 패치를 보낼 수 없을 때 사용할 전체 parse_result (이미 파싱한 트리를 변환, 너무 깊으면 StreamingParseResult)
+    def full_result(self, rel_path):
+        current = self._pending[rel_path]
+        try:
+            return _build_parse_result(current.file_path, current.lang_name, current.tree, current.source,
+                                       current.ast_format)
+        except TreeTooDeepError:
+            from mira_cli.streaming import StreamingParseResult
+            return StreamingParseResult(current.file_path, current.lang_name, current.tree, current.source,
+                                        current.ast_format)
+
+    # AST 패치를 전송 (성공하면 True, 전체 전송이 필요하면 False)
+    # 연결 오류(requests.exceptions.ConnectionError)는 호출 측으로 전파됩니다.
+    def send_patch(self, patch):
+        try:
+            get_client().post("/parser/patch", json=patch)
+        except requests.exceptions.ConnectionError:
+            raise
+        except requests.exceptions.HTTPError as e:
+            if e.response is not None and e.response.status_code in _PATCH_UNSUPPORTED_STATUS_CODES:
+                console.print("[yellow]백엔드가 AST 패치를 지원하지 않아 전체 전송으로 전환합니다.[/yellow]")
+                self.enabled = False
+            # 그 외(예: 409 기준 버전 불일치)에는 이번 파일만 전체 전송
+            return False
+        except requests.exceptions.RequestException as e:
+            report_request_error(e)
+            return False
+        return True
+
+    # 업로드에 성공한 파싱 결과를 다음 비교의 기준으로 저장
+    def commit(self, rel_path):
+        current = self._pending.pop(rel_path, None)
+        if current is None:
+            return
+        self.forget(rel_path)
+        self._snapshots[rel_path] = current
+        self._bytes += len(current.source)
+        while self._bytes > self.max_bytes and len(self._snapshots) > 1:
+            _, evicted = self._snapshots.popitem(last=False)
+            self._bytes -= len(evicted.source)
+
+    # 파일의 기록을 제거하고 반환 (삭제된 파일 등)
+    def forget(self, rel_path):
+        previous = self._snapshots.pop(rel_path, None)
+        if previous is not None:
+            self._bytes -= len(previous.source)
+        return previous
+
+    # 업로드되지 않은 파싱 결과 폐기 (해당 파일의 다음 변경은 전체 전송)
+    def discard_pending(self):
+        self._pending.clear()
@@ -0,0 +1,102 @@
+# 코드베이스 전송 실행의 체크포인트 저널을 관리하는 모듈
+#
+# 저널은 코드베이스 루트의 .mira/journal.jsonl 에 저장되며, 첫 줄(실행 설정) 다음에
+# 파일별 업로드 성공/실패를 발생 즉시 한 줄씩 추가합니다. (매니페스트는 실행이 끝날 때만 저장됨)
+# 모든 파일을 전송한 실행은 저널을 삭제하므로, 저널이 남아 있으면 이전 실행이 중단되었거나 실패한 파일이 있다는 뜻입니다.
+
+import json
+import os
+
+from mira_cli.utils import get_state_dir
+
+JOURNAL_FILE_NAME = 'journal.jsonl'
+
+
+class RunJournal:
+    """코드베이스 전송 실행 하나의 파일별 업로드 결과 기록."""
+
+    def __init__(self, path, options=None, uploaded=None, failed=None):
+        self.path = path
+        self.options = options or {}
+        self.uploaded = uploaded if uploaded is not None else {} # 상대 경로 -> 매니페스트 항목
+        self.failed = failed if failed is not None else {} # 상대 경로 -> 오류 메시지
+        self._file = None
+
+    # 코드베이스의 저널을 로드 (없거나 다른 문법 버전으로 기록된 저널은 빈 저널)
+    @classmethod
+    def load(cls, base_path, grammar_version):
+        path = get_state_dir(base_path) / JOURNAL_FILE_NAME
+        journal = cls(path)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                lines = f.readlines()
+        except OSError:
+            return journal
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue # 강제 종료로 마지막 줄이 잘린 경우
+            if 'run' in record:
+                journal.options = record['run']
+            elif 'uploaded' in record:
+                journal.uploaded[record['uploaded']] = record['entry']
+                journal.failed.pop(record['uploaded'], None)
+            elif 'failed' in record:
+                journal.failed[record['failed']] = record['error']
+        if journal.options.get('grammarVersion') != grammar_version:
+            return cls(path)
+        return journal
+
+    # 이어서 진행할 기록이 있는지 여부
+    @property
+    def pending(self):
+        return bool(self.options)
+
+    # 새 실행의 기록을 시작 (keep=True 이면 기존 성공/실패 기록을 이어받음)
+    def begin(self, options, keep=False):
+        if not keep:
+            self.uploaded, self.failed = {}, {}
+        self.options = options
+        # 기존 기록을 새 설정과 함께 다시 쓰고 (임시 파일에 쓴 뒤 교체) 이후 기록은 뒤에 추가
+        tmp_path = self.path.with_suffix('.jsonl.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({'run': options}) + '\n')
+            for rel_path, entry in self.uploaded.items():
+                f.write(json.dumps({'uploaded': rel_path, 'entry': entry}) + '\n')
+            for rel_path, error in self.failed.items():
+                f.write(json.dumps({'failed': rel_path, 'error': error}) + '\n')
+        os.replace(tmp_path, self.path)
+        self._file = open(self.path, 'a', encoding='utf-8')
+
+    # 업로드에 성공한 파일을 기록 (entry 는 매니페스트 항목)
+    def record_uploaded(self, rel_path, entry):
+        self.uploaded[rel_path] = entry
+        self.failed.pop(rel_path, None)
+        self._append({'uploaded': rel_path, 'entry': entry})
+
+    # 파싱 또는 업로드에 실패한 파일을 기록
+    def record_failed(self, rel_path, error):
+        self.failed[rel_path] = error
+        self._append({'failed': rel_path, 'error': error})
+
+    # 프로세스가 강제 종료되어도 남도록 한 줄씩 바로 기록
+    def _append(self, record):
+        if self._file is not None:
+            self._file.write(json.dumps(record, ensure_ascii=False) + '\n')
+            self._file.flush()
+
+    # 기록을 닫음 (저널 파일은 남겨 둠)
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    # 실행이 완료되어 이어서 진행할 것이 없으므로 저널 삭제
+    def finish(self):
+        self.close()
+        self.options, self.uploaded, self.failed = {}, {}, {}
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,120 @@
+# 증분 파싱을 위한 로컬 매니페스트를 관리하는 모듈
+#
+# 매니페스트는 코드베이스 루트의 .mira/manifest.json 에 저장되며,
+# 파일별로 내용 해시, 언어, AST 전송 형식, 가지치기 프로필, 크기/수정 시각, 마지막 업로드 성공 시각을 기록합니다.
+
+import hashlib
+import json
+import os
+import time
+
+from mira_cli.utils import console, get_state_dir
+
+MANIFEST_FILE_NAME = 'manifest.json'
+MANIFEST_VERSION = 1
+
+
+# 파일 내용의 해시값을 계산
+def hash_bytes(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+# 상대 경로가 scopes 중 하나(같은 경로 또는 그 하위 경로)에 속하는지 확인
+def _in_scopes(rel_path, scopes):
+    return any(scope == '' or rel_path == scope or rel_path.startswith(scope + '/') for scope in scopes)
+
+
+# 현재 설치된 문법(grammar) 패키지 버전을 반환 (버전이 바뀌면 전체 재파싱)
+def current_grammar_version():
+    from importlib import metadata
+    try:
+        return metadata.version('tree-sitter-language-pack')
+    except metadata.PackageNotFoundError:
+        return 'unknown'
+
+
+class Manifest:
+    """코드베이스 파일별 파싱/업로드 상태를 보관하는 매니페스트."""
+
+    def __init__(self, path, grammar_version, files=None):
+        self.path = path
+        self.grammar_version = grammar_version
+        self.files = files if files is not None else {}
+
+    # 코드베이스의 매니페스트를 로드 (없거나 손상된 경우 빈 매니페스트 반환)
+    @classmethod
+    def load(cls, base_path):
+        path = get_state_dir(base_path) / MANIFEST_FILE_NAME
+        grammar_version = current_grammar_version()
+        if not path.exists():
+            return cls(path, grammar_version)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            console.print(f"[yellow]매니페스트를 읽을 수 없어 전체 파싱을 수행합니다: {e}[/yellow]")
+            return cls(path, grammar_version)
+
+        # 매니페스트 형식이나 문법 버전이 바뀌면 이전 기록은 신뢰할 수 없음
+        if data.get('version') != MANIFEST_VERSION or data.get('grammarVersion') != grammar_version:
+            return cls(path, grammar_version)
+        return cls(path, grammar_version, data.get('files', {}))
+
+    # 크기와 수정 시각만으로 변경 여부를 빠르게 판단 (파일을 읽지 않음)
+    def is_stat_unchanged(self, rel_path, stat_result):
+        entry = self.files.get(rel_path)
+        return bool(entry) and entry['size'] == stat_result.st_size and entry['mtimeNs'] == stat_result.st_mtime_ns
+
+    # 내용 해시와 언어가 마지막 업로드와 같은지 확인
+    def is_unchanged(self, rel_path, content_hash, lang_name):
+        entry = self.files.get(rel_path)
+        return bool(entry) and entry['hash'] == content_hash and entry['language'] == lang_name
+
+    # 마지막 업로드와 언어, AST 전송 형식, 가지치기 프로필이 같은지 확인 (다르면 내용이 같아도 다시 전송해야 함)
+    def is_same_upload(self, rel_path, lang_name, ast_format, prune_profile=None):
+        entry = self.files.get(rel_path)
+        return (bool(entry) and entry['language'] == lang_name and entry.get('astFormat') == ast_format
+                and entry.get('pruneProfile') == prune_profile)
+
+    # 내용은 같지만 수정 시각만 바뀐 파일의 stat 정보를 갱신
+    def touch(self, rel_path, stat_result):
+        entry = self.files.get(rel_path)
+        if entry:
+            entry['size'] = stat_result.st_size
+            entry['mtimeNs'] = stat_result.st_mtime_ns
+
+    # 업로드에 성공한 파일을 기록
+    def record(self, rel_path, content_hash, lang_name, stat_result, ast_format=None, prune_profile=None):
+        self.files[rel_path] = {
+            'hash': content_hash,
+            'language': lang_name,
+            'astFormat': ast_format,
+            'pruneProfile': prune_profile,
+            'size': stat_result.st_size,
+            'mtimeNs': stat_result.st_mtime_ns,
+            'uploadedAt': time.time(),
+        }
+
+    # 파일 기록을 제거
+    def remove(self, rel_path):
+        self.files.pop(rel_path, None)
+
+    # 현재 파일 목록에 없는(삭제된) 파일 경로 목록을 반환
+    def stale_paths(self, current_paths, scopes=None):
+        """scopes 를 지정하면 해당 경로(파일 또는 디렉토리, '' 는 루트 전체) 아래의 기록만 확인합니다."""
+        candidates = set(self.files)
+        if scopes is not None:
+            candidates = {rel_path for rel_path in candidates if _in_scopes(rel_path, scopes)}
+        return sorted(candidates - set(current_paths))
+
+    # 매니페스트를 원자적으로 저장 (임시 파일에 쓴 뒤 교체)
+    def save(self):
+        data = {
+            'version': MANIFEST_VERSION,
+            'grammarVersion': self.grammar_version,
+            'files': self.files,
+        }
+        tmp_path = self.path.with_suffix('.json.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.path)
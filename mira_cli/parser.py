@@ -1,199 +1,902 @@
 # 코드 파싱 및 백엔드 전송을 담당하는 모듈
 
+import base64
+import functools
+import itertools
 import os
 from pathlib import Path
-import requests
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from tree_sitter_language_pack import get_language, get_parser
-import fnmatch # glob 스타일 패턴 매칭을 위해 추가
 import json # JSON 디버깅을 위해 추가
 
-from mira_cli.config_loader import BACKEND_API_URL
-from mira_cli.utils import console
+from mira_cli.config_loader import (AST_FORMAT, SCAN_INCLUDE_UNTRACKED, SCAN_SOURCE, SYMBOLS_ENABLED, SYMBOLS_REFERENCES,
+                                    UPLOAD_STREAM_THRESHOLD_BYTES)
+from mira_cli.filefilter import SKIP_REASON_LABELS, check_size, read_classified_source
+from mira_cli.ignore import IgnoreMatcher
+from mira_cli.journal import RunJournal
+from mira_cli.manifest import Manifest, hash_bytes
+from mira_cli.profiler import PhaseProfiler
+from mira_cli.pruning import get_prune_profile, prune_profile_id
+from mira_cli.sharding import assign_shards, write_shard_manifest
+from mira_cli.symbols import SymbolIndex, extract_symbols
+from mira_cli.utils import console, STATE_DIR_NAME
 
+# 문법 패키지(tree_sitter_language_pack), requests, rich.progress 는 임포트 비용이 크므로
+# 실제로 파싱/전송할 때 함수 안에서 임포트합니다. (is_ignored 등만 쓰는 경우 시작 시간 단축)
+
+
+# 파일 확장자별 언어 매핑
+LANGUAGE_MAP = {
+    '.java': 'java',
+    '.py': 'python',
+    '.js': 'javascript',
+    '.ts': 'typescript',
+    '.c': 'c',
+    '.cpp': 'cpp',
+    '.go': 'go',
+    '.rs': 'rust',
+    '.php': 'php',
+    '.rb': 'ruby',
+    '.cs': 'c_sharp',
+    '.swift': 'swift',
+    '.kt': 'kotlin',
+    '.scala': 'scala',
+    '.html': 'html',
+    '.css': 'css',
+    '.json': 'json',
+    '.xml': 'xml',
+    '.yml': 'yaml',
+    '.yaml': 'yaml',
+    '.md': 'markdown',
+    '.sh': 'bash',
+    '.sql': 'sql',
+    '.vue': 'vue',
+    '.svelte': 'svelte',
+    '.jsx': 'javascript', # JSX는 JavaScript 파서 사용
+    '.tsx': 'typescript', # TSX는 TypeScript 파서 사용
+}
+
+# 언어별 파서 캐시 (프로세스마다 한 번만 생성하여 재사용)
+_parsers = {}
+
+# 증분 파싱 세션이 있어도 파일이 이보다 많으면 워커 프로세스로 병렬 파싱 (첫 파싱이나 --full 등)
+SESSION_MAX_SERIAL_FILES = 64
+
+# nested 형식 parse_result 의 최대 노드 깊이
+# (노드 하나가 딕셔너리와 children 리스트 두 단계이므로, 더 깊으면 json.dumps 와 pickle 이 재귀 한도에 걸릴 수 있음)
+NESTED_MAX_DEPTH = 200
+
+
+class TreeTooDeepError(Exception):
+    """구문 트리가 너무 깊어 nested 형식 parse_result 를 딕셔너리로 만들 수 없는 경우 발생하는 예외."""
+
+# 파일 확장자에 따른 파서 가져오기
+def _get_parser(file_extension):
+    lang_name = LANGUAGE_MAP.get(file_extension)
+    if not lang_name:
+        return None, None
+
+    if lang_name not in _parsers:
+        try:
+            from tree_sitter_language_pack import get_parser
+            parser = get_parser(lang_name) # type: ignore
+            _parsers[lang_name] = parser
+        except Exception as e:
+            console.print(f"[bold red]언어 파서 로드 오류 ({lang_name}):[/bold red] {e}")
+            return None, None
+    return _parsers[lang_name], lang_name
 
 # Tree-sitter 노드를 사용자 정의 AST 노드 형식으로 변환
-def convert_to_ast_node(sitter_node):
+def convert_to_ast_node(sitter_node, prune=None, stats=None, max_depth=None):
+    """
+    TreeCursor 로 트리를 반복(비재귀) 순회하여 중첩 딕셔너리 AST 를 만듭니다.
+    깊게 중첩된 코드에서도 파이썬 재귀 한도에 걸리지 않으며,
+    노드 텍스트는 루트의 소스 버퍼 하나를 잘라 사용하고 같은 위치의 position 딕셔너리는 공유합니다.
+    (반환된 AST 는 읽기 전용으로 취급해야 합니다.)
+    prune(PruneProfile)을 넘기면 루트를 제외한 노드에 가지치기를 적용하고,
+    stats 딕셔너리를 넘기면 전체/남긴 노드 수와 잘라낸 value 문자 수를 기록합니다.
+    max_depth 를 넘기면 그보다 깊은 노드가 있을 때 TreeTooDeepError 를 발생시킵니다.
+    """
     if not sitter_node:
         return None
 
-    node_value = ""
-    if sitter_node.is_named and sitter_node.text:
-        node_value = sitter_node.text.decode('utf-8')
+    source = sitter_node.text or b''
+    base_byte = sitter_node.start_byte
+    positions = {}
+
+    # 같은 (row, column) 위치는 하나의 딕셔너리를 재사용
+    def _position(point):
+        position = positions.get(point)
+        if position is None:
+            position = positions[point] = {"row": point[0], "column": point[1]}
+        return position
+
+    max_value_length = prune.max_value_length if prune is not None else 0
+    kept_count = truncated_chars = 0
+    cursor = sitter_node.walk()
+    root_ast_node = None
+    open_children = [] # 현재 노드의 조상들이 가진 children 리스트 스택
+    while True:
+        node = cursor.node
+        # 루트(open_children 가 빈 경우)는 가지치기하지 않음
+        if prune is not None and open_children and not prune.keeps(node):
+            children = None # 하위 트리 전체 제거
+        elif prune is not None and open_children and prune.collapses(node):
+            children = open_children[-1] # 노드 대신 하나뿐인 자식을 부모에 연결
+        else:
+            node_value = ""
+            if node.is_named:
+                node_value = source[node.start_byte - base_byte:node.end_byte - base_byte].decode('utf-8')
+                if max_value_length and len(node_value) > max_value_length:
+                    truncated_chars += len(node_value) - max_value_length
+                    node_value = node_value[:max_value_length]
+
+            ast_node = {
+                "type": node.type,
+                "value": node_value,
+                "startPosition": _position(node.start_point),
+                "endPosition": _position(node.end_point),
+                "children": []
+            }
+            kept_count += 1
+            if open_children:
+                open_children[-1].append(ast_node)
+            else:
+                root_ast_node = ast_node
+            children = ast_node["children"]
+
+        if children is not None and cursor.goto_first_child():
+            if max_depth is not None and len(open_children) >= max_depth:
+                raise TreeTooDeepError(f"구문 트리 깊이가 {max_depth} 를 넘습니다.")
+            open_children.append(children)
+            continue
+        while True:
+            if not open_children:
+                if stats is not None:
+                    stats["nodes"] = stats.get("nodes", 0) + sitter_node.descendant_count
+                    stats["keptNodes"] = stats.get("keptNodes", 0) + kept_count
+                    stats["truncatedChars"] = stats.get("truncatedChars", 0) + truncated_chars
+                return root_ast_node
+            if cursor.goto_next_sibling():
+                break
+            cursor.goto_parent()
+            open_children.pop()
+
+# 전송 형식 식별자 (parse_result 의 "format" 필드 값)
+NESTED_FORMAT = 'nested'
+COMPACT_FORMAT = 'compact-v1'
+# 이전 전송 결과에 대한 AST 패치 (증분 파싱 세션에서만 생성, mira_cli.incremental 참고)
+PATCH_FORMAT = 'ast-patch-v1'
+
+# Tree-sitter 트리를 소스 중복 없는 compact AST 형식으로 변환
+def convert_to_compact_ast(tree, prune=None, stats=None):
+    """
+    노드를 전위 순회 순서의 컬럼형 배열로 변환합니다.
+    각 노드는 타입 ID(언어 문법의 kind_id), 바이트 오프셋, named 여부, 자식 인덱스만 가지며
+    노드 텍스트는 파일 소스(parse_result 의 "source")를 바이트 범위로 잘라 복원합니다.
+    트리 대신 노드를 넘기면 해당 하위 트리만 변환합니다. (바이트 오프셋은 파일 기준 그대로 유지)
+    prune 과 stats 는 convert_to_ast_node 와 같습니다. (value 가 없으므로 길이 제한은 적용하지 않음)
+    """
+    type_table = {}
+    node_types, start_bytes, end_bytes, named, children = [], [], [], [], []
+
+    cursor = tree.walk()
+    ancestors = []
+    while True:
+        node = cursor.node
+        # 루트(ancestors 가 빈 경우)는 가지치기하지 않음
+        if prune is not None and ancestors and not prune.keeps(node):
+            index = None # 하위 트리 전체 제거
+        elif prune is not None and ancestors and prune.collapses(node):
+            index = ancestors[-1] # 노드 대신 하나뿐인 자식을 부모에 연결
+        else:
+            index = len(node_types)
+            type_table.setdefault(str(node.kind_id), node.type)
+            node_types.append(node.kind_id)
+            start_bytes.append(node.start_byte)
+            end_bytes.append(node.end_byte)
+            named.append(1 if node.is_named else 0)
+            children.append([])
+            if ancestors:
+                children[ancestors[-1]].append(index)
 
-    ast_node = {
-        "type": sitter_node.type,
-        "value": node_value,
-        "startPosition": {"row": sitter_node.start_point[0], "column": sitter_node.start_point[1]},
-        "endPosition": {"row": sitter_node.end_point[0], "column": sitter_node.end_point[1]},
-        "children": []
-    }
+        if index is not None and cursor.goto_first_child():
+            ancestors.append(index)
+            continue
+        while not cursor.goto_next_sibling():
+            if not cursor.goto_parent():
+                if stats is not None:
+                    root = tree.root_node if hasattr(tree, 'root_node') else tree
+                    stats["nodes"] = stats.get("nodes", 0) + root.descendant_count
+                    stats["keptNodes"] = stats.get("keptNodes", 0) + len(node_types)
+                return {
+                    "typeTable": type_table,
+                    "nodes": {
+                        "type": node_types,
+                        "startByte": start_bytes,
+                        "endByte": end_bytes,
+                        "named": named,
+                        "children": children,
+                    },
+                }
+            ancestors.pop()
 
-    for child in sitter_node.children:
-        ast_node["children"].append(convert_to_ast_node(child))
-    
-    return ast_node
+# 기본 제외 패턴 (.gitignore 문법, 코드베이스의 .gitignore 보다 우선순위가 낮음)
+# TODO: 이 기본 제외 패턴들을 설정 파일 등을 통해 사용자 정의 가능하도록 개선 고려
+DEFAULT_IGNORE_PATTERNS = [
+    'venv/',
+    '__pycache__/',
+    '.git/',
+    '.idea/',
+    '*.pyc', '*.class', '*.jar', '*.war', '*.ear', # 컴파일된 파일
+    'node_modules/', # JavaScript 프로젝트
+    'build/', # 빌드 디렉토리
+    'dist/', # 배포 디렉토리
+    'target/', # Maven/Gradle 빌드 디렉토리
+    '*.log', '*.tmp', '*.temp', # 로그 및 임시 파일
+    '/config.ini', # 설정 파일
+    '/requirements.txt', # 의존성 파일 (파싱 대상 아님)
+    '/pyproject.toml', # 프로젝트 설정 파일 (파싱 대상 아님)
+    '/README.md', # README 파일 (파싱 대상 아님)
+    '/tests/', # 테스트 파일 (파싱 대상 아님)
+    f'/{STATE_DIR_NAME}/', # MIRA 로컬 상태 디렉토리
+]
 
-# .gitignore 파일에서 무시 패턴을 로드
+# 코드베이스의 무시 규칙을 로드
 def load_gitignore_patterns(base_path):
     """
-    .gitignore 파일에서 패턴을 읽어옵니다.
-    """
-    gitignore_path = Path(base_path) / ".gitignore"
-    patterns = []
-    if gitignore_path.exists():
-        with open(gitignore_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#'):
-                    # .gitignore 패턴을 fnmatch에 맞게 조정
-                    if line.startswith('/'):
-                        line = line[1:] # 루트 기준 패턴
-                    elif line.startswith('**/'):
-                        pass # 그대로 사용
-                    else:
-                        line = '**/' + line # 모든 하위 디렉토리에서 매칭
-                    patterns.append(line)
-    return patterns
+    루트와 하위 디렉토리의 .gitignore, .git/info/exclude, 기본 제외 패턴을
+    하나의 git 호환 매처(IgnoreMatcher)로 컴파일하여 반환합니다.
+    """
+    return IgnoreMatcher(base_path, DEFAULT_IGNORE_PATTERNS)
 
 # 파일 경로가 무시 패턴에 해당하는지 확인
 def is_ignored(file_path, base_path, ignore_patterns):
     """
-    파일 경로가 무시 패턴에 해당하는지 확인합니다.
+    파일 경로가 무시 규칙에 해당하는지 확인합니다. (무시된 디렉토리 아래의 경로 포함)
+    ignore_patterns 는 load_gitignore_patterns 가 반환한 매처입니다.
     """
-    relative_path = str(file_path.relative_to(base_path))
-    for pattern in ignore_patterns:
-        if fnmatch.fnmatch(relative_path, pattern):
-            return True
-    return False
+    file_path = Path(file_path)
+    relative_path = file_path.relative_to(base_path).as_posix()
+    return ignore_patterns.is_ignored(relative_path, is_dir=file_path.is_dir())
 
-# 코드베이스를 파싱하고 백엔드로 전송
-def parse_codebase_and_send_to_backend(path):
-    console.print(f"[bold green]'{path}'[/bold green] 파싱을 시작합니다...")
+# 파싱 결과를 지정된 전송 형식의 parse_result 로 변환
+def _build_parse_result(file_path, lang_name, tree, source_code, ast_format, prune_report=False):
+    """
+    언어에 가지치기 프로필이 있으면 적용하고, 적용한 설정과 노드 수를 "pruning" 필드에 기록합니다.
+    prune_report=True 이면 가지치기 전후의 JSON 크기를 "pruning" 의 "report" 에 추가합니다. (전송 전에 제거)
+    """
+    prune = get_prune_profile(lang_name)
+    stats = {} if prune is not None else None
+    if ast_format == COMPACT_FORMAT:
+        # 소스는 파일당 한 번만 전송 (UTF-8 이 아니면 base64 로 인코딩하여 바이트 오프셋 유지, mmap 소스도 지원)
+        try:
+            source, source_encoding = str(source_code, 'utf-8'), 'utf-8'
+        except UnicodeDecodeError:
+            source, source_encoding = base64.b64encode(source_code).decode('ascii'), 'base64'
+        ast_key, convert, root = "ast", convert_to_compact_ast, tree
+        parse_result = {
+            "filePath": str(file_path),
+            "language": lang_name,
+            "format": COMPACT_FORMAT,
+            "source": source,
+            "sourceEncoding": source_encoding,
+            "ast": convert_to_compact_ast(tree, prune, stats),
+        }
+    else:
+        # 너무 깊은 트리는 TreeTooDeepError (호출 측에서 스트리밍 전송으로 처리)
+        ast_key, root = "rootNode", tree.root_node
+        convert = functools.partial(convert_to_ast_node, max_depth=NESTED_MAX_DEPTH)
+        parse_result = {
+            "filePath": str(file_path),
+            "language": lang_name,
+            "format": NESTED_FORMAT,
+            "rootNode": convert(tree.root_node, prune, stats)
+        }
+    if prune is None:
+        return parse_result
 
-    # .gitignore 패턴 로드
-    ignore_patterns = load_gitignore_patterns(path)
-    # 추가적인 기본 제외 패턴 (가상 환경, 빌드 디렉토리 등)
-    # TODO: 이 기본 제외 패턴들을 설정 파일 등을 통해 사용자 정의 가능하도록 개선 고려
-    default_ignore_patterns = [
-        'venv/', 'venv/**',
-        '__pycache__/', '__pycache__/**',
-        '.git/', '.git/**',
-        '.idea/', '.idea/**',
-        '*.pyc', '*.class', '*.jar', '*.war', '*.ear', # 컴파일된 파일
-        'node_modules/', 'node_modules/**', # JavaScript 프로젝트
-        'build/', 'build/**', # 빌드 디렉토리
-        'dist/', 'dist/**', # 배포 디렉토리
-        'target/', 'target/**', # Maven/Gradle 빌드 디렉토리
-        '*.log', '*.tmp', '*.temp', # 로그 및 임시 파일
-        'config.ini', # 설정 파일
-        'requirements.txt', # 의존성 파일 (파싱 대상 아님)
-        'pyproject.toml', # 프로젝트 설정 파일 (파싱 대상 아님)
-        'README.md', # README 파일 (파싱 대상 아님)
-        'tests/', 'tests/**', # 테스트 파일 (파싱 대상 아님)
-    ]
-    ignore_patterns.extend(default_ignore_patterns)
-
-    # 파일 확장자별 언어 매핑
-    language_map = {
-        '.java': 'java',
-        '.py': 'python',
-        '.js': 'javascript',
-        '.ts': 'typescript',
-        '.c': 'c',
-        '.cpp': 'cpp',
-        '.go': 'go',
-        '.rs': 'rust',
-        '.php': 'php',
-        '.rb': 'ruby',
-        '.cs': 'c_sharp',
-        '.swift': 'swift',
-        '.kt': 'kotlin',
-        '.scala': 'scala',
-        '.html': 'html',
-        '.css': 'css',
-        '.json': 'json',
-        '.xml': 'xml',
-        '.yml': 'yaml',
-        '.yaml': 'yaml',
-        '.md': 'markdown',
-        '.sh': 'bash',
-        '.sql': 'sql',
-        '.vue': 'vue',
-        '.svelte': 'svelte',
-        '.jsx': 'javascript', # JSX는 JavaScript 파서 사용
-        '.tsx': 'typescript', # TSX는 TypeScript 파서 사용
-    }
-
-    parsers = {}
-
-    # 파일 확장자에 따른 파서 가져오기
-    def _get_parser(file_extension):
-        lang_name = language_map.get(file_extension)
-        if not lang_name:
-            return None, None
+    parse_result["pruning"] = {**prune.describe(), **stats}
+    if prune_report:
+        unpruned = {key: value for key, value in parse_result.items() if key != "pruning"}
+        unpruned[ast_key] = convert(root)
+        parse_result["pruning"]["report"] = {"originalBytes": _json_size(unpruned), "bytes": _json_size(parse_result)}
+    return parse_result
+
+# 업로드 시와 같은 방식으로 직렬화한 JSON 크기 (바이트)
+def _json_size(data):
+    return len(json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8'))
+
+# 파일 하나를 읽고 파싱하여 전송용 결과를 생성 (워커 프로세스에서도 실행됨)
+def _parse_file(file_path, known_hash=None, ast_format=NESTED_FORMAT, profile=False, symbols=False, prune_report=False,
+                stream=False):
+    """
+    파일을 읽어 해시를 계산하고, known_hash 와 같으면 파싱을 건너뜁니다.
+    반환값: (상태, 내용 해시, parse_result 또는 오류 메시지, 심볼 목록, 단계별 측정 이벤트 목록)
+    상태는 'parsed', 'unchanged', 'skipped', 'deep', 'error' 중 하나이며, 측정 이벤트는 profile=True 일 때만 채워집니다.
+    바이너리이거나 압축/생성된 파일은 해시 계산과 파싱 없이 'skipped' 와 건너뛴 사유(filefilter.SKIP_*)를 반환합니다.
+    구문 트리가 NESTED_MAX_DEPTH 보다 깊어 parse_result 를 만들 수 없으면 'deep' 을 반환합니다. (stream=True 로 다시 처리)
+    symbols=True 이면 로컬 심볼 인덱스용 정의/참조를 추출하고 (아니면 None),
+    ast_format 이 None 이면 전송용 결과를 만들지 않습니다. (심볼 인덱스만 채우는 경우)
+    prune_report 는 _build_parse_result 와 같습니다.
+    stream=True 이면 parse_result 대신 전송 시 JSON 을 청크 단위로 생성하는 StreamingParseResult 를 반환합니다.
+    (구문 트리를 참조하므로 현재 프로세스에서만 사용하며, prune_report 는 적용하지 않음)
+    """
+    profiler = PhaseProfiler(enabled=profile)
+    try:
+        parser, lang_name = _get_parser(file_path.suffix)
+        if not parser:
+            return 'error', None, f"언어 파서 로드 실패: {file_path}", None, profiler.events
 
-        if lang_name not in parsers:
+        with profiler.phase('read', file_path, lang_name) as event:
+            # 바이너리/압축 파일은 앞부분만 읽고 건너뜀
+            source_code, skip_reason = read_classified_source(file_path, lang_name)
+            event['bytes'] = len(source_code) if source_code is not None else 0
+        if skip_reason is not None:
+            return 'skipped', None, skip_reason, None, profiler.events
+
+        # 수정 시각만 바뀌고 내용은 같은 경우는 파싱하지 않음
+        with profiler.phase('hash', file_path, lang_name) as event:
+            content_hash = hash_bytes(source_code)
+            event['bytes'] = len(source_code)
+        if content_hash == known_hash:
+            return 'unchanged', content_hash, None, None, profiler.events
+
+        with profiler.phase('parse', file_path, lang_name) as event:
+            tree = parser.parse(source_code)
+            event['bytes'] = len(source_code)
+        file_symbols = parse_result = None
+        if symbols:
+            with profiler.phase('symbols', file_path, lang_name):
+                file_symbols = extract_symbols(tree, source_code, SYMBOLS_REFERENCES)
+        if ast_format is not None and stream:
+            from mira_cli.streaming import StreamingParseResult
+            parse_result = StreamingParseResult(file_path, lang_name, tree, source_code, ast_format)
+        elif ast_format is not None:
             try:
-                parser = get_parser(lang_name) # type: ignore
-                parsers[lang_name] = parser
-            except Exception as e:
-                console.print(f"[bold red]언어 파서 로드 오류 ({lang_name}):[/bold red] {e}")
-                return None, None
-        return parsers[lang_name], lang_name
-
-    all_files_to_parse = []
-    # 디렉토리 순회하며 파싱할 파일 목록 생성
-    for root, dirs, files in os.walk(path):
-        # 제외 디렉토리 처리
-        dirs[:] = [d for d in dirs if not is_ignored(Path(root) / d, Path(path), ignore_patterns)]
-
-        for file in files:
-            file_path = Path(root) / file
-            if not is_ignored(file_path, Path(path), ignore_patterns):
-                all_files_to_parse.append(file_path)
+                with profiler.phase('convert', file_path, lang_name):
+                    parse_result = _build_parse_result(file_path, lang_name, tree, source_code, ast_format,
+                                                       prune_report)
+            except TreeTooDeepError:
+                return 'deep', content_hash, None, file_symbols, profiler.events
+        return 'parsed', content_hash, parse_result, file_symbols, profiler.events
+    except Exception as e:
+        return 'error', None, str(e), None, profiler.events
+
+# 구문 트리가 너무 깊은 파일은 현재 프로세스에서 다시 파싱하여 스트리밍 결과로 대체
+def _stream_deep_files(parsed_files, ast_format, profile=False, symbols=False):
+    """
+    nested 딕셔너리는 json.dumps 와 pickle 이 재귀 한도에 걸리므로,
+    비재귀 인코더(StreamingParseResult)로 전송하면서 JSON 을 생성합니다.
+    """
+    for task, result in parsed_files:
+        if result[0] == 'deep':
+            result = _parse_file(task[0], task[1], ast_format, profile, symbols, stream=True)
+        yield task, result
+
+# 파싱 작업을 실행하고 완료되는 순서대로 (작업, 결과)를 반환
+def _iter_parsed_files(tasks, jobs, ast_format=NESTED_FORMAT, profile=False, symbols=False, prune_report=False,
+                       mp_start_method=None):
+    """
+    tasks 는 (file_path, known_hash, context) 튜플의 목록입니다.
+    jobs 가 1 이하이면 현재 프로세스에서 순차 실행하고,
+    그 외에는 워커 프로세스 풀에서 병렬로 파싱합니다.
+    mp_start_method 를 넘기면 워커 프로세스를 해당 방식('forkserver', 'spawn')으로 시작합니다. (기본값은 플랫폼 기본 방식)
+    결과가 메모리에 과도하게 쌓이지 않도록 동시에 제출하는 작업 수를 제한합니다.
+    """
+    if jobs <= 1:
+        for task in tasks:
+            yield task, _parse_file(task[0], task[1], ast_format, profile, symbols, prune_report)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+    mp_context = None
+    if mp_start_method is not None:
+        import multiprocessing
+        mp_context = multiprocessing.get_context(mp_start_method)
+    max_pending = jobs * 4
+    task_iter = iter(tasks)
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=mp_context) as executor:
+        pending = {}
+        try:
+            while True:
+                while len(pending) < max_pending:
+                    task = next(task_iter, None)
+                    if task is None:
+                        break
+                    pending[executor.submit(_parse_file, task[0], task[1], ast_format, profile, symbols,
+                                            prune_report)] = task
+                if not pending:
+                    break
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    task = pending.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        # 결과 전달 실패(예: 매우 깊은 AST 의 pickle RecursionError)는 해당 파일의 오류로 처리
+                        result = 'error', None, f"{task[0]}: {type(e).__name__}: {e}", None, []
+                    yield task, result
+        finally:
+            # 호출 측이 중단(연결 오류 등)한 경우 아직 시작하지 않은 작업은 취소
+            for future in pending:
+                future.cancel()
+
+# git 인덱스 기준 스캔 대상 상대 경로 목록 (디렉토리를 순회해야 하면 None)
+def _git_scan_paths(path, source=None, include_untracked=None):
+    """
+    source 가 'auto' 또는 'git' 이면 git 인덱스의 추적 파일 목록을 반환합니다.
+    (include_untracked 이면 추적하지 않지만 .gitignore 로 무시되지 않은 파일도 포함)
+    git 저장소가 아니거나 인덱스를 읽을 수 없으면 None 을 반환합니다.
+    """
+    from mira_cli.gitindex import GitIndexError, find_git_dir, list_untracked_paths, read_index_paths
+
+    source = source or SCAN_SOURCE
+    include_untracked = SCAN_INCLUDE_UNTRACKED if include_untracked is None else include_untracked
+    git_dir = find_git_dir(path) if source in ('auto', 'git') else None
+    if git_dir is None:
+        if source == 'git':
+            console.print(f"[yellow]git 저장소가 아니므로 디렉토리를 순회합니다: {path}[/yellow]")
+        return None
+    try:
+        rel_paths = read_index_paths(git_dir)
+        if include_untracked:
+            rel_paths = sorted(set(rel_paths).union(list_untracked_paths(path)))
+    except GitIndexError as e:
+        console.print(f"[yellow]{e} 디렉토리를 순회합니다.[/yellow]")
+        return None
+    return rel_paths
+
+# 코드베이스 전체의 파싱 대상 파일 목록 (git 저장소이면 디렉토리 순회 대신 git 인덱스 사용)
+def _iter_codebase_files(path, ignore_patterns, source=None, include_untracked=None):
+    """git 인덱스를 사용하면 그 중 지원하는 확장자이고 무시 대상이 아닌 파일만 반환합니다. (_git_scan_paths 참고)"""
+    rel_paths = _git_scan_paths(path, source, include_untracked)
+    if rel_paths is None:
+        return ignore_patterns.iter_files()
+    return (Path(path) / rel_path for rel_path in rel_paths
+            if os.path.splitext(rel_path)[1] in LANGUAGE_MAP and not ignore_patterns.is_ignored(rel_path))
+
+# 변경된 경로 목록을 파싱 대상 파일 목록으로 확장
+def _expand_changed_paths(path, changed_paths, ignore_patterns, source=None, include_untracked=None):
+    """
+    changed_paths 는 루트 기준 '/' 구분 상대 경로 목록입니다. ('' 는 루트 전체)
+    존재하는 디렉토리는 하위의 무시되지 않은 파일 전체로, 존재하는 파일은 무시 대상이 아닐 때만 포함합니다.
+    .gitignore 가 바뀐 경우 해당 디렉토리 전체를 다시 확인하도록 범위를 넓혀 (범위 목록, 파일 목록)을 반환합니다.
+    전체 스캔(_iter_codebase_files)이 추적하지 않는 파일을 제외하는 설정이면 여기서도 같은 파일만 포함합니다.
+    """
+    scopes = set()
+    for rel_path in changed_paths:
+        name = rel_path.rsplit('/', 1)[-1]
+        if name == '.gitignore':
+            rel_path = rel_path.rpartition('/')[0]
+        scopes.add(rel_path)
+    # 상위 범위에 포함되는 범위는 제외
+    scopes = sorted(scope for scope in scopes
+                    if not any(other != scope and (other == '' or scope.startswith(other + '/')) for other in scopes))
+
+    files = []
+    for scope in scopes:
+        file_path = Path(path) / scope
+        if file_path.is_dir():
+            files.extend(ignore_patterns.iter_files(scope))
+        elif file_path.is_file() and not ignore_patterns.is_ignored(scope):
+            files.append(file_path)
+
+    include_untracked = SCAN_INCLUDE_UNTRACKED if include_untracked is None else include_untracked
+    if not include_untracked:
+        # 디렉토리 순회로 찾은 파일 중 추적하지 않는 파일은 제외 (git 인덱스를 사용하지 않으면 그대로)
+        tracked = _git_scan_paths(path, source, include_untracked=False)
+        if tracked is not None:
+            tracked = set(tracked)
+            files = [file_path for file_path in files if file_path.relative_to(path).as_posix() in tracked]
+    return scopes, files
+
+# 파싱하지 않은 미변경 파일 중 심볼 인덱스에 없거나 내용이 다른 파일을 인덱싱 (인덱스가 처음 만들어진 경우 등)
+def _backfill_symbol_index(symbol_index, manifest, unchanged_files, jobs, profiler, mp_start_method=None):
+    indexed_hashes = symbol_index.file_hashes()
+    tasks = [(file_path, None, rel_path) for file_path, rel_path in unchanged_files
+             if indexed_hashes.get(rel_path) != manifest.files[rel_path]['hash']]
+    if not tasks:
+        return
+    console.print(f"로컬 심볼 인덱스에 파일 {len(tasks)}개를 추가합니다...")
+    jobs = max(1, min(jobs, len(tasks)))
+    parsed_files = _iter_parsed_files(tasks, jobs, ast_format=None, profile=profiler.enabled, symbols=True,
+                                      mp_start_method=mp_start_method)
+    for (_, _, rel_path), (status, content_hash, _, file_symbols, events) in parsed_files:
+        profiler.add_events(events)
+        if status == 'parsed':
+            symbol_index.replace_file(rel_path, content_hash, file_symbols)
+
+# parse_result 의 가지치기 기록을 언어별 집계에 더함 (크기 측정 결과는 전송하지 않도록 꺼냄)
+def _add_prune_totals(prune_totals, lang_name, pruning):
+    entry = prune_totals.setdefault(lang_name, {"files": 0, "nodes": 0, "keptNodes": 0, "truncatedChars": 0,
+                                                "originalBytes": 0, "bytes": 0})
+    entry["files"] += 1
+    for key in ("nodes", "keptNodes", "truncatedChars"):
+        entry[key] += pruning.get(key, 0)
+    report = pruning.pop("report", None)
+    if report:
+        entry["originalBytes"] += report["originalBytes"]
+        entry["bytes"] += report["bytes"]
+
+# 가지치기 결과 요약 출력 (prune_report=True 이면 언어별 전송 크기 절감량 표)
+def _print_prune_summary(prune_totals, prune_report):
+    nodes = sum(entry["nodes"] for entry in prune_totals.values())
+    dropped = nodes - sum(entry["keptNodes"] for entry in prune_totals.values())
+    console.print(f"AST 가지치기: 노드 {nodes:,}개 중 {dropped:,}개 제거 ({dropped / nodes * 100 if nodes else 0:.1f}%)")
+    if not prune_report:
+        return
+
+    from rich.table import Table
+    table = Table(title="AST 가지치기 전송 크기")
+    for column in ("언어", "파일", "제거 노드", "잘린 문자", "원본 KB", "전송 KB", "절감"):
+        table.add_column(column, justify="left" if column == "언어" else "right")
+    for lang_name, entry in sorted(prune_totals.items(), key=lambda item: item[1]["originalBytes"], reverse=True):
+        saved = entry["originalBytes"] - entry["bytes"]
+        table.add_row(lang_name, str(entry["files"]), f"{entry['nodes'] - entry['keptNodes']:,}",
+                      f"{entry['truncatedChars']:,}", f"{entry['originalBytes'] / 1e3:.1f}", f"{entry['bytes'] / 1e3:.1f}",
+                      f"{saved / entry['originalBytes'] * 100 if entry['originalBytes'] else 0:.1f}%")
+    console.print(table)
+
+# 건너뛴 파일을 사유별 집계에 더함
+def _add_skipped(skipped_totals, reason, rel_path, size):
+    entry = skipped_totals.setdefault(reason, {"files": 0, "bytes": 0, "paths": []})
+    entry["files"] += 1
+    entry["bytes"] += size
+    entry["paths"].append(rel_path)
+
+# 건너뛴 파일의 사유별 개수와 크기 출력 (사유마다 예시 경로 몇 개 포함)
+def _print_skip_summary(skipped_totals):
+    for reason, entry in sorted(skipped_totals.items(), key=lambda item: item[1]["bytes"], reverse=True):
+        examples = ', '.join(entry["paths"][:3]) + (' ...' if entry["files"] > 3 else '')
+        console.print(f"[yellow]건너뛴 파일 ({SKIP_REASON_LABELS.get(reason, reason)}): {entry['files']}개, "
+                      f"{entry['bytes'] / 1e6:.1f} MB - {examples}[/yellow]")
+
+# 삭제된 파일 목록을 백엔드에 제거 요청으로 전송 (spool 을 넘기면 스풀 파일에 기록)
+def _report_removed_files(path, removed_rel_paths, manifest, spool=None):
+    if not removed_rel_paths:
+        return True
+    import requests
+    from mira_cli.http_client import get_client, report_request_error
+
+    file_paths = [str(Path(path) / rel_path) for rel_path in removed_rel_paths]
+    if spool is not None:
+        spool.add_removed(file_paths)
+    else:
+        try:
+            get_client().post("/parser/remove", json={"filePaths": file_paths})
+        except requests.exceptions.RequestException as e:
+            report_request_error(e)
+            return False
+    # 제거 요청이 성공한 경우에만 매니페스트에서 삭제 (실패 시 다음 실행에서 재시도)
+    for rel_path in removed_rel_paths:
+        manifest.remove(rel_path)
+    console.print(f"삭제된 파일 {len(removed_rel_paths)}개를 {'스풀 파일에 기록' if spool is not None else '백엔드에 전송'}했습니다.")
+    return True
+
+# 코드베이스를 파싱하고 백엔드로 전송
+def parse_codebase_and_send_to_backend(path, full=False, jobs=None, upload_mode=None, ast_format=None, profiler=None,
+                                       changed_paths=None, session=None, prune_report=False, resume=False,
+                                       spool_path=None, shard=None, mp_start_method=None):
+    """
+    코드베이스를 파싱하여 백엔드로 전송합니다.
+    기본적으로 매니페스트(.mira/manifest.json)와 비교해 변경된 파일만 전송하며,
+    full=True 이면 매니페스트를 무시하고 모든 파일을 다시 전송합니다.
+    jobs 는 파싱 워커 프로세스 수이며, 지정하지 않으면 CPU 코어 수를 사용합니다.
+    upload_mode 는 업로드 방식('bulk' 또는 'single')이며, 지정하지 않으면 config.ini 설정을 따릅니다.
+    ast_format 은 AST 전송 형식('nested' 또는 'compact-v1')이며, 지정하지 않으면 config.ini 설정을 따릅니다.
+    profiler 를 넘기면 단계별(scan, read, parse, convert, encode, upload 등) 소요 시간을 기록합니다.
+    changed_paths 를 넘기면 전체 코드베이스 대신 해당 상대 경로(파일 또는 디렉토리)만 확인하여
+    변경된 파일은 전송하고, 사라졌거나 무시 대상이 된 파일은 삭제로 보고합니다. (watch 명령어에서 사용)
+    session(IncrementalSession)을 넘기면 파일별 이전 구문 트리를 기준으로 현재 프로세스에서 증분 파싱하고,
+    바뀐 하위 트리만 AST 패치로 전송합니다. (패치를 보낼 수 없으면 전체 parse_result 를 전송)
+    config.ini 의 [symbols] enabled 가 켜져 있으면 파싱한 파일의 정의/참조를 로컬 심볼 인덱스에 기록합니다.
+    [pruning] 프로필이 적용된 언어가 있으면 제거한 노드 수를 출력하며, prune_report=True 이면
+    가지치기 전후의 전송 크기를 언어별로 측정하여 표로 출력합니다. (파일마다 가지치기 전 AST 를 한 번 더 변환)
+    config.ini 의 [upload] stream_threshold_bytes 이상인 파일은 upload_mode 와 관계없이 JSON 을 생성하면서
+    파일별 경로로 스트리밍 전송합니다. (parse_result 전체를 메모리에 만들지 않음)
+    코드베이스 전체를 전송할 때는 파일별 업로드 결과를 저널(.mira/journal.jsonl)에 바로 기록하며,
+    중단된 실행의 저널이 있으면 전송을 마친 파일을 매니페스트에 먼저 반영합니다.
+    resume=True 이면 중단된 실행의 설정(full, ast_format)을 이어받아 남은 파일과 실패한 파일만 전송합니다.
+    업로드는 전송 스레드에서 파싱과 겹쳐 진행되며, 진행률 표시에 전송 대기열 깊이와 전송 중인 요청 수를 함께 표시합니다.
+    spool_path 를 넘기면 백엔드 대신 해당 스풀 파일에 파싱 결과와 삭제 목록을 추가하며 (replay 명령어로 나중에 전송),
+    기록한 파일은 전송한 것으로 매니페스트에 기록합니다. (session 과 함께 사용할 수 없음)
+    shard=(i, N) 이면 전체 파일 목록을 N 개로 나눈 것 중 i 번째 샤드의 파일만 처리하고
+    샤드 매니페스트(.mira/shard-<i>-of-<N>.json)를 저장합니다. (삭제된 파일은 매니페스트에 그 파일이 있는 샤드가 보고)
+    mp_start_method 는 파싱 워커 프로세스의 시작 방식입니다. 다른 스레드가 실행 중인 프로세스(데몬)에서는
+    fork 로 시작한 워커가 교착될 수 있으므로 'forkserver' 또는 'spawn' 을 넘깁니다.
+    """
+    import requests
+    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, MofNCompleteColumn
+    from mira_cli.http_client import report_request_error
+    from mira_cli.streaming import StreamingParseResult
+    from mira_cli.uploader import ParseResultUploader
+
+    profiler = profiler or PhaseProfiler(enabled=False)
+    console.print(f"[bold green]'{path}'[/bold green] 파싱을 시작합니다...")
+    spool = None
+    if spool_path is not None:
+        from mira_cli.spool import SpoolFormatError, SpoolWriter
+        try:
+            spool = SpoolWriter(spool_path, profiler=profiler)
+        except (SpoolFormatError, OSError) as e:
+            console.print(f"[bold red]오류:[/bold red] 스풀 파일을 열 수 없습니다: {e}")
+            return False
+    manifest = Manifest.load(path)
+    symbol_index = SymbolIndex.open(path) if SYMBOLS_ENABLED else None
+    journal = RunJournal.load(path, manifest.grammar_version) if changed_paths is None else None
+    resumed_rel_paths = retry_rel_paths = frozenset()
+    if journal is not None and journal.pending:
+        # 중단 시점까지 전송한 파일은 매니페스트에 반영 (강제 종료로 매니페스트를 저장하지 못한 경우 포함)
+        manifest.files.update(journal.uploaded)
+        manifest.save()
+        if resume:
+            full = full or journal.options.get('full', False)
+            ast_format = ast_format or journal.options.get('astFormat')
+            shard = shard or journal.options.get('shard')
+            resumed_rel_paths, retry_rel_paths = frozenset(journal.uploaded), frozenset(journal.failed)
+            console.print(f"중단된 실행을 이어서 진행합니다. (전송 완료 {len(resumed_rel_paths)}개, "
+                          f"다시 전송할 실패 파일 {len(retry_rel_paths)}개)")
+        else:
+            console.print(f"[yellow]이전 실행이 완료되지 않았습니다. (실패 {len(journal.failed)}개) "
+                          f"남은 파일부터 이어서 전송하려면 --resume 옵션을 사용하세요.[/yellow]")
+    elif resume:
+        console.print("[yellow]이어서 진행할 중단된 실행이 없어 새로 시작합니다.[/yellow]")
+
+    # 무시 규칙을 적용해 파싱할 파일 목록 생성 (무시된 디렉토리는 하위 트리 전체를 건너뜀)
+    with profiler.phase('scan'):
+        ignore_patterns = load_gitignore_patterns(path)
+        if changed_paths is None:
+            scopes = None
+            all_files_to_parse = list(_iter_codebase_files(path, ignore_patterns))
+        else:
+            scopes, all_files_to_parse = _expand_changed_paths(path, changed_paths, ignore_patterns)
 
     all_parsed_successfully = True
-    # 파싱 진행률 표시
-    with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}"), console=console) as progress:
-        task = progress.add_task("[green]파일 파싱 및 백엔드 전송 중...", total=len(all_files_to_parse))
-        for file_path in all_files_to_parse:
-            file_extension = file_path.suffix
-            parser, lang_name = _get_parser(file_extension)
-
-            if not parser:
-                console.print(f"[yellow]지원되지 않는 파일 형식 또는 파서 로드 실패: {file_path}[/yellow]")
-                progress.update(task, advance=1)
-                continue
+    current_rel_paths = []
+    unchanged_count = 0
+    unchanged_files = [] # 읽거나 파싱하지 않은 미변경 파일 (심볼 인덱스 보충용)
+    skipped_totals = {} # 건너뛴 사유 -> {"files", "bytes", "paths"}
+    skipped_rel_paths = set() # 읽은 뒤 바이너리/압축 파일로 분류되어 건너뛴 파일
+    listed_rel_paths = set() # 스캔 결과에 포함된 파일 (작업 트리에서 삭제된 git 추적 파일 포함)
+    candidates = []
+    # 지원되는 파일의 stat 정보 수집 (지원되지 않는 파일은 여기서 제외)
+    for file_path in all_files_to_parse:
+        parser, lang_name = _get_parser(file_path.suffix)
+        if not parser:
+            console.print(f"[yellow]지원되지 않는 파일 형식 또는 파서 로드 실패: {file_path}[/yellow]")
+            continue
 
-            try:
-                with open(file_path, 'rb') as f:
-                    source_code = f.read()
-                
-                tree = parser.parse(source_code)
-                root_sitter_node = tree.root_node
-                
-                ast_node = convert_to_ast_node(root_sitter_node)
-                
-                parse_result = {
-                    "filePath": str(file_path),
-                    "language": lang_name,
-                    "rootNode": ast_node
-                }
-                
-                response = requests.post(f"{BACKEND_API_URL}/parser/parse", json=parse_result)
-                # TODO: 디버깅용 코드. 실제 배포 시에는 제거하거나 로깅 시스템으로 대체
-                console.print(f"Sending JSON for {file_path}:\n{json.dumps(parse_result, indent=2)}")
-                response.raise_for_status()
-                # console.print(f"리[bold green]'{file_path}' 파싱 결과 전송 성공:[/bold green] {response.text}")
-            except requests.exceptions.ConnectionError:
-                console.print("[bold red]오류:[/bold red] 백엔드 서버에 연결할 수 없습니다. 서버가 실행 중인지 확인하세요.")
-                return False # 연결 오류 시 즉시 중단
-            except requests.exceptions.HTTPError as e:
-                console.print(f"[bold red]오류:[/bold red] 백엔드에서 오류 응답: {e.response.status_code} - {e.response.text}")
-                all_parsed_successfully = False
-            except Exception as e:
-                console.print(f"[bold red]예상치 못한 오류 발생:[/bold red] {e}")
-                all_parsed_successfully = False
-            progress.update(task, advance=1)
-    return all_parsed_successfully
\ No newline at end of file
+        rel_path = file_path.relative_to(path).as_posix()
+        listed_rel_paths.add(rel_path)
+        try:
+            stat_result = file_path.stat()
+        except FileNotFoundError:
+            continue # git 인덱스에는 있지만 작업 트리에서 삭제된 파일 (삭제된 파일로 처리)
+        except OSError as e:
+            current_rel_paths.append(rel_path)
+            console.print(f"[bold red]예상치 못한 오류 발생:[/bold red] {e}")
+            all_parsed_successfully = False
+            continue
+        skip_reason = check_size(lang_name, stat_result.st_size)
+        if skip_reason is not None:
+            # 읽지 않고 건너뛰며, 이전에 전송한 파일이면 삭제로 보고
+            _add_skipped(skipped_totals, skip_reason, rel_path, stat_result.st_size)
+            continue
+        current_rel_paths.append(rel_path)
+        candidates.append((file_path, rel_path, lang_name, stat_result))
+
+    # 모든 샤드가 같은 파일 목록을 같은 방식으로 나누므로 이 샤드에 배정된 파일만 처리
+    shard_rel_paths = None
+    if shard is not None:
+        shard_index, shard_count = shard
+        assignment = assign_shards([(rel_path, stat_result.st_size) for _, rel_path, _, stat_result in candidates],
+                                   shard_count)
+        candidates = [candidate for candidate in candidates if assignment[candidate[1]] == shard_index]
+        shard_rel_paths = [rel_path for _, rel_path, _, _ in candidates]
+        console.print(f"샤드 {shard_index}/{shard_count}: 전체 {len(current_rel_paths)}개 중 "
+                      f"{len(candidates)}개 파일을 처리합니다.")
+
+    ast_format = ast_format or AST_FORMAT
+    tasks = []
+    # 파싱할 작업 목록 생성 (stat 기준 미변경 파일은 여기서 제외)
+    for file_path, rel_path, lang_name, stat_result in candidates:
+        # 크기와 수정 시각이 그대로면 파일을 읽지 않고 건너뜀
+        # (이어서 하는 --full 실행에서는 이미 전송한 파일만, 이전 실행에서 실패한 파일은 항상 다시 전송,
+        #  언어, AST 전송 형식, 가지치기 프로필이 마지막 업로드와 다르면 내용이 같아도 다시 전송)
+        use_manifest = ((not full or rel_path in resumed_rel_paths) and rel_path not in retry_rel_paths
+                        and manifest.is_same_upload(rel_path, lang_name, ast_format, prune_profile_id(lang_name)))
+        if use_manifest and manifest.is_stat_unchanged(rel_path, stat_result):
+            unchanged_count += 1
+            unchanged_files.append((file_path, rel_path))
+            continue
+
+        known_hash = manifest.files[rel_path]['hash'] if use_manifest else None
+        tasks.append((file_path, known_hash, (rel_path, lang_name, stat_result)))
+
+    # 큰 파일은 parse_result 를 메모리에 만들지 않고 전송하면서 JSON 을 생성 (현재 프로세스에서 순차 처리)
+    stream_tasks = []
+    if UPLOAD_STREAM_THRESHOLD_BYTES > 0:
+        stream_tasks = [task for task in tasks if task[2][2].st_size >= UPLOAD_STREAM_THRESHOLD_BYTES]
+        tasks = [task for task in tasks if task[2][2].st_size < UPLOAD_STREAM_THRESHOLD_BYTES]
+
+    if journal is not None:
+        journal.begin({'full': full, 'astFormat': ast_format, 'grammarVersion': manifest.grammar_version,
+                       'shard': shard}, keep=bool(resumed_rel_paths or retry_rel_paths))
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    max_jobs, jobs = jobs, max(1, min(jobs, len(tasks)))
+    symbols = symbol_index is not None
+
+    prune_totals = {} # 언어별 가지치기 집계
+    # 업로드에 성공한 파일만 매니페스트에 기록
+    uploaded_rel_paths = []
+    def _record_uploaded(context):
+        rel_path, content_hash, lang_name, stat_result = context
+        manifest.record(rel_path, content_hash, lang_name, stat_result, ast_format, prune_profile_id(lang_name))
+        uploaded_rel_paths.append(rel_path)
+        if journal is not None:
+            journal.record_uploaded(rel_path, manifest.files[rel_path])
+        if session is not None:
+            session.commit(rel_path)
+
+    # 전송하지 못한 파일은 저널에 기록하여 --resume 시 다시 전송
+    def _record_failed(context, error):
+        if journal is not None:
+            journal.record_failed(context[0], error)
+
+    if spool is not None:
+        spool.on_uploaded = _record_uploaded
+        uploader = spool
+    else:
+        uploader = ParseResultUploader(on_uploaded=_record_uploaded, on_failed=_record_failed, mode=upload_mode,
+                                       profiler=profiler)
+
+    # 파싱 진행률과 업로드 파이프라인 상태(대기열 깊이, 전송 중인 요청 수) 표시 (워커 결과가 도착할 때마다 갱신)
+    try:
+        with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}"), BarColumn(),
+                      MofNCompleteColumn(), TextColumn("{task.fields[pipeline]}"), console=console) as progress:
+            task = progress.add_task("[green]파일 파싱 및 백엔드 전송 중...", total=len(tasks) + len(stream_tasks),
+                                     pipeline="")
+            def _advance():
+                progress.update(task, advance=1, pipeline=uploader.describe_pipeline())
+            if session is not None:
+                # 스트리밍 전송하는 파일은 구문 트리를 세션에 보관하지 않음
+                for _, _, (rel_path, _, _) in stream_tasks:
+                    session.forget(rel_path)
+            if session is not None and len(tasks) > SESSION_MAX_SERIAL_FILES:
+                # 변경 파일이 많으면 병렬 파싱이 더 빠르므로 세션의 이전 트리는 버리고 전체 결과를 전송
+                for _, _, (rel_path, _, _) in tasks:
+                    session.forget(rel_path)
+                parsed_files = _iter_parsed_files(tasks, jobs, ast_format, profile=profiler.enabled, symbols=symbols,
+                                                  prune_report=prune_report, mp_start_method=mp_start_method)
+            elif session is not None:
+                # 이전 트리가 현재 프로세스에 있으므로 워커 프로세스 없이 순차 파싱
+                parsed_files = ((task, session.parse_file(task[0], task[2][0], task[1], ast_format, profiler.enabled,
+                                                          symbols))
+                                for task in tasks)
+            else:
+                parsed_files = _iter_parsed_files(tasks, jobs, ast_format, profile=profiler.enabled, symbols=symbols,
+                                                  prune_report=prune_report, mp_start_method=mp_start_method)
+            streamed_files = ((task, _parse_file(task[0], task[1], ast_format, profiler.enabled, symbols, stream=True))
+                              for task in stream_tasks)
+            parsed_files = _stream_deep_files(parsed_files, ast_format, profiler.enabled, symbols)
+            for (file_path, _, context), (status, content_hash, result, file_symbols, events) in itertools.chain(
+                    parsed_files, streamed_files):
+                rel_path, lang_name, stat_result = context
+                profiler.add_events(events)
+                if status == 'unchanged':
+                    manifest.touch(rel_path, stat_result)
+                    unchanged_count += 1
+                    unchanged_files.append((file_path, rel_path))
+                    _advance()
+                    continue
+                if status == 'skipped':
+                    _add_skipped(skipped_totals, result, rel_path, stat_result.st_size)
+                    skipped_rel_paths.add(rel_path)
+                    _advance()
+                    continue
+                if status == 'error':
+                    console.print(f"[bold red]예상치 못한 오류 발생:[/bold red] {result}")
+                    all_parsed_successfully = False
+                    _record_failed(context, result)
+                    _advance()
+                    continue
+
+                if file_symbols is not None:
+                    # 로컬 인덱스는 업로드 성공 여부와 관계없이 현재 소스를 반영
+                    symbol_index.replace_file(rel_path, content_hash, file_symbols)
+                parse_result = result
+                streamed = isinstance(parse_result, StreamingParseResult)
+                if not streamed and "pruning" in parse_result:
+                    _add_prune_totals(prune_totals, lang_name, parse_result["pruning"])
+                try:
+                    if streamed:
+                        # 디버그 출력 없이 본문을 생성하면서 바로 전송 (가지치기 기록은 전송이 끝난 뒤에 채워짐)
+                        uploader.add_stream(parse_result, (rel_path, content_hash, lang_name, stat_result))
+                        if parse_result.pruning is not None:
+                            _add_prune_totals(prune_totals, lang_name, parse_result.pruning)
+                        _advance()
+                        continue
+                    # TODO: 디버깅용 코드. 실제 배포 시에는 제거하거나 로깅 시스템으로 대체
+                    # (quiet 콘솔에서도 rich 는 출력을 렌더링하므로 아예 건너뜀)
+                    if not console.quiet:
+                        with profiler.phase('debug_dump', file_path, lang_name) as event:
+                            debug_json = json.dumps(parse_result, indent=2)
+                            console.print(f"Sending JSON for {file_path}:\n{debug_json}")
+                            event['bytes'] = len(debug_json)
+                    if parse_result["format"] == PATCH_FORMAT:
+                        with profiler.phase('upload', file_path, lang_name):
+                            patched = session.send_patch(parse_result)
+                        if patched:
+                            _record_uploaded((rel_path, content_hash, lang_name, stat_result))
+                            _advance()
+                            continue
+                        # 패치를 적용할 수 없으면 이미 파싱한 트리로 전체 결과를 만들어 전송
+                        parse_result = session.full_result(rel_path)
+                        if isinstance(parse_result, StreamingParseResult):
+                            uploader.add_stream(parse_result, (rel_path, content_hash, lang_name, stat_result))
+                            _advance()
+                            continue
+                    uploader.add(parse_result, (rel_path, content_hash, lang_name, stat_result))
+                except requests.exceptions.ConnectionError:
+                    raise
+                except Exception as e:
+                    console.print(f"[bold red]예상치 못한 오류 발생:[/bold red] {e}")
+                    all_parsed_successfully = False
+                    _record_failed(context, str(e))
+                _advance()
+
+            # 마지막 배치 전송 (대기열과 전송 중인 요청이 모두 끝날 때까지 대기)
+            uploader.flush()
+
+        if prune_totals:
+            _print_prune_summary(prune_totals, prune_report)
+        if uploader.failed_count:
+            all_parsed_successfully = False
+        if unchanged_count:
+            console.print(f"변경되지 않은 파일 {unchanged_count}개를 건너뛰었습니다.")
+        if skipped_totals:
+            _print_skip_summary(skipped_totals)
+        if symbol_index is not None:
+            _backfill_symbol_index(symbol_index, manifest, unchanged_files, max_jobs, profiler, mp_start_method)
+
+        # 매니페스트에는 있지만 더 이상 존재하지 않거나 건너뛴 파일은 백엔드에 삭제로 보고
+        # (샤드 실행은 전체 파일 목록과 비교하므로, 각 샤드가 자신의 매니페스트에 있는 삭제된 파일을 보고)
+        removed_rel_paths = manifest.stale_paths([rel_path for rel_path in current_rel_paths
+                                                  if rel_path not in skipped_rel_paths], scopes)
+        # 스캔 방식 때문에 목록에서 빠졌을 뿐(예: git 이 추적하지 않는 파일) 디스크에 남아 있고 무시 대상도 아닌 파일은
+        # 삭제로 보고하지 않고 매니페스트 기록을 유지 (디렉토리 순회로 만든 매니페스트에서 업그레이드하는 경우 등)
+        removed_rel_paths = [rel_path for rel_path in removed_rel_paths
+                             if rel_path in listed_rel_paths or ignore_patterns.is_ignored(rel_path)
+                             or not (Path(path) / rel_path).is_file()]
+        if symbol_index is not None:
+            symbol_index.remove_files(removed_rel_paths)
+        if not _report_removed_files(path, removed_rel_paths, manifest, spool):
+            all_parsed_successfully = False
+        else:
+            uploaded_rel_paths.extend(removed_rel_paths)
+            if session is not None:
+                for rel_path in removed_rel_paths:
+                    session.forget(rel_path)
+        if journal is not None and all_parsed_successfully:
+            journal.finish() # 이어서 진행할 파일이 없음
+    except requests.exceptions.ConnectionError as e:
+        report_request_error(e)
+        return False # 재시도 후에도 연결 오류면 중단 (그때까지 성공한 파일은 매니페스트와 저널에 저장됨)
+    finally:
+        uploader.close()
+        manifest.save()
+        if shard_rel_paths is not None:
+            write_shard_manifest(path, shard[0], shard[1], current_rel_paths, manifest, shard_rel_paths,
+                                 skipped_rel_paths)
+        if journal is not None:
+            journal.close()
+        if symbol_index is not None:
+            symbol_index.close()
+        if session is not None:
+            session.discard_pending()
+        # 새로 업로드/삭제된 파일과 관련된 조회 응답 캐시 무효화
+        if uploaded_rel_paths:
+            from mira_cli.cache import get_cache
+            get_cache().invalidate_files(Path(path) / rel_path for rel_path in uploaded_rel_paths)
+    return all_parsed_successfully
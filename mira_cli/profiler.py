@@ -0,0 +1,153 @@
+# 인덱싱 파이프라인의 단계별 시간을 측정하는 프로파일러
+#
+# 단계(scan, read, hash, parse, symbols, convert, debug_dump, encode, upload, spool)별로 경과 시간(wall),
+# CPU 시간, 처리 바이트를 파일/언어 단위로 기록하고, 요약 표와 Chrome trace JSON 을 만듭니다.
+# 워커 프로세스에서 측정한 이벤트는 결과와 함께 메인 프로세스로 전달되어 합쳐집니다.
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from mira_cli.utils import console
+
+
+# 정렬된 값 목록의 백분위수 (nearest-rank 방식)
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * pct // 100)) # ceil(n * pct / 100)
+    return sorted_values[int(rank) - 1]
+
+
+class PhaseProfiler:
+    """단계별 측정 이벤트를 모으는 프로파일러. enabled=False 이면 측정하지 않습니다."""
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.events = []
+        self._lock = threading.Lock()
+
+    # 단계 하나의 시간을 측정 (with 블록 안에서 반환된 이벤트의 "bytes" 를 채울 수 있음)
+    @contextmanager
+    def phase(self, name, file_path=None, language=None):
+        event = {"phase": name, "file": str(file_path) if file_path else None, "language": language, "bytes": 0}
+        if not self.enabled:
+            yield event
+            return
+        start_wall = time.perf_counter()
+        start_cpu = time.thread_time()
+        try:
+            yield event
+        finally:
+            event["start"] = start_wall
+            event["wall"] = time.perf_counter() - start_wall
+            event["cpu"] = time.thread_time() - start_cpu
+            event["pid"] = os.getpid()
+            event["tid"] = threading.get_ident()
+            with self._lock:
+                self.events.append(event)
+
+    # 다른 프로세스(워커)에서 측정한 이벤트를 합침
+    def add_events(self, events):
+        if self.enabled and events:
+            with self._lock:
+                self.events.extend(events)
+
+    # 파일별 전체 소요 시간 (단계 합계)
+    def _file_totals(self):
+        totals = {}
+        for event in self.events:
+            if event["file"]:
+                entry = totals.setdefault(event["file"], {"language": event["language"], "wall": 0.0, "bytes": 0})
+                entry["wall"] += event["wall"]
+                if event["phase"] == "read":
+                    entry["bytes"] = event["bytes"]
+        return totals
+
+    # 단계/언어/파일별 집계 결과를 딕셔너리로 반환
+    def summary(self, top_n=10):
+        phases = {}
+        for event in self.events:
+            entry = phases.setdefault(event["phase"], {"count": 0, "wall": 0.0, "cpu": 0.0, "bytes": 0, "latencies": []})
+            entry["count"] += 1
+            entry["wall"] += event["wall"]
+            entry["cpu"] += event["cpu"]
+            entry["bytes"] += event["bytes"]
+            entry["latencies"].append(event["wall"])
+
+        file_totals = self._file_totals()
+        languages = {}
+        for file_total in file_totals.values():
+            entry = languages.setdefault(file_total["language"] or "-", {"files": 0, "wall": 0.0, "bytes": 0})
+            entry["files"] += 1
+            entry["wall"] += file_total["wall"]
+            entry["bytes"] += file_total["bytes"]
+
+        file_latencies = sorted(file_total["wall"] for file_total in file_totals.values())
+        result = {
+            "phases": {},
+            "languages": languages,
+            "fileLatency": {f"p{pct}": percentile(file_latencies, pct) for pct in (50, 95, 99)},
+            "slowestFiles": [
+                {"file": file_path, **file_total}
+                for file_path, file_total in sorted(file_totals.items(), key=lambda item: item[1]["wall"], reverse=True)[:top_n]
+            ],
+        }
+        for name, entry in phases.items():
+            latencies = sorted(entry.pop("latencies"))
+            entry.update({f"p{pct}": percentile(latencies, pct) for pct in (50, 95, 99)})
+            result["phases"][name] = entry
+        return result
+
+    # 요약을 Rich 표로 출력
+    def print_summary(self, top_n=10):
+        from rich.table import Table
+
+        summary = self.summary(top_n)
+        phase_table = Table(title="단계별 소요 시간")
+        for column in ("단계", "횟수", "wall(s)", "cpu(s)", "MB", "p50(ms)", "p95(ms)", "p99(ms)"):
+            phase_table.add_column(column, justify="left" if column == "단계" else "right")
+        for name, entry in sorted(summary["phases"].items(), key=lambda item: item[1]["wall"], reverse=True):
+            phase_table.add_row(name, str(entry["count"]), f"{entry['wall']:.3f}", f"{entry['cpu']:.3f}",
+                                f"{entry['bytes'] / 1e6:.2f}", *(f"{entry[p] * 1000:.2f}" for p in ("p50", "p95", "p99")))
+        console.print(phase_table)
+
+        language_table = Table(title="언어별 소요 시간")
+        for column in ("언어", "파일", "wall(s)", "MB"):
+            language_table.add_column(column, justify="left" if column == "언어" else "right")
+        for name, entry in sorted(summary["languages"].items(), key=lambda item: item[1]["wall"], reverse=True):
+            language_table.add_row(name, str(entry["files"]), f"{entry['wall']:.3f}", f"{entry['bytes'] / 1e6:.2f}")
+        console.print(language_table)
+
+        latency = summary["fileLatency"]
+        console.print(f"파일별 지연 시간: p50 {latency['p50'] * 1000:.2f}ms, p95 {latency['p95'] * 1000:.2f}ms, "
+                      f"p99 {latency['p99'] * 1000:.2f}ms")
+
+        file_table = Table(title=f"가장 느린 파일 상위 {top_n}개")
+        for column in ("파일", "언어", "wall(ms)", "KB"):
+            file_table.add_column(column, justify="left" if column in ("파일", "언어") else "right")
+        for entry in summary["slowestFiles"]:
+            file_table.add_row(entry["file"], entry["language"] or "-", f"{entry['wall'] * 1000:.2f}", f"{entry['bytes'] / 1e3:.1f}")
+        console.print(file_table)
+
+    # Chrome trace(JSON) 형식으로 저장 (chrome://tracing, Perfetto 에서 열 수 있음)
+    def write_chrome_trace(self, path, top_n=10):
+        origin = min((event["start"] for event in self.events), default=0.0)
+        trace_events = [
+            {
+                "name": event["phase"],
+                "cat": event["language"] or "pipeline",
+                "ph": "X",
+                "ts": round((event["start"] - origin) * 1e6, 3),
+                "dur": round(event["wall"] * 1e6, 3),
+                "pid": event["pid"],
+                "tid": event["tid"],
+                "args": {"file": event["file"], "bytes": event["bytes"], "cpuMs": round(event["cpu"] * 1000, 3)},
+            }
+            for event in self.events
+        ]
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms",
+                       "otherData": {"summary": self.summary(top_n)}}, f)
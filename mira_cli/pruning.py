@@ -0,0 +1,87 @@
+# 전송용 AST 가지치기(pruning) 프로필 모듈
+#
+# config.ini 의 [pruning] 섹션(모든 언어 기본값)과 [pruning.<언어>] 섹션(언어별 덮어쓰기)으로
+# 이름 없는(anonymous) 노드 제거, 지정한 노드 타입 제거, 자식이 하나뿐인 노드 체인 축약, value 길이 제한을 설정합니다.
+# parser 의 AST 변환 함수가 프로필을 적용하며, 가지치기한 parse_result 에는 "pruning" 필드로 적용한 설정이 포함됩니다.
+# 매니페스트에는 업로드할 때 적용한 프로필의 식별자를 기록하여, 프로필이 바뀌면 변경되지 않은 파일도 다시 전송합니다.
+
+import hashlib
+import json
+
+from mira_cli.config_loader import PRUNING_PROFILES
+
+_TRUE_VALUES = ('1', 'yes', 'true', 'on')
+
+
+class PruneProfile:
+    """언어 하나에 적용할 AST 가지치기 설정."""
+
+    __slots__ = ('drop_anonymous', 'drop_types', 'collapse_single_child', 'max_value_length')
+
+    def __init__(self, drop_anonymous=False, drop_types=(), collapse_single_child=False, max_value_length=0):
+        self.drop_anonymous = drop_anonymous
+        self.drop_types = frozenset(drop_types)
+        self.collapse_single_child = collapse_single_child
+        self.max_value_length = max_value_length
+
+    # 설정 항목(문자열 딕셔너리)으로 프로필 생성 (enabled 가 꺼져 있으면 None)
+    @classmethod
+    def from_options(cls, options):
+        if options.get('enabled', 'false').strip().lower() not in _TRUE_VALUES:
+            return None
+        profile = cls(
+            drop_anonymous=options.get('drop_anonymous', 'false').strip().lower() in _TRUE_VALUES,
+            drop_types=[name.strip() for name in options.get('drop_types', '').split(',') if name.strip()],
+            collapse_single_child=options.get('collapse_single_child', 'false').strip().lower() in _TRUE_VALUES,
+            max_value_length=int(options.get('max_value_length', '0') or 0),
+        )
+        return profile if profile.describe() else None
+
+    # 노드(와 하위 트리)를 남기는지 여부
+    def keeps(self, node):
+        return not ((self.drop_anonymous and not node.is_named) or node.type in self.drop_types)
+
+    # 노드를 남는 자식 하나로 대체하는지 여부 (남는 자식이 하나뿐이고 바이트 범위가 같을 때)
+    def collapses(self, node):
+        if not self.collapse_single_child:
+            return False
+        kept = None
+        for child in node.children:
+            if self.keeps(child):
+                if kept is not None:
+                    return False
+                kept = child
+        return kept is not None and kept.start_byte == node.start_byte and kept.end_byte == node.end_byte
+
+    # parse_result 의 "pruning" 필드에 기록할 설정 (적용하는 항목만 포함)
+    def describe(self):
+        description = {}
+        if self.drop_anonymous:
+            description["dropAnonymous"] = True
+        if self.drop_types:
+            description["dropTypes"] = sorted(self.drop_types)
+        if self.collapse_single_child:
+            description["collapseSingleChild"] = True
+        if self.max_value_length > 0:
+            description["maxValueLength"] = self.max_value_length
+        return description
+
+    # 적용하는 설정의 식별자 (설정이 같으면 같은 값)
+    def fingerprint(self):
+        return hashlib.sha256(json.dumps(self.describe(), sort_keys=True).encode('utf-8')).hexdigest()[:16]
+
+
+_profiles = {}
+
+# 언어의 가지치기 프로필 (가지치기하지 않으면 None)
+def get_prune_profile(lang_name):
+    if lang_name not in _profiles:
+        options = dict(PRUNING_PROFILES.get('', {}))
+        options.update(PRUNING_PROFILES.get(lang_name, {}))
+        _profiles[lang_name] = PruneProfile.from_options(options)
+    return _profiles[lang_name]
+
+# 매니페스트에 기록할 언어의 가지치기 프로필 식별자 (가지치기하지 않으면 None)
+def prune_profile_id(lang_name):
+    profile = get_prune_profile(lang_name)
+    return profile.fingerprint() if profile is not None else None
@@ -0,0 +1,117 @@
+# 백엔드 응답을 터미널에 출력하는 모듈
+#
+# 조회/분석 결과는 Rich 표/트리로, --json 옵션에서는 스크립트가 읽을 수 있는 JSON 으로 출력합니다.
+# 문서 생성/리팩토링 제안처럼 긴 응답은 도착하는 대로 Markdown 으로 점진적으로 렌더링합니다.
+
+import json
+import time
+
+import click
+
+from mira_cli.utils import console
+
+# 표 셀에 표시할 값의 최대 길이
+_MAX_CELL_LENGTH = 80
+# 스트리밍 출력 시 Markdown 을 다시 렌더링하는 최소 간격 (초)
+_STREAM_RENDER_INTERVAL = 0.1
+
+
+# 표 셀에 들어갈 값을 짧은 문자열로 변환
+def _cell(value):
+    if isinstance(value, (dict, list)):
+        value = json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+    text = "" if value is None else str(value)
+    return text if len(text) <= _MAX_CELL_LENGTH else text[:_MAX_CELL_LENGTH - 1] + "…"
+
+
+def _is_record_list(value):
+    return isinstance(value, list) and bool(value) and all(isinstance(item, dict) for item in value)
+
+
+# 딕셔너리 목록을 표로 변환 (열은 처음 등장한 키 순서)
+def _records_table(records, title=None):
+    from rich.table import Table
+
+    columns = []
+    for record in records:
+        for key in record:
+            if key not in columns:
+                columns.append(key)
+    table = Table(title=title, show_lines=False)
+    for column in columns:
+        table.add_column(str(column), overflow="fold")
+    for record in records:
+        table.add_row(*(_cell(record.get(column)) for column in columns))
+    return table
+
+
+# 중첩된 값을 트리에 추가
+def _add_to_tree(tree, value):
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if isinstance(item, (dict, list)) and item:
+                _add_to_tree(tree.add(f"[bold]{key}[/bold]"), item)
+            else:
+                tree.add(f"[bold]{key}[/bold]: {_cell(item)}")
+    elif isinstance(value, list):
+        for index, item in enumerate(value):
+            if isinstance(item, (dict, list)) and item:
+                _add_to_tree(tree.add(f"[dim]#{index}[/dim]"), item)
+            else:
+                tree.add(_cell(item))
+    else:
+        tree.add(_cell(value))
+
+
+# 백엔드 응답(JSON 값)을 Rich 표/트리로 출력
+def render_payload(data, title=None):
+    from rich.tree import Tree
+
+    if data is None or data == [] or data == {}:
+        console.print("[yellow]결과가 없습니다.[/yellow]")
+        return
+    if _is_record_list(data):
+        console.print(_records_table(data, title))
+        return
+    if not isinstance(data, dict):
+        if title:
+            console.print(f"[bold]{title}[/bold]")
+        console.print(data)
+        return
+
+    # 레코드 목록 필드(예: nodes, relationships)는 표로, 나머지는 트리로 출력
+    scalars = {key: value for key, value in data.items() if not _is_record_list(value)}
+    if scalars:
+        tree = Tree(f"[bold]{title}[/bold]" if title else "[bold]결과[/bold]")
+        _add_to_tree(tree, scalars)
+        console.print(tree)
+    for key, value in data.items():
+        if _is_record_list(value):
+            console.print(_records_table(value, title=str(key)))
+
+
+# 백엔드 응답을 JSON 으로 표준 출력에 기록 (스크립트용)
+def print_json(data):
+    click.echo(json.dumps(data, ensure_ascii=False, indent=2))
+
+
+# 스트리밍 텍스트 조각을 도착하는 대로 Markdown 으로 렌더링하고 전체 텍스트를 반환
+def render_stream(chunks, title=None):
+    from rich.live import Live
+    from rich.markdown import Markdown
+
+    if title:
+        console.print(f"[bold]{title}[/bold]")
+    parts = []
+    last_render = 0.0
+    with Live(Markdown(""), console=console, refresh_per_second=8, vertical_overflow="visible") as live:
+        for chunk in chunks:
+            parts.append(chunk)
+            # Markdown 파싱 비용이 응답 길이에 비례하므로 화면 갱신 주기에 맞춰서만 다시 만듦
+            now = time.monotonic()
+            if now - last_render >= _STREAM_RENDER_INTERVAL:
+                live.update(Markdown("".join(parts)))
+                last_render = now
+        text = "".join(parts)
+        live.update(Markdown(text))
+    return text
@@ -0,0 +1,173 @@
+# 여러 머신에서 코드베이스를 나누어 인덱싱하기 위한 샤딩 모듈
+#
+# parse --shard i/N 은 스캔한 파일 목록을 모든 머신에서 같은 결과가 나오도록 N 개의 샤드로 나눕니다.
+# (파일 크기가 큰 것부터 누적 크기가 가장 작은 샤드에 배정하며, 같은 크기는 경로 해시 순으로 정렬)
+# 각 샤드는 담당 파일의 매니페스트 항목과 전체 파일 목록의 다이제스트를 .mira/shard-<i>-of-<N>.json 에 기록하고,
+# merge-manifests 는 샤드 매니페스트들이 모든 파일을 정확히 한 번씩 처리했는지 확인한 뒤
+# 하나의 매니페스트로 합치고 백엔드에 인덱싱 완료를 알립니다.
+
+import hashlib
+import heapq
+import json
+import os
+
+from mira_cli.utils import get_state_dir
+
+SHARD_MANIFEST_VERSION = 1
+
+
+class ShardMergeError(Exception):
+    """샤드 매니페스트들이 전체 파일을 정확히 한 번씩 처리하지 않은 경우 발생하는 예외."""
+
+    def __init__(self, problems):
+        super().__init__("\n".join(problems))
+        self.problems = problems
+
+
+# "i/N" 형식의 샤드 지정을 (i, N) 으로 변환 (1 <= i <= N)
+def parse_shard_spec(spec):
+    index, sep, count = spec.partition('/')
+    try:
+        index, count = int(index), int(count)
+    except ValueError:
+        index = count = 0
+    if not sep or count < 1 or not 1 <= index <= count:
+        raise ValueError(f"샤드는 i/N 형식이어야 합니다. (1 <= i <= N): {spec}")
+    return index, count
+
+
+# 머신과 프로세스에 관계없이 같은 값을 갖는 경로 해시
+def _path_hash(rel_path):
+    return hashlib.sha1(rel_path.encode('utf-8')).hexdigest()
+
+
+# (상대 경로, 크기) 목록을 누적 크기가 고르도록 샤드에 배정 (반환값: 상대 경로 -> 1 부터 시작하는 샤드 번호)
+def assign_shards(files, shard_count):
+    loads = [(0, shard) for shard in range(1, shard_count + 1)]
+    assignment = {}
+    for rel_path, size in sorted(files, key=lambda item: (-item[1], _path_hash(item[0]), item[0])):
+        load, shard = heapq.heappop(loads)
+        assignment[rel_path] = shard
+        heapq.heappush(loads, (load + size, shard))
+    return assignment
+
+
+# 파일 목록의 다이제스트 (샤드들이 같은 파일 목록을 나누었는지 확인하는 데 사용)
+def files_digest(rel_paths):
+    return hashlib.sha256('\n'.join(sorted(rel_paths)).encode('utf-8')).hexdigest()
+
+
+def shard_manifest_path(base_path, shard_index, shard_count):
+    return get_state_dir(base_path) / f"shard-{shard_index}-of-{shard_count}.json"
+
+
+# 샤드가 처리한 파일의 매니페스트 항목을 샤드 매니페스트로 저장 (임시 파일에 쓴 뒤 교체)
+def write_shard_manifest(base_path, shard_index, shard_count, all_rel_paths, manifest, shard_rel_paths,
+                         skipped_rel_paths=()):
+    path = shard_manifest_path(base_path, shard_index, shard_count)
+    data = {
+        'version': SHARD_MANIFEST_VERSION,
+        'shard': shard_index,
+        'shardCount': shard_count,
+        'grammarVersion': manifest.grammar_version,
+        'totalFiles': len(all_rel_paths),
+        'filesDigest': files_digest(all_rel_paths),
+        'assignedFiles': len(shard_rel_paths),
+        # 업로드에 성공한(또는 이미 전송되어 변경되지 않은) 파일만 포함
+        'files': {rel_path: manifest.files[rel_path] for rel_path in sorted(shard_rel_paths)
+                  if rel_path in manifest.files},
+        # 바이너리/압축 파일로 분류되어 건너뛴 파일 (처리한 것으로 간주)
+        'skipped': sorted(rel_path for rel_path in skipped_rel_paths if rel_path in shard_rel_paths),
+    }
+    tmp_path = path.with_suffix('.json.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+    return path
+
+
+# 샤드 매니페스트들을 검증하고 합친 결과를 반환 (검증에 실패하면 ShardMergeError)
+def merge_shard_manifests(paths):
+    """
+    모든 샤드가 같은 샤드 수/파일 목록/문법 버전으로 실행되었고, 1..N 샤드가 한 번씩 있으며,
+    합친 파일 목록(건너뛴 파일 포함)이 전체 파일 목록과 같고 어떤 파일도 두 샤드에서 처리되지 않았는지 확인합니다.
+    반환값: {"shardCount", "grammarVersion", "totalFiles", "filesDigest", "files"}
+    """
+    shards = []
+    problems = []
+    for path in paths:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            problems.append(f"샤드 매니페스트를 읽을 수 없습니다: {path}: {e}")
+            continue
+        if data.get('version') != SHARD_MANIFEST_VERSION:
+            problems.append(f"샤드 매니페스트 형식이 아닙니다: {path}")
+            continue
+        shards.append((path, data))
+    if problems or not shards:
+        raise ShardMergeError(problems or ["합칠 샤드 매니페스트가 없습니다."])
+
+    first = shards[0][1]
+    for key in ('shardCount', 'totalFiles', 'filesDigest', 'grammarVersion'):
+        values = {data[key] for _, data in shards}
+        if len(values) > 1:
+            problems.append(f"샤드마다 {key} 값이 다릅니다: {sorted(map(str, values))}")
+    shard_count = first['shardCount']
+    seen = {}
+    for path, data in shards:
+        if data['shard'] in seen:
+            problems.append(f"샤드 {data['shard']}/{shard_count} 이(가) 중복되었습니다: {seen[data['shard']]}, {path}")
+        seen[data['shard']] = path
+    missing_shards = sorted(set(range(1, shard_count + 1)) - set(seen))
+    if missing_shards:
+        problems.append(f"누락된 샤드: {', '.join(f'{shard}/{shard_count}' for shard in missing_shards)}")
+
+    files = {}
+    skipped = set()
+    duplicates = set()
+    for _, data in shards:
+        skipped.update(data.get('skipped', ()))
+        for rel_path, entry in data['files'].items():
+            if rel_path in files:
+                duplicates.add(rel_path)
+            files[rel_path] = entry
+    if duplicates:
+        problems.append(f"두 개 이상의 샤드에서 처리된 파일 {len(duplicates)}개: {', '.join(sorted(duplicates)[:5])}")
+    for path, data in shards:
+        processed = len(data['files']) + len(data.get('skipped', ()))
+        if processed < data['assignedFiles']:
+            problems.append(f"샤드 {data['shard']}/{shard_count} 에서 처리하지 못한 파일 "
+                            f"{data['assignedFiles'] - processed}개가 있습니다: {path}")
+    covered = skipped.union(files)
+    if not problems and (len(covered) != first['totalFiles'] or files_digest(covered) != first['filesDigest']):
+        problems.append(f"샤드들이 처리한 파일 목록({len(covered)}개)이 전체 파일 목록({first['totalFiles']}개)과 다릅니다.")
+    if problems:
+        raise ShardMergeError(problems)
+    return {
+        "shardCount": shard_count,
+        "grammarVersion": first['grammarVersion'],
+        "totalFiles": first['totalFiles'],
+        "filesDigest": first['filesDigest'],
+        "files": files,
+    }
+
+
+# 합친 매니페스트를 코드베이스의 매니페스트로 저장 (이후 실행은 변경된 파일만 전송)
+def save_merged_manifest(base_path, merged):
+    from mira_cli.manifest import MANIFEST_FILE_NAME, Manifest
+    manifest = Manifest(get_state_dir(base_path) / MANIFEST_FILE_NAME, merged['grammarVersion'], merged['files'])
+    manifest.save()
+    return manifest.path
+
+
+# 모든 샤드의 전송이 끝났음을 백엔드에 알림 (실패 시 requests 예외 발생)
+def notify_index_complete(base_path, merged):
+    from mira_cli.http_client import get_client
+    get_client().post("/parser/complete", json={
+        "rootPath": str(base_path),
+        "shardCount": merged['shardCount'],
+        "totalFiles": merged['totalFiles'],
+        "filesDigest": merged['filesDigest'],
+    })
@@ -1,10 +1,9 @@
 import cmd
 import os
-import requests
 
-# 파서 및 설정 로더 임포트
-from mira_cli.parser import parse_codebase_and_send_to_backend
-from mira_cli.config_loader import BACKEND_API_URL
+# 파서(tree-sitter)와 HTTP 클라이언트(requests)는 셸 시작을 늦추지 않도록 처음 사용할 때 임포트
+# 파싱/조회 명령어는 run_command 로 실행하여 백그라운드 데몬이 실행 중이면 데몬에 위임
+from mira_cli.daemon import run_command
 from mira_cli.utils import console
 
 # MIRA 대화형 셸 클래스
@@ -43,9 +42,86 @@ MIRA 셸에 오신 것을 환영합니다! 도움말을 보려면 'help' 또는
         self._parsed_codebase = False
         console.print("파싱된 코드베이스 데이터가 초기화되었습니다.")
 
+    # 코드베이스 (재)파싱 명령어
+    def do_parse(self, arg):
+        '코드베이스를 파싱하여 백엔드로 전송합니다. 사용법: parse [--full] [--resume] (--full: 변경 여부와 관계없이 전체 전송, --resume: 중단된 실행 이어서 진행)'
+        options = arg.split()
+        if run_command('parse', {"path": os.getcwd(), "full": '--full' in options, "resume": '--resume' in options}):
+            self._parsed_codebase = True
+            console.print("코드베이스 파싱 및 전송 완료.")
+        else:
+            console.print("코드베이스 파싱 및 전송에 실패했습니다.")
+
+    # 노드 세부 정보 조회 명령어
+    def do_node(self, arg):
+        'ID로 노드 세부 정보를 조회합니다. 사용법: node <노드ID>'
+        from mira_cli.render import render_payload
+        if not arg.strip():
+            console.print("사용법: node <노드ID>")
+            return
+        result = run_command('node', {"node_id": arg.strip()})
+        if result is not None:
+            render_payload(result, f"노드 {arg.strip()}")
+
+    # 노드 관계 조회 명령어
+    def do_relationships(self, arg):
+        'ID로 노드의 관계를 조회합니다. 사용법: relationships <노드ID>'
+        from mira_cli.render import render_payload
+        if not arg.strip():
+            console.print("사용법: relationships <노드ID>")
+            return
+        result = run_command('relationships', {"node_id": arg.strip()})
+        if result is not None:
+            render_payload(result, f"노드 {arg.strip()} 관계")
+
+    # 코드 그래프 검색 명령어
+    def do_search(self, arg):
+        '코드 그래프를 검색합니다. 사용법: search <검색어>'
+        from mira_cli.render import render_payload
+        if not arg.strip():
+            console.print("사용법: search <검색어>")
+            return
+        result = run_command('search', {"query_text": arg.strip()})
+        if result is not None:
+            render_payload(result, f"'{arg.strip()}' 검색 결과")
+
+    # 로컬 심볼 인덱스 검색 명령어
+    def do_find(self, arg):
+        "로컬 심볼 인덱스에서 이름으로 정의/참조를 찾습니다. (백엔드 호출 없음) 사용법: find <이름> ('*' 로 끝나면 접두사 검색)"
+        from mira_cli.render import render_payload
+        from mira_cli.symbols import SymbolIndex
+        if not arg.strip():
+            console.print("사용법: find <이름>")
+            return
+        symbol_index, _ = SymbolIndex.find(os.getcwd())
+        if symbol_index is None:
+            console.print("로컬 심볼 인덱스가 없습니다. 먼저 'parse' 로 코드베이스를 파싱하세요.")
+            return
+        try:
+            render_payload(symbol_index.lookup(arg.strip()), f"'{arg.strip()}' 로컬 검색 결과")
+        finally:
+            symbol_index.close()
+
+    # 백엔드 호출 통계 표시 명령어
+    def do_http_stats(self, arg):
+        '이번 셸 세션의 백엔드 엔드포인트별 호출 수, 오류 수, 지연 시간을 표시합니다.'
+        from rich.table import Table
+        stats = run_command('http_stats')
+        if not stats:
+            console.print("아직 백엔드 호출 기록이 없습니다.")
+            return
+        table = Table(title="백엔드 호출 통계")
+        for column in ("엔드포인트", "호출", "오류", "재시도", "평균(ms)", "최대(ms)"):
+            table.add_column(column, justify="left" if column == "엔드포인트" else "right")
+        for endpoint, entry in sorted(stats.items()):
+            table.add_row(endpoint, str(entry["calls"]), str(entry["errors"]), str(entry["retries"]),
+                          f"{entry['totalSeconds'] / entry['calls'] * 1000:.1f}", f"{entry['maxSeconds'] * 1000:.1f}")
+        console.print(table)
+
     # 알 수 없는 명령어 또는 자연어 쿼리 처리
     def default(self, line):
         '명령어를 찾을 수 없을 때 또는 자연어 쿼리를 처리합니다.'
+        from mira_cli.render import render_payload
         console.print(f"'{line}' 쿼리를 분석 중입니다...")
         
         # 코드베이스가 아직 파싱되지 않았다면 자동 파싱 시작
@@ -55,29 +131,15 @@ MIRA 셸에 오신 것을 환영합니다! 도움말을 보려면 'help' 또는
             console.print(f"현재 디렉토리: {path}를 코드베이스 루트로 사용합니다.")
             
             # 코드베이스 파싱 및 백엔드 전송
-            if parse_codebase_and_send_to_backend(path):
+            if run_command('parse', {"path": path}):
                 self._parsed_codebase = True
                 console.print("코드베이스 파싱 및 전송 완료.")
             else:
                 console.print("코드베이스 파싱 및 전송에 실패했습니다. 쿼리를 처리할 수 없습니다.")
                 return
 
-        try:
-            print("쿼리 전송 중...") # TODO: 진행률 표시기 (Progress bar) 추가 고려
-            # 백엔드 API로 쿼리 전송
-            response = requests.post(f"{BACKEND_API_URL}/query", json={"query": line})
-            response.raise_for_status()
-            
-            result = response.json()
-            
-            if result:
-                print("쿼리 처리 완료. 결과는 웹 UI에서 확인하세요.") # TODO: CLI에서 쿼리 결과 직접 출력 기능 추가
-            else:
-                print("쿼리 결과가 없습니다. 웹 UI를 확인하세요.")
-
-        except requests.exceptions.ConnectionError:
-            print("오류: 백엔드 서버에 연결할 수 없습니다. 서버가 실행 중인지 확인하세요.")
-        except requests.exceptions.HTTPError as e:
-            print(f"오류: 백엔드에서 오류 응답: {e.response.status_code} - {e.response.text}")
-        except Exception as e:
-            print(f"예상치 못한 오류 발생: {e}")
+        print("쿼리 전송 중...") # TODO: 진행률 표시기 (Progress bar) 추가 고려
+        # 백엔드 API로 쿼리 전송
+        result = run_command('query', {"query": line})
+        if result is not None:
+            render_payload(result, "쿼리 결과")
@@ -0,0 +1,217 @@
+# 백엔드 없이 파싱 결과를 로컬 스풀 파일에 모아 두었다가 나중에 전송(replay)하는 모듈
+#
+# 스풀 파일은 매직 바이트(MIRASPL1) 뒤에 레코드를 이어 붙이는 append-only 형식이며,
+# 레코드는 4바이트 빅엔디언 길이 + zlib 으로 압축한 JSON 입니다.
+#   {"type": "parse", "result": parse_result}    파싱 결과 (/parser/parse 또는 bulk 경로로 전송)
+#   {"type": "remove", "filePaths": [...]}       삭제된 파일 (/parser/remove 로 전송)
+# parse --spool 은 업로더 대신 SpoolWriter 에 기록하고, replay 명령어가 레코드 순서대로 백엔드에 전송합니다.
+
+import json
+import os
+import struct
+import zlib
+from pathlib import Path
+
+from mira_cli.profiler import PhaseProfiler
+from mira_cli.utils import console
+
+SPOOL_MAGIC = b'MIRASPL1'
+_LENGTH = struct.Struct('>I')
+_COMPRESS_LEVEL = 6
+
+
+class SpoolFormatError(Exception):
+    """스풀 파일이 아니거나 읽을 수 없는 경우 발생하는 예외."""
+
+
+def _dumps(record):
+    return json.dumps(record, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+class SpoolWriter:
+    """
+    parse_result 를 백엔드 대신 스풀 파일에 기록하는 업로더. (ParseResultUploader 와 같은 인터페이스)
+    기록한 파일은 업로드에 성공한 것으로 알리므로 매니페스트에 기록되어 다음 실행에서 건너뜁니다.
+    """
+
+    def __init__(self, path, on_uploaded=None, profiler=None):
+        self.path = Path(path)
+        self.on_uploaded = on_uploaded
+        self.profiler = profiler or PhaseProfiler(enabled=False)
+        self.failed_count = 0
+        self.record_count = 0
+        self._file = _open_for_append(self.path)
+
+    # parse_result 하나를 레코드로 기록
+    def add(self, parse_result, context=None):
+        with self.profiler.phase('spool', parse_result.get("filePath"), parse_result.get("language")) as event:
+            event['bytes'] = self._write(zlib.compress(_dumps({"type": "parse", "result": parse_result}),
+                                                       _COMPRESS_LEVEL))
+        self._notify_uploaded(context)
+
+    # 스트리밍 본문(StreamingParseResult)을 청크 단위로 압축하여 기록 (압축된 크기만큼만 메모리 사용)
+    def add_stream(self, body, context=None):
+        with self.profiler.phase('spool', body.file_path, body.lang_name) as event:
+            compressor = zlib.compressobj(_COMPRESS_LEVEL)
+            parts = [compressor.compress(b'{"type":"parse","result":')]
+            parts.extend(compressor.compress(chunk) for chunk in body)
+            parts.append(compressor.compress(b'}') + compressor.flush())
+            event['bytes'] = self._write(b''.join(parts))
+        self._notify_uploaded(context)
+
+    # 삭제된 파일 목록을 레코드로 기록
+    def add_removed(self, file_paths):
+        self._write(zlib.compress(_dumps({"type": "remove", "filePaths": list(file_paths)}), _COMPRESS_LEVEL))
+
+    def flush(self):
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    # 진행률 표시용 상태
+    def describe_pipeline(self):
+        return f"스풀 {self.record_count}개"
+
+    # 길이 접두사와 함께 레코드를 추가하고 기록한 바이트 수를 반환
+    def _write(self, data):
+        self._file.write(_LENGTH.pack(len(data)) + data)
+        self.record_count += 1
+        return _LENGTH.size + len(data)
+
+    def _notify_uploaded(self, context):
+        if self.on_uploaded:
+            self.on_uploaded(context)
+
+
+# 스풀 파일을 추가 모드로 열기 (새 파일이면 매직 바이트 기록, 기존 파일은 형식 확인 후 잘린 마지막 레코드 제거)
+def _open_for_append(path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    spool_file = open(path, 'a+b')
+    spool_file.seek(0)
+    magic = spool_file.read(len(SPOOL_MAGIC))
+    if magic != SPOOL_MAGIC and not SPOOL_MAGIC.startswith(magic):
+        spool_file.close()
+        raise SpoolFormatError(f"스풀 파일 형식이 아닙니다: {path}")
+    if magic != SPOOL_MAGIC:
+        # 빈 파일이거나 매직 바이트를 쓰다가 중단된 파일
+        spool_file.truncate(0)
+        spool_file.write(SPOOL_MAGIC)
+        return spool_file
+    end = _complete_records_end(spool_file)
+    if end != os.fstat(spool_file.fileno()).st_size:
+        # 이전 실행이 레코드를 쓰다가 중단됨: 잘린 레코드 뒤에 이어 쓰면 이후 레코드를 읽을 수 없으므로 잘라냄
+        console.print(f"[yellow]스풀 파일 끝의 불완전한 레코드를 제거합니다: {path}[/yellow]")
+        spool_file.truncate(end)
+    return spool_file
+
+
+# 매직 바이트 뒤의 레코드를 길이 접두사로 건너뛰며 마지막 완전한 레코드가 끝나는 위치를 반환
+def _complete_records_end(f):
+    size = os.fstat(f.fileno()).st_size
+    end = len(SPOOL_MAGIC)
+    while end + _LENGTH.size <= size:
+        f.seek(end)
+        length = _LENGTH.unpack(f.read(_LENGTH.size))[0]
+        if end + _LENGTH.size + length > size:
+            break
+        end += _LENGTH.size + length
+    return end
+
+
+# 스풀 파일의 압축된 레코드를 순서대로 반환 (마지막 레코드가 잘린 경우 경고 후 중단)
+def iter_raw_records(path):
+    with open(path, 'rb') as f:
+        if f.read(len(SPOOL_MAGIC)) != SPOOL_MAGIC:
+            raise SpoolFormatError(f"스풀 파일 형식이 아닙니다: {path}")
+        while True:
+            header = f.read(_LENGTH.size)
+            if not header:
+                return
+            length = _LENGTH.unpack(header)[0] if len(header) == _LENGTH.size else -1
+            data = f.read(length) if length >= 0 else b''
+            if len(data) != length:
+                console.print(f"[yellow]스풀 파일 끝의 불완전한 레코드를 무시합니다: {path}[/yellow]")
+                return
+            yield data
+
+
+# 스풀 파일의 레코드를 순서대로 반환
+def iter_records(path):
+    for data in iter_raw_records(path):
+        yield json.loads(zlib.decompress(data))
+
+
+# 스풀 파일을 읽어 레코드 순서대로 백엔드에 전송
+def replay_spool(path, upload_mode=None, keep=False):
+    """
+    파싱 결과는 업로드 파이프라인(bulk 또는 파일별 전송)으로 보내고, 삭제 레코드는 그 전까지의 전송을 마친 뒤 보냅니다.
+    모든 레코드를 전송하면 스풀 파일을 삭제하고, 일부 레코드가 실패하거나 연결이 끊기면
+    전송하지 못한 레코드만 남도록 스풀 파일을 다시 씁니다. (keep=True 이면 스풀 파일을 그대로 유지)
+    반환값: 모든 레코드를 전송했는지 여부
+    """
+    import requests
+    from mira_cli.http_client import get_client, report_request_error
+    from mira_cli.uploader import ParseResultUploader
+
+    path = Path(path)
+    sent = set() # 전송에 성공한 레코드 번호
+    uploader = ParseResultUploader(on_uploaded=sent.add, mode=upload_mode)
+    total = 0
+    completed = False
+    try:
+        with console.status("[green]스풀 레코드를 백엔드로 전송 중...") as status:
+            for index, record in enumerate(iter_records(path)):
+                total += 1
+                if record["type"] == "parse":
+                    uploader.add(record["result"], index)
+                elif record["type"] == "remove":
+                    uploader.flush()
+                    try:
+                        get_client().post("/parser/remove", json={"filePaths": record["filePaths"]})
+                    except requests.exceptions.ConnectionError:
+                        raise
+                    except requests.exceptions.RequestException as e:
+                        report_request_error(e)
+                        continue
+                    sent.add(index)
+                status.update(f"[green]스풀 레코드를 백엔드로 전송 중... ({len(sent)}/{total}, "
+                              f"{uploader.describe_pipeline()})")
+            uploader.flush()
+        completed = True
+    except requests.exceptions.ConnectionError as e:
+        report_request_error(e)
+    finally:
+        uploader.close()
+
+    if completed and len(sent) == total:
+        console.print(f"스풀 레코드 {total}개를 모두 전송했습니다.")
+        if not keep:
+            os.remove(path)
+        return True
+    if keep:
+        console.print(f"[yellow]스풀 레코드 {len(sent)}개를 전송했고 나머지는 전송하지 못했습니다.[/yellow]")
+        return False
+
+    # 전송하지 못한 레코드만 남김 (연결이 끊긴 경우 아직 읽지 않은 레코드 포함)
+    remaining = _rewrite_unsent(path, sent)
+    console.print(f"[yellow]스풀 레코드 {len(sent)}개를 전송했고 {remaining}개가 남았습니다. "
+                  f"다시 replay 하면 남은 레코드부터 전송합니다.[/yellow]")
+    return False
+
+
+# 전송에 성공한 레코드를 뺀 나머지로 스풀 파일을 원자적으로 다시 씀 (남은 레코드 수 반환)
+def _rewrite_unsent(path, sent):
+    tmp_path = path.with_name(path.name + '.tmp')
+    remaining = 0
+    with open(tmp_path, 'wb') as f:
+        f.write(SPOOL_MAGIC)
+        for index, data in enumerate(iter_raw_records(path)):
+            if index not in sent:
+                f.write(_LENGTH.pack(len(data)) + data)
+                remaining += 1
+    os.replace(tmp_path, path)
+    return remaining
@@ -0,0 +1,116 @@
+# 큰 파일의 parse_result 를 메모리에 만들지 않고 JSON 으로 바로 인코딩하는 모듈
+#
+# nested 형식은 구문 트리를 TreeCursor 로 순회하면서 노드 JSON 을 버퍼에 쓰고, 버퍼가 가득 차면 청크로 내보냅니다.
+# (convert_to_ast_node + json.dumps 결과와 같은 JSON 이며, 최대 메모리는 AST 크기가 아니라 소스와 버퍼 크기에 비례)
+# compact-v1 형식은 AST 배열은 메모리에 만들되 JSON 문자열 전체를 만들지 않고 청크 단위로 인코딩합니다.
+# StreamingParseResult 는 순회할 때마다 처음부터 다시 인코딩하므로 재시도 시 같은 본문을 다시 보낼 수 있습니다.
+
+import json
+
+from mira_cli.config_loader import UPLOAD_STREAM_BUFFER_BYTES
+from mira_cli.parser import COMPACT_FORMAT, NESTED_FORMAT, _build_parse_result
+from mira_cli.pruning import get_prune_profile
+
+_encode_string = json.JSONEncoder(ensure_ascii=False).encode
+_compact_encoder = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False)
+
+
+class StreamingParseResult:
+    """
+    requests 의 data 로 넘기면 chunked 전송되는 parse_result JSON 본문.
+    순회가 끝나면 pruning 에 가지치기 기록(가지치기하지 않으면 None)이 남습니다.
+    """
+
+    def __init__(self, file_path, lang_name, tree, source_code, ast_format, buffer_size=None):
+        self.file_path = file_path
+        self.lang_name = lang_name
+        self.tree = tree
+        self.source_code = source_code
+        self.ast_format = ast_format
+        self.buffer_size = buffer_size or UPLOAD_STREAM_BUFFER_BYTES
+        self.pruning = None
+
+    def __iter__(self):
+        parts = []
+        size = 0
+        for text in self._iter_text():
+            parts.append(text)
+            size += len(text)
+            if size >= self.buffer_size:
+                yield ''.join(parts).encode('utf-8')
+                parts, size = [], 0
+        if parts:
+            yield ''.join(parts).encode('utf-8')
+
+    # JSON 본문을 작은 문자열 조각으로 생성
+    def _iter_text(self):
+        if self.ast_format == COMPACT_FORMAT:
+            # AST 배열은 nested 형식보다 훨씬 작으므로 만들어 두고 인코딩만 나누어 수행
+            parse_result = _build_parse_result(self.file_path, self.lang_name, self.tree, self.source_code,
+                                               self.ast_format)
+            self.pruning = parse_result.get("pruning")
+            yield from _compact_encoder.iterencode(parse_result)
+            return
+
+        prune = get_prune_profile(self.lang_name)
+        stats = {} if prune is not None else None
+        yield (f'{{"filePath":{_encode_string(str(self.file_path))},"language":{_encode_string(self.lang_name)},'
+               f'"format":"{NESTED_FORMAT}","rootNode":')
+        yield from _iter_ast_node_json(self.tree.root_node, self.source_code, prune, stats)
+        if prune is not None:
+            self.pruning = {**prune.describe(), **stats}
+            yield ',"pruning":' + _compact_encoder.encode(self.pruning)
+        yield '}'
+
+
+# convert_to_ast_node 와 같은 순회/가지치기 규칙으로 노드 JSON 조각을 생성
+def _iter_ast_node_json(root, source_code, prune=None, stats=None):
+    max_value_length = prune.max_value_length if prune is not None else 0
+    kept_count = truncated_chars = 0
+    cursor = root.walk()
+    # 열린 노드마다 [자식을 이미 썼는지 여부] 와 노드를 닫을 때 쓸 문자열
+    # (축약된 노드는 부모의 상태를 공유하고 닫을 때 아무것도 쓰지 않음)
+    open_states = []
+    closers = []
+    while True:
+        node = cursor.node
+        if prune is not None and open_states and not prune.keeps(node):
+            state = None # 하위 트리 전체 제거
+        elif prune is not None and open_states and prune.collapses(node):
+            state, closer = open_states[-1], ''
+        else:
+            node_value = ""
+            if node.is_named:
+                node_value = source_code[node.start_byte:node.end_byte].decode('utf-8')
+                if max_value_length and len(node_value) > max_value_length:
+                    truncated_chars += len(node_value) - max_value_length
+                    node_value = node_value[:max_value_length]
+            separator = ''
+            if open_states:
+                separator = ',' if open_states[-1][0] else ''
+                open_states[-1][0] = True
+            (start_row, start_column), (end_row, end_column) = node.start_point, node.end_point
+            yield (f'{separator}{{"type":{_encode_string(node.type)},"value":{_encode_string(node_value)},'
+                   f'"startPosition":{{"row":{start_row},"column":{start_column}}},'
+                   f'"endPosition":{{"row":{end_row},"column":{end_column}}},"children":[')
+            kept_count += 1
+            state, closer = [False], ']}'
+
+        if state is not None and cursor.goto_first_child():
+            open_states.append(state)
+            closers.append(closer)
+            continue
+        if state is not None:
+            yield closer
+        while True:
+            if not open_states:
+                if stats is not None:
+                    stats["nodes"] = stats.get("nodes", 0) + root.descendant_count
+                    stats["keptNodes"] = stats.get("keptNodes", 0) + kept_count
+                    stats["truncatedChars"] = stats.get("truncatedChars", 0) + truncated_chars
+                return
+            if cursor.goto_next_sibling():
+                break
+            cursor.goto_parent()
+            open_states.pop()
+            yield closers.pop()
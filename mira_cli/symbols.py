@@ -0,0 +1,152 @@
+# 로컬 심볼 인덱스 모듈
+#
+# 파싱 중에 구문 트리에서 정의(이름 필드가 있는 클래스/함수/변수 선언 등)와 참조(식별자)를 추출하여
+# 코드베이스의 .mira/symbols.sqlite3 에 저장합니다. 파일이 다시 파싱되거나 삭제되면 그 파일의 항목만 교체합니다.
+# mira search --local 과 셸의 find 명령어는 백엔드 호출 없이 이 인덱스에서 이름/접두사로 검색합니다.
+# (검색 쪽은 tree-sitter 를 임포트하지 않으므로 단발성 명령어도 빠르게 응답합니다.)
+
+import sqlite3
+from pathlib import Path
+
+from mira_cli.utils import STATE_DIR_NAME, get_state_dir
+
+SYMBOLS_DB_NAME = 'symbols.sqlite3'
+
+DEFINITION = 'definition'
+REFERENCE = 'reference'
+
+# 이름(name 필드)을 가진 정의 노드 타입의 접미사 (언어별 문법에서 공통으로 쓰는 명명 규칙)
+# 예: function_definition, class_declaration, variable_declarator, function_item(rust), type_spec(go)
+_DEFINITION_SUFFIXES = ('_definition', '_declaration', '_declarator', '_item', '_spec', '_signature')
+# 이름/참조로 취급하는 식별자 노드 타입
+_IDENTIFIER_TYPES = frozenset({
+    'identifier', 'type_identifier', 'property_identifier', 'field_identifier', 'constant',
+    'simple_identifier', 'shorthand_property_identifier', 'namespace_identifier',
+})
+# 이보다 긴 식별자는 인덱싱하지 않음 (생성된 코드 등)
+_MAX_NAME_LENGTH = 200
+# 검색 결과 기본 최대 개수
+DEFAULT_LIMIT = 50
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    hash TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS symbols (
+    folded TEXT NOT NULL,
+    name TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    node_type TEXT NOT NULL,
+    path TEXT NOT NULL,
+    line INTEGER NOT NULL,
+    col INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS symbols_folded ON symbols (folded);
+CREATE INDEX IF NOT EXISTS symbols_path ON symbols (path);
+"""
+
+
+# 구문 트리에서 (이름, 종류, 노드 타입, 줄, 열) 심볼 튜플 목록을 추출 (줄/열은 1부터 시작)
+def extract_symbols(tree, source_code, references=True):
+    """
+    TreeCursor 로 트리를 반복(비재귀) 순회합니다.
+    정의는 이름 필드가 식별자인 선언 노드이며 노드 타입은 선언 노드의 타입입니다.
+    참조는 정의 이름이 아닌 식별자이며 노드 타입은 부모 노드의 타입(예: call, attribute)입니다.
+    """
+    symbols = []
+    definition_names = set() # 정의의 이름 노드 시작 바이트 (참조에서 제외)
+    parent_types = []
+    cursor = tree.walk()
+    while True:
+        node = cursor.node
+        node_type = node.type
+        if node_type.endswith(_DEFINITION_SUFFIXES):
+            name_node = node.child_by_field_name('name')
+            if name_node is not None and name_node.type in _IDENTIFIER_TYPES:
+                name = source_code[name_node.start_byte:name_node.end_byte].decode('utf-8', 'replace')
+                if 0 < len(name) <= _MAX_NAME_LENGTH:
+                    row, column = name_node.start_point
+                    symbols.append((name, DEFINITION, node_type, row + 1, column + 1))
+                    definition_names.add(name_node.start_byte)
+        elif references and node_type in _IDENTIFIER_TYPES and node.start_byte not in definition_names:
+            name = source_code[node.start_byte:node.end_byte].decode('utf-8', 'replace')
+            if 0 < len(name) <= _MAX_NAME_LENGTH:
+                row, column = node.start_point
+                symbols.append((name, REFERENCE, parent_types[-1] if parent_types else node_type, row + 1, column + 1))
+
+        if cursor.goto_first_child():
+            parent_types.append(node_type)
+            continue
+        while not cursor.goto_next_sibling():
+            if not cursor.goto_parent():
+                return symbols
+            parent_types.pop()
+
+
+class SymbolIndex:
+    """코드베이스별 정의/참조 인덱스 (.mira/symbols.sqlite3)."""
+
+    def __init__(self, db_path):
+        self.db_path = Path(db_path)
+        self._db = sqlite3.connect(self.db_path)
+        self._db.executescript(_SCHEMA)
+
+    # 코드베이스의 인덱스를 열기 (없으면 생성)
+    @classmethod
+    def open(cls, base_path):
+        return cls(get_state_dir(base_path) / SYMBOLS_DB_NAME)
+
+    # start_path 또는 상위 디렉토리에서 인덱스를 찾아 (인덱스, 코드베이스 루트)를 반환 (없으면 (None, None))
+    @classmethod
+    def find(cls, start_path):
+        start_path = Path(start_path).resolve()
+        for directory in (start_path, *start_path.parents):
+            db_path = directory / STATE_DIR_NAME / SYMBOLS_DB_NAME
+            if db_path.is_file():
+                return cls(db_path), directory
+        return None, None
+
+    # 인덱싱된 파일별 내용 해시
+    def file_hashes(self):
+        return dict(self._db.execute("SELECT path, hash FROM files"))
+
+    # 파일 하나의 심볼을 교체
+    def replace_file(self, rel_path, content_hash, symbols):
+        self._db.execute("DELETE FROM symbols WHERE path = ?", (rel_path,))
+        self._db.executemany(
+            "INSERT INTO symbols (folded, name, kind, node_type, path, line, col) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            ((name.casefold(), name, kind, node_type, rel_path, line, column)
+             for name, kind, node_type, line, column in symbols))
+        self._db.execute("INSERT OR REPLACE INTO files (path, hash) VALUES (?, ?)", (rel_path, content_hash))
+
+    # 삭제된 파일의 심볼 제거
+    def remove_files(self, rel_paths):
+        for rel_path in rel_paths:
+            self._db.execute("DELETE FROM symbols WHERE path = ?", (rel_path,))
+            self._db.execute("DELETE FROM files WHERE path = ?", (rel_path,))
+
+    # 이름으로 심볼 검색 (대소문자 무시, 끝에 '*' 가 있으면 접두사 검색)
+    def lookup(self, query, limit=DEFAULT_LIMIT, definitions_only=False):
+        """정의를 참조보다, 대소문자까지 일치하는 이름을 먼저 반환합니다."""
+        name = query.rstrip('*')
+        folded = name.casefold()
+        if query.endswith('*'):
+            condition, params = "folded >= ? AND folded < ?", [folded, folded + '\U0010ffff']
+        else:
+            condition, params = "folded = ?", [folded]
+        if definitions_only:
+            condition += " AND kind = ?"
+            params.append(DEFINITION)
+        rows = self._db.execute(
+            f"SELECT name, kind, node_type, path, line, col FROM symbols WHERE {condition} "
+            "ORDER BY kind != ?, name != ?, path, line, col LIMIT ?", (*params, DEFINITION, name, limit))
+        return [{"name": symbol_name, "kind": kind, "nodeType": node_type, "filePath": path, "line": line,
+                 "column": column} for symbol_name, kind, node_type, path, line, column in rows]
+
+    def commit(self):
+        self._db.commit()
+
+    def close(self):
+        self._db.commit()
+        self._db.close()
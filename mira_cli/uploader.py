@@ -0,0 +1,318 @@
+# 파싱 결과를 백엔드로 업로드하는 모듈
+#
+# bulk 모드에서는 여러 parse_result 를 NDJSON 배치로 묶어 압축한 뒤
+# 공용 HTTP 클라이언트의 keep-alive 커넥션으로 /parser/parse/bulk 에 전송합니다.
+# 백엔드에 bulk 경로가 없으면 기존 파일별 /parser/parse 전송으로 자동 전환합니다.
+#
+# 전송은 백그라운드 전송 스레드가 크기가 제한된 대기열에서 꺼내 처리하므로 파싱과 업로드가 겹쳐 진행되며,
+# 대기열이 가득 차면 파싱 측(add)이 기다립니다. 동시 요청 수는 응답 시간과 429/503 응답에 따라
+# AIMD(성공 시 조금씩 증가, 과부하 시 절반으로 감소)로 조절됩니다.
+# 업로드 성공/실패 콜백은 항상 add/flush 를 호출한 스레드에서 실행됩니다.
+
+import gzip
+import json
+import queue
+import threading
+import time
+
+import requests
+
+from mira_cli.config_loader import (
+    UPLOAD_MODE,
+    UPLOAD_BATCH_MAX_RECORDS,
+    UPLOAD_BATCH_MAX_BYTES,
+    UPLOAD_COMPRESSION,
+    UPLOAD_MAX_CONCURRENCY,
+    UPLOAD_QUEUE_SIZE,
+    UPLOAD_TARGET_LATENCY_SECONDS,
+)
+from mira_cli.http_client import describe_request_error, get_client, report_request_error
+from mira_cli.profiler import PhaseProfiler
+from mira_cli.utils import console
+
+# bulk 경로를 지원하지 않는 백엔드가 돌려주는 상태 코드
+_BULK_UNSUPPORTED_STATUS_CODES = (404, 405, 501)
+# 백엔드 과부하를 뜻하는 상태 코드 (동시 요청 수를 줄이고 다시 보냄)
+_OVERLOAD_STATUS_CODES = (429, 503)
+# 결과를 기다리는 동안 전송 스레드가 살아 있는지 확인하는 주기 (초)
+_SENDER_CHECK_SECONDS = 1.0
+
+
+# 배치 본문을 압축하고 Content-Encoding 값을 함께 반환
+def _compress(body, compression):
+    if compression == 'zstd':
+        try:
+            import zstandard
+        except ImportError:
+            console.print("[yellow]zstandard 패키지가 없어 gzip 압축을 사용합니다.[/yellow]")
+        else:
+            return zstandard.ZstdCompressor().compress(body), 'zstd'
+    if compression == 'none':
+        return body, None
+    return gzip.compress(body, compresslevel=6), 'gzip'
+
+
+class AdaptiveConcurrency:
+    """응답 시간과 과부하 응답에 따라 동시 요청 수 상한을 조절하는 AIMD 리미터."""
+
+    def __init__(self, max_limit, target_latency):
+        self.max_limit = max(1, max_limit)
+        self.target_latency = target_latency
+        self.limit = 1.0
+        self.in_flight = 0
+        self._condition = threading.Condition()
+        self._last_decrease = None
+
+    # 진행 중인 요청 수가 상한보다 작아질 때까지 대기
+    def acquire(self):
+        with self._condition:
+            while self.in_flight >= int(self.limit):
+                self._condition.wait()
+            self.in_flight += 1
+
+    # 요청 완료를 기록하고 상한 조절 (성공: 상한만큼 성공하면 1 증가, 느림/과부하: 절반)
+    def release(self, latency, overloaded=False):
+        with self._condition:
+            self.in_flight -= 1
+            if overloaded or latency > self.target_latency:
+                # 같은 과부하 구간에서 끝난 요청들이 상한을 여러 번 줄이지 않도록 응답 시간 동안 한 번만 감소
+                now = time.monotonic()
+                if self._last_decrease is None or now - self._last_decrease >= latency:
+                    self.limit = max(1.0, self.limit / 2)
+                    self._last_decrease = now
+            else:
+                self.limit = min(float(self.max_limit), self.limit + 1 / self.limit)
+            self._condition.notify_all()
+
+
+class ParseResultUploader:
+    """parse_result 를 모아 배치 또는 파일별로 백엔드에 전송하는 업로더."""
+
+    def __init__(self, on_uploaded=None, mode=None, batch_max_records=None, batch_max_bytes=None, compression=None,
+                 profiler=None, on_failed=None, max_concurrency=None, queue_size=None, target_latency=None):
+        self.on_uploaded = on_uploaded
+        self.on_failed = on_failed
+        self.mode = mode or UPLOAD_MODE
+        self.batch_max_records = batch_max_records or UPLOAD_BATCH_MAX_RECORDS
+        self.batch_max_bytes = batch_max_bytes or UPLOAD_BATCH_MAX_BYTES
+        self.compression = compression or UPLOAD_COMPRESSION
+        self.failed_count = 0
+        self.profiler = profiler or PhaseProfiler(enabled=False)
+        self.concurrency = AdaptiveConcurrency(max_concurrency or UPLOAD_MAX_CONCURRENCY,
+                                               target_latency or UPLOAD_TARGET_LATENCY_SECONDS)
+        self._client = get_client()
+        self._batch = []
+        self._batch_bytes = 0
+        self._jobs = queue.Queue(maxsize=queue_size or UPLOAD_QUEUE_SIZE)
+        self._results = queue.Queue()
+        self._pending = 0 # 대기열에 있거나 전송 중인 작업 수
+        self._senders = []
+        self._connection_error = None
+
+    # parse_result 를 업로드 대기열에 추가 (배치가 가득 차면 전송 대기열로 넘김)
+    # 연결 오류(requests.exceptions.ConnectionError)는 호출 측으로 전파됩니다.
+    def add(self, parse_result, context=None):
+        self._drain()
+        if self.mode != 'bulk':
+            self._submit(('single', parse_result, context))
+            return
+
+        with self.profiler.phase('encode', parse_result.get("filePath"), parse_result.get("language")) as event:
+            line = json.dumps(parse_result, separators=(',', ':'), ensure_ascii=False).encode('utf-8') + b'\n'
+            event['bytes'] = len(line)
+        if self._batch and self._batch_bytes + len(line) > self.batch_max_bytes:
+            self._submit_batch()
+        self._batch.append((line, parse_result, context))
+        self._batch_bytes += len(line)
+        if len(self._batch) >= self.batch_max_records or self._batch_bytes >= self.batch_max_bytes:
+            self._submit_batch()
+
+    # 대기 중인 배치를 전송하고 모든 전송이 끝날 때까지 대기
+    def flush(self):
+        self._submit_batch()
+        while self._pending:
+            try:
+                result = self._results.get(timeout=_SENDER_CHECK_SECONDS)
+            except queue.Empty:
+                self._check_senders()
+                continue
+            self._handle_result(result)
+        self._raise_connection_error()
+
+    # 전송 스레드를 종료 (연결 오류로 중단한 경우 대기열에 남은 작업은 전송하지 않음)
+    def close(self):
+        for sender in self._senders:
+            if sender.is_alive(): # 종료된 스레드 몫은 넣지 않음 (대기열이 가득 찬 채 멈추지 않도록)
+                self._jobs.put(None)
+        for sender in self._senders:
+            sender.join()
+        self._senders = []
+
+    # 진행률 표시용 파이프라인 상태 (대기열 깊이, 전송 중인 요청 수 / 현재 동시 요청 상한)
+    def describe_pipeline(self):
+        return f"대기 {self._jobs.qsize()} · 전송 중 {self.concurrency.in_flight}/{int(self.concurrency.limit)}"
+
+    # 스트리밍 본문(StreamingParseResult)을 배치에 넣지 않고 파일별 엔드포인트로 바로 전송
+    # 본문은 chunked 로 전송되며, 순회할 때마다 다시 생성되므로 5xx 응답 시 재시도할 수 있습니다.
+    # (큰 파일의 구문 트리가 대기열에 쌓이지 않도록 호출한 스레드에서 전송)
+    def add_stream(self, body, context=None):
+        self._drain()
+        try:
+            self._post("/parser/parse", body.file_path, body.lang_name, data=body,
+                       headers={'Content-Type': 'application/json'})
+        except requests.exceptions.ConnectionError:
+            raise
+        except requests.exceptions.RequestException as e:
+            report_request_error(e)
+            self.failed_count += 1
+            self._notify_failed(context, e)
+            return
+        self._notify_uploaded(context)
+
+    # 모은 배치를 압축하여 전송 대기열에 추가
+    def _submit_batch(self):
+        if not self._batch:
+            return
+        batch, self._batch, self._batch_bytes = self._batch, [], 0
+        if self.mode != 'bulk':
+            for _, parse_result, context in batch:
+                self._submit(('single', parse_result, context))
+            return
+
+        with self.profiler.phase('compress') as event:
+            body, encoding = _compress(b''.join(line for line, _, _ in batch), self.compression)
+            event['bytes'] = len(body)
+        self._submit(('bulk', body, encoding, batch))
+
+    # 작업을 전송 대기열에 추가 (대기열이 가득 차면 자리가 날 때까지 대기)
+    def _submit(self, job):
+        self._raise_connection_error()
+        if not self._senders:
+            for _ in range(self.concurrency.max_limit):
+                sender = threading.Thread(target=self._sender_loop, name="mira-uploader", daemon=True)
+                sender.start()
+                self._senders.append(sender)
+        self._pending += 1
+        while True:
+            try:
+                self._jobs.put(job, timeout=0.1)
+                return
+            except queue.Full:
+                self._drain() # 기다리는 동안 끝난 전송 결과를 반영
+                self._check_senders()
+
+    # 완료된 전송 결과를 모두 반영 (기다리지 않음)
+    def _drain(self):
+        while True:
+            try:
+                result = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._handle_result(result)
+        self._raise_connection_error()
+
+    # 전송 스레드가 돌려준 (context, 오류 또는 None) 목록을 반영
+    def _handle_result(self, result):
+        self._pending -= 1
+        for context, error in result:
+            if error is None:
+                self._notify_uploaded(context)
+            else:
+                report_request_error(error)
+                self.failed_count += 1
+                self._notify_failed(context, error)
+
+    def _raise_connection_error(self):
+        if self._connection_error is not None:
+            raise self._connection_error
+
+    # 전송 스레드가 모두 종료되어 남은 작업의 결과를 받을 수 없으면 기다리지 않고 예외 발생
+    def _check_senders(self):
+        if self._senders and not any(sender.is_alive() for sender in self._senders):
+            self._raise_connection_error()
+            raise RuntimeError(f"업로드 전송 스레드가 종료되어 {self._pending}개 작업의 결과를 받을 수 없습니다.")
+
+    # 전송 스레드: 대기열의 작업을 전송하고 결과를 결과 큐에 넣음
+    # (예상하지 못한 예외도 작업에 포함된 파일별 오류로 돌려주어 flush 가 결과를 기다리다 멈추지 않도록 함)
+    def _sender_loop(self):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            result = []
+            if self._connection_error is None: # 연결이 끊긴 뒤의 작업은 보내지 않음
+                try:
+                    if job[0] == 'bulk':
+                        result = self._send_batch(*job[1:])
+                    else:
+                        result = [(job[2], self._send_single(job[1]))]
+                except requests.exceptions.ConnectionError as e:
+                    self._connection_error = e
+                except Exception as e:
+                    contexts = [context for _, _, context in job[3]] if job[0] == 'bulk' else [job[2]]
+                    result = [(context, e) for context in contexts]
+            self._results.put(result)
+
+    # 배치 하나를 전송 (백엔드에 bulk 경로가 없으면 파일별 전송으로 전환하고 이번 배치를 다시 보냄)
+    def _send_batch(self, body, encoding, batch):
+        if self.mode != 'bulk':
+            return [(context, self._send_single(parse_result)) for _, parse_result, context in batch]
+        headers = {'Content-Type': 'application/x-ndjson'}
+        if encoding:
+            headers['Content-Encoding'] = encoding
+        try:
+            # 배치 전송 시간은 특정 파일에 귀속되지 않으므로 파일 정보 없이 기록
+            self._post("/parser/parse/bulk", size=len(body), data=body, headers=headers)
+        except requests.exceptions.ConnectionError:
+            raise
+        except requests.exceptions.RequestException as e:
+            if isinstance(e, requests.exceptions.HTTPError) and e.response.status_code in _BULK_UNSUPPORTED_STATUS_CODES:
+                if self.mode == 'bulk':
+                    console.print("[yellow]백엔드가 배치 업로드를 지원하지 않아 파일별 전송으로 전환합니다.[/yellow]")
+                    self.mode = 'single'
+                return [(context, self._send_single(parse_result)) for _, parse_result, context in batch]
+            return [(context, e) for _, _, context in batch]
+        return [(context, None) for _, _, context in batch]
+
+    # 기존 파일별 엔드포인트로 parse_result 하나를 전송 (HTTP 오류는 반환하고 연결 오류는 발생시킴)
+    def _send_single(self, parse_result):
+        try:
+            # 파일별 전송에서는 JSON 인코딩이 요청 안에서 이루어지므로 upload 단계에 포함됨
+            self._post("/parser/parse", parse_result.get("filePath"), parse_result.get("language"), json=parse_result)
+        except requests.exceptions.ConnectionError:
+            raise
+        except requests.exceptions.RequestException as e:
+            return e
+        return None
+
+    # 동시 요청 수 상한 안에서 요청을 보내고 응답 시간으로 상한을 조절
+    # 429/503 응답은 상한을 줄이고 백오프한 뒤 HTTP 클라이언트의 최대 재시도 횟수만큼 다시 보냅니다.
+    def _post(self, endpoint, file_path=None, lang_name=None, size=None, **kwargs):
+        attempt = 0
+        while True:
+            self.concurrency.acquire()
+            started = time.perf_counter()
+            overloaded = False
+            try:
+                with self.profiler.phase('upload', file_path, lang_name) as event:
+                    if size is not None:
+                        event['bytes'] = size
+                    # 과부하 응답은 클라이언트가 아니라 여기서만 재시도 (동시 요청 수를 먼저 줄이도록)
+                    return self._client.post(endpoint, no_retry_status=_OVERLOAD_STATUS_CODES, **kwargs)
+            except requests.exceptions.HTTPError as e:
+                overloaded = e.response is not None and e.response.status_code in _OVERLOAD_STATUS_CODES
+                if not overloaded or attempt >= self._client.max_retries:
+                    raise
+            finally:
+                self.concurrency.release(time.perf_counter() - started, overloaded)
+            self._client.sleep_before_retry(attempt)
+            attempt += 1
+
+    def _notify_uploaded(self, context):
+        if self.on_uploaded:
+            self.on_uploaded(context)
+
+    # 전송에 실패한 파일을 알림 (연결 오류를 제외한 HTTP 오류)
+    def _notify_failed(self, context, error):
+        if self.on_failed:
+            self.on_failed(context, describe_request_error(error) or str(error))
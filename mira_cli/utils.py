@@ -1,6 +1,17 @@
 # 유틸리티 함수 및 공통 객체를 정의하는 모듈
 
+from pathlib import Path
+
 from rich.console import Console
 
 # Rich 라이브러리의 Console 객체 초기화 (CLI 출력 및 로깅용)
 console = Console()
+
+# 코드베이스 루트에 생성되는 MIRA 로컬 상태 디렉토리 이름 (매니페스트 등 저장)
+STATE_DIR_NAME = '.mira'
+
+# 코드베이스의 로컬 상태 디렉토리 경로를 반환 (없으면 생성)
+def get_state_dir(base_path):
+    state_dir = Path(base_path) / STATE_DIR_NAME
+    state_dir.mkdir(parents=True, exist_ok=True)
+    return state_dir
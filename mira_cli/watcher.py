@@ -0,0 +1,322 @@
+# 코드베이스 변경을 감시하여 백엔드에 반영하는 모듈 (mira watch)
+#
+# Linux 에서는 inotify(ctypes)로 디렉토리별 변경 이벤트를 받고, 사용할 수 없는 환경에서는
+# 파일 크기/수정 시각을 주기적으로 비교(polling)합니다. 무시 규칙에 해당하는 디렉토리는 감시하지 않습니다.
+# 짧은 시간에 몰리는 저장 이벤트는 모아서(debounce) 한 번에 증분 파싱/전송하며,
+# 삭제와 이름 변경(이전 경로 삭제 + 새 경로 추가)도 함께 전송합니다.
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+
+from mira_cli.config_loader import (
+    WATCH_DEBOUNCE_SECONDS,
+    WATCH_INCREMENTAL,
+    WATCH_MAX_DELAY_SECONDS,
+    WATCH_POLL_INTERVAL_SECONDS,
+    WATCH_RETRY_SECONDS,
+)
+from mira_cli.parser import load_gitignore_patterns
+from mira_cli.utils import console
+
+# inotify 플래그 (linux/inotify.h)
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+_WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_ONLYDIR
+# struct inotify_event 의 고정 길이 헤더 (wd, mask, cookie, len) 뒤에 len 바이트의 이름이 이어짐
+_EVENT_HEADER = struct.Struct('iIII')
+_READ_SIZE = 64 * 1024
+
+# 변경이 없을 때 종료 요청(stop_event)을 확인하는 주기 (초)
+_IDLE_TIMEOUT = 0.5
+
+
+# 루트 기준 상대 경로 결합
+def _join(rel_dir, name):
+    return f"{rel_dir}/{name}" if rel_dir else name
+
+
+class PollingObserver:
+    """파일 크기/수정 시각 스냅샷을 주기적으로 비교하여 변경된 경로를 찾는 감시기."""
+
+    name = 'polling'
+
+    def __init__(self, base_path, matcher, interval=None):
+        self.base_path = Path(base_path)
+        self.matcher = matcher
+        self.interval = interval or WATCH_POLL_INTERVAL_SECONDS
+        self._snapshot = self._scan()
+        self._next_poll = time.monotonic() + self.interval
+
+    # 무시되지 않은 파일의 (크기, 수정 시각) 스냅샷 생성 (무시된 디렉토리는 들어가지 않음)
+    def _scan(self):
+        snapshot = {}
+        stack = ['']
+        while stack:
+            rel_dir = stack.pop()
+            try:
+                entries = os.scandir(self.base_path / rel_dir)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    rel_path = _join(rel_dir, entry.name)
+                    try:
+                        if entry.is_dir():
+                            if not entry.is_symlink() and not self.matcher.match(rel_path, True):
+                                stack.append(rel_path)
+                        elif not self.matcher.match(rel_path, False):
+                            stat_result = entry.stat()
+                            snapshot[rel_path] = (stat_result.st_size, stat_result.st_mtime_ns)
+                    except OSError:
+                        continue # 순회 도중 삭제된 경우
+        return snapshot
+
+    # 무시 규칙이 바뀐 경우 (새로 포함된 파일은 다음 비교에서 추가로 보고됨)
+    def set_matcher(self, matcher):
+        self.matcher = matcher
+
+    # 최대 timeout 초 동안 기다려 변경된 상대 경로 목록을 반환
+    def read(self, timeout):
+        delay = self._next_poll - time.monotonic()
+        if delay > timeout:
+            time.sleep(max(0.0, timeout))
+            return []
+        time.sleep(max(0.0, delay))
+        self._next_poll = time.monotonic() + self.interval
+
+        snapshot = self._scan()
+        previous, self._snapshot = self._snapshot, snapshot
+        return [rel_path for rel_path in snapshot.keys() | previous.keys()
+                if snapshot.get(rel_path) != previous.get(rel_path)]
+
+    def close(self):
+        pass
+
+
+# inotify 함수를 가진 libc 로드 (없으면 OSError)
+def _load_libc():
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        libc.inotify_init1, libc.inotify_add_watch, libc.inotify_rm_watch
+    except (OSError, AttributeError) as e:
+        raise OSError(f"inotify 를 지원하지 않는 환경입니다: {e}") from e
+    return libc
+
+
+class InotifyObserver:
+    """inotify 로 무시되지 않은 모든 디렉토리를 감시하는 감시기 (Linux)."""
+
+    name = 'inotify'
+
+    def __init__(self, base_path, matcher):
+        self.base_path = Path(base_path)
+        self.matcher = matcher
+        self._libc = _load_libc()
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            errno_value = ctypes.get_errno()
+            raise OSError(errno_value, f"inotify 초기화 실패: {os.strerror(errno_value)}")
+        self._dirs = {} # watch descriptor -> 디렉토리 상대 경로
+        self._watches = {} # 디렉토리 상대 경로 -> watch descriptor
+        self._add_tree('')
+
+    # 디렉토리 하나를 감시 목록에 추가
+    def _add_watch(self, rel_dir):
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(self.base_path / rel_dir), _WATCH_MASK)
+        if wd < 0:
+            errno_value = ctypes.get_errno()
+            if errno_value == 28: # ENOSPC: fs.inotify.max_user_watches 초과
+                raise OSError(errno_value, "inotify 감시 개수 한도(fs.inotify.max_user_watches)를 초과했습니다.")
+            return # 그 사이에 삭제된 디렉토리 등
+        self._dirs[wd] = rel_dir
+        self._watches[rel_dir] = wd
+
+    # 디렉토리와 무시되지 않은 하위 디렉토리 전체를 감시 목록에 추가
+    def _add_tree(self, rel_dir):
+        stack = [rel_dir]
+        while stack:
+            current = stack.pop()
+            self._add_watch(current)
+            try:
+                entries = os.scandir(self.base_path / current)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    rel_path = _join(current, entry.name)
+                    try:
+                        if entry.is_dir() and not entry.is_symlink() and not self.matcher.match(rel_path, True):
+                            stack.append(rel_path)
+                    except OSError:
+                        continue
+
+    # 삭제되거나 다른 곳으로 옮겨진 디렉토리와 하위 디렉토리의 감시를 해제
+    def _remove_tree(self, rel_dir):
+        prefix = rel_dir + '/'
+        for current in [d for d in self._watches if d == rel_dir or d.startswith(prefix)]:
+            wd = self._watches.pop(current)
+            self._dirs.pop(wd, None)
+            self._libc.inotify_rm_watch(self._fd, wd) # 이미 해제된 경우의 오류는 무시
+
+    # 무시 규칙이 바뀐 경우 새로 포함된 디렉토리도 감시 (이미 감시 중인 디렉토리는 그대로 유지됨)
+    def set_matcher(self, matcher):
+        self.matcher = matcher
+        self._add_tree('')
+
+    # 최대 timeout 초 동안 기다려 변경된 상대 경로 목록을 반환 ('' 는 이벤트 유실로 전체 확인이 필요함을 뜻함)
+    def read(self, timeout):
+        ready, _, _ = select.select([self._fd], [], [], max(0.0, timeout))
+        if not ready:
+            return []
+        try:
+            data = os.read(self._fd, _READ_SIZE)
+        except BlockingIOError:
+            return []
+
+        changed = []
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            name = data[offset + _EVENT_HEADER.size:offset + _EVENT_HEADER.size + length].rstrip(b'\0')
+            offset += _EVENT_HEADER.size + length
+
+            if mask & IN_Q_OVERFLOW:
+                # 커널 이벤트 큐가 넘친 경우 누락된 디렉토리를 다시 감시하고 전체를 다시 확인
+                self._add_tree('')
+                changed.append('')
+                continue
+            if mask & IN_IGNORED:
+                rel_dir = self._dirs.pop(wd, None)
+                if rel_dir is not None and self._watches.get(rel_dir) == wd:
+                    del self._watches[rel_dir]
+                continue
+            rel_dir = self._dirs.get(wd)
+            if rel_dir is None or not name:
+                continue
+
+            rel_path = _join(rel_dir, os.fsdecode(name))
+            if mask & IN_ISDIR:
+                if mask & (IN_MOVED_FROM | IN_DELETE):
+                    self._remove_tree(rel_path)
+                elif mask & (IN_CREATE | IN_MOVED_TO) and not self.matcher.is_ignored(rel_path, is_dir=True):
+                    # 감시를 추가하기 전에 만들어진 하위 파일은 디렉토리 경로 자체를 보고하여 함께 확인됨
+                    self._add_tree(rel_path)
+            changed.append(rel_path)
+        return changed
+
+    def close(self):
+        os.close(self._fd)
+
+
+# 사용할 수 있는 감시기 생성 (inotify 를 쓸 수 없으면 polling 으로 전환)
+def create_observer(base_path, matcher, polling=False, poll_interval=None):
+    if not polling and sys.platform.startswith('linux'):
+        try:
+            return InotifyObserver(base_path, matcher)
+        except OSError as e:
+            console.print(f"[yellow]inotify 를 사용할 수 없어 주기적 검사(polling)로 전환합니다: {e}[/yellow]")
+    return PollingObserver(base_path, matcher, poll_interval)
+
+
+class CodebaseWatcher:
+    """
+    변경된 경로를 모아 sync(changed_paths) 를 호출하는 감시 루프.
+    마지막 변경 후 debounce 초 동안 추가 변경이 없거나, 첫 변경 후 max_delay 초가 지나면 전송하고,
+    sync 가 실패(False)하면 같은 경로를 retry 초 후 다시 전송합니다.
+    """
+
+    def __init__(self, path, sync, polling=False, debounce=None, max_delay=None, poll_interval=None, retry=None):
+        self.path = Path(path)
+        self.sync = sync
+        self.debounce = WATCH_DEBOUNCE_SECONDS if debounce is None else debounce
+        self.max_delay = WATCH_MAX_DELAY_SECONDS if max_delay is None else max_delay
+        self.retry = WATCH_RETRY_SECONDS if retry is None else retry
+        self.matcher = load_gitignore_patterns(self.path)
+        self.observer = create_observer(self.path, self.matcher, polling, poll_interval)
+
+    # 무시 대상 경로를 제외하고, .gitignore 가 바뀌면 무시 규칙을 다시 로드
+    def _filter(self, rel_paths):
+        changed = []
+        for rel_path in rel_paths:
+            if rel_path and self.matcher.is_ignored(rel_path, is_dir=(self.path / rel_path).is_dir()):
+                continue
+            if rel_path.rsplit('/', 1)[-1] == '.gitignore':
+                self.matcher = load_gitignore_patterns(self.path)
+                self.observer.set_matcher(self.matcher)
+            changed.append(rel_path)
+        return changed
+
+    # stop_event 가 설정될 때까지 변경을 감시하여 전송
+    def run(self, stop_event=None):
+        pending = set()
+        first_at = None
+        due_at = None
+        while not (stop_event and stop_event.is_set()):
+            timeout = _IDLE_TIMEOUT if due_at is None else min(_IDLE_TIMEOUT, due_at - time.monotonic())
+            changed = self._filter(self.observer.read(timeout))
+            now = time.monotonic()
+            if changed:
+                if first_at is None:
+                    first_at = now
+                pending.update(changed)
+                due_at = min(now + self.debounce, first_at + self.max_delay)
+            if due_at is None or now < due_at:
+                continue
+
+            batch = sorted(pending)
+            pending.clear()
+            first_at = due_at = None
+            if not self.sync(batch):
+                console.print(f"[yellow]변경 사항 전송에 실패했습니다. {self.retry:g}초 후 다시 시도합니다.[/yellow]")
+                pending.update(batch)
+                due_at = time.monotonic() + self.retry
+
+    def close(self):
+        self.observer.close()
+
+
+# 코드베이스를 증분 파싱한 뒤 변경을 감시하며 계속 전송 (Ctrl+C 로 종료)
+def watch_codebase(path, jobs=None, ast_format=None, polling=False, debounce=None, incremental=None):
+    from mira_cli.parser import parse_codebase_and_send_to_backend
+
+    # 감시 중 저장된 파일은 이전 구문 트리를 기준으로 증분 파싱하여 바뀐 하위 트리만 전송
+    session = None
+    if WATCH_INCREMENTAL if incremental is None else incremental:
+        from mira_cli.incremental import IncrementalSession
+        session = IncrementalSession()
+
+    def _sync(changed_paths):
+        console.print(f"변경된 경로 {len(changed_paths)}개를 전송합니다: {', '.join(changed_paths[:5]) or '(전체)'}"
+                      f"{' ...' if len(changed_paths) > 5 else ''}")
+        return parse_codebase_and_send_to_backend(path, jobs=jobs, ast_format=ast_format, changed_paths=changed_paths,
+                                                  session=session)
+
+    # 초기 동기화 중의 변경도 놓치지 않도록 감시를 먼저 시작
+    watcher = CodebaseWatcher(path, _sync, polling=polling, debounce=debounce)
+    try:
+        if not parse_codebase_and_send_to_backend(path, jobs=jobs, ast_format=ast_format):
+            console.print("[yellow]초기 동기화에 실패했습니다. 변경된 파일부터 계속 감시합니다.[/yellow]")
+        console.print(f"[bold green]'{path}'[/bold green] 변경 사항을 감시합니다. ({watcher.observer.name}) "
+                      f"종료하려면 Ctrl+C 를 누르세요.")
+        watcher.run()
+    except KeyboardInterrupt:
+        console.print("감시를 종료합니다.")
+    finally:
+        watcher.close()
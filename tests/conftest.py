@@ -0,0 +1,14 @@
+import pytest
+
+import mira_cli.cache
+
+@pytest.fixture(autouse=True)
+def isolated_response_cache(tmp_path, monkeypatch):
+    # 테스트가 사용자 캐시 디렉토리(~/.cache/mira)를 건드리지 않도록 임시 캐시 사용
+    monkeypatch.setattr(mira_cli.cache, '_cache', mira_cli.cache.ResponseCache(cache_dir=tmp_path / "cache"))
+
+@pytest.fixture(autouse=True)
+def isolated_daemon_socket(tmp_path, monkeypatch):
+    # 사용자가 실행 중인 데몬에 요청이 위임되지 않도록 존재하지 않는 소켓 경로 사용
+    import mira_cli.daemon
+    monkeypatch.setattr(mira_cli.daemon, 'get_socket_path', lambda: tmp_path / "daemon.sock")
@@ -0,0 +1,88 @@
+import json
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from mira_cli.cache import ResponseCache
+from mira_cli.cli import MIRA
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResponseCache(cache_dir=tmp_path, ttl_seconds=60, max_entries=3, memory_entries=2)
+
+def test_get_put_and_stats(cache):
+    assert cache.get("/graph/node/1") == (False, None)
+    cache.put("/graph/node/1", None, {"id": "1", "filePath": "/repo/a.py"})
+    assert cache.get("/graph/node/1") == (True, {"id": "1", "filePath": "/repo/a.py"})
+    assert cache.stats() == {"hits": 1, "misses": 1, "entries": 1}
+
+def test_entries_expire_after_ttl(cache):
+    cache.put("/graph/search", {"query": "x"}, [])
+    with patch('mira_cli.cache.time.time', return_value=10 ** 12):
+        assert cache.get("/graph/search", {"query": "x"}) == (False, None)
+    assert cache.stats()["entries"] == 0
+
+def test_disk_lru_eviction(tmp_path):
+    writer = ResponseCache(cache_dir=tmp_path, ttl_seconds=60, max_entries=2)
+    for node_id in ("1", "2"):
+        writer.put(f"/graph/node/{node_id}", None, {"id": node_id})
+    writer.get("/graph/node/1") # 1 을 최근 사용으로 갱신
+    writer.put("/graph/node/3", None, {"id": "3"})
+
+    reader = ResponseCache(cache_dir=tmp_path, ttl_seconds=60, max_entries=2)
+    assert reader.get("/graph/node/1")[0]
+    assert not reader.get("/graph/node/2")[0]
+    assert reader.get("/graph/node/3")[0]
+
+def test_upload_invalidates_related_entries(cache):
+    cache.put("/graph/node/1", None, {"id": "1", "filePath": "/repo/a.py"})
+    cache.put("/graph/node/2", None, {"id": "2", "filePath": "/repo/b.py"})
+    cache.put("/graph/search", {"query": "x"}, [{"id": "2", "filePath": "/repo/b.py"}], invalidate_on_any_upload=True)
+
+    assert cache.invalidate_files(["/repo/a.py"]) == 2
+    assert not cache.get("/graph/node/1")[0]
+    assert not cache.get("/graph/search", {"query": "x"})[0]
+    assert cache.get("/graph/node/2")[0]
+
+def _response(body):
+    import io, requests
+    response = requests.Response()
+    response.status_code = 200
+    response.headers["Content-Type"] = "application/json"
+    response.raw = io.BytesIO(json.dumps(body).encode("utf-8"))
+    return response
+
+def test_cli_lookups_use_cache_unless_disabled():
+    node = {"id": "42", "filePath": "/repo/a.py"}
+    with patch('mira_cli.http_client.BackendClient.request', side_effect=lambda *a, **k: _response(node)) as mock_request:
+        runner = CliRunner()
+        assert runner.invoke(MIRA, ["get-node", "42", "--json"]).exit_code == 0
+        assert runner.invoke(MIRA, ["get-node", "42", "--json"]).exit_code == 0
+        assert mock_request.call_count == 1
+
+        result = runner.invoke(MIRA, ["--no-cache", "get-node", "42", "--json"])
+        assert json.loads(result.output) == node
+        assert mock_request.call_count == 2
+
+    result = CliRunner().invoke(MIRA, ["cache", "stats"])
+    assert "적중: 1" in result.output
+
+def test_memory_hits_are_batched_until_next_write(tmp_path):
+    cache = ResponseCache(cache_dir=tmp_path, ttl_seconds=60, max_entries=3)
+    cache.put("/graph/node/1", None, {"id": "1", "filePath": "/repo/a.py"})
+    changes = cache._db.total_changes
+    for _ in range(3):
+        assert cache.get("/graph/node/1")[0]
+    assert cache._db.total_changes == changes # 메모리 적중은 디스크에 쓰지 않음
+    cache.close()
+
+    assert ResponseCache(cache_dir=tmp_path).stats()["hits"] == 3
+
+def test_memory_hit_respects_invalidation_from_other_process(tmp_path):
+    reader = ResponseCache(cache_dir=tmp_path, ttl_seconds=60, max_entries=3)
+    reader.put("/graph/node/1", None, {"id": "1", "filePath": "/repo/a.py"})
+    assert reader.get("/graph/node/1")[0]
+
+    ResponseCache(cache_dir=tmp_path).invalidate_files(["/repo/a.py"])
+    assert reader.get("/graph/node/1") == (False, None)
@@ -0,0 +1,95 @@
+import io
+import json
+from unittest.mock import patch
+
+import requests
+from click.testing import CliRunner
+
+from mira_cli.cli import MIRA
+
+def _response(body, content_type="application/json"):
+    response = requests.Response()
+    response.status_code = 200
+    response.headers["Content-Type"] = content_type
+    response.raw = io.BytesIO(body if isinstance(body, bytes) else json.dumps(body).encode("utf-8"))
+    return response
+
+NODE = {"id": "42", "type": "class_definition", "name": "MyClass", "filePath": "app.py",
+        "relationships": [{"type": "CALLS", "target": "7"}, {"type": "DEFINES", "target": "8"}]}
+
+def test_get_node_renders_payload_in_terminal():
+    with patch('mira_cli.http_client.BackendClient.request', return_value=_response(NODE)) as mock_request, \
+            patch('webbrowser.open') as mock_open:
+        result = CliRunner().invoke(MIRA, ["get-node", "42"])
+
+    assert result.exit_code == 0, result.output
+    assert mock_request.call_args.args[:2] == ("GET", "/graph/node/42")
+    assert "MyClass" in result.output
+    assert "CALLS" in result.output
+    mock_open.assert_not_called()
+
+def test_json_output_is_machine_readable():
+    with patch('mira_cli.http_client.BackendClient.request', return_value=_response(NODE)):
+        result = CliRunner().invoke(MIRA, ["search", "MyClass", "--json"])
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.output) == NODE
+
+def test_web_flag_opens_browser():
+    with patch('mira_cli.http_client.BackendClient.request', return_value=_response(NODE)), \
+            patch('webbrowser.open') as mock_open:
+        result = CliRunner().invoke(MIRA, ["get-relationships", "42", "--web"])
+    assert result.exit_code == 0, result.output
+    mock_open.assert_called_once()
+    assert mock_open.call_args.args[0].endswith("/relationships/42")
+
+def test_generate_docs_streams_text_chunks():
+    markdown = "# MyClass\n\nGreets people.\n".encode("utf-8")
+    with patch('mira_cli.http_client.BackendClient.request',
+               return_value=_response(markdown, "text/markdown; charset=utf-8")) as mock_request:
+        result = CliRunner().invoke(MIRA, ["generate-docs", "app.py"])
+        assert mock_request.call_args.kwargs["stream"] is True
+    assert result.exit_code == 0, result.output
+    assert "Greets people." in result.output
+
+    events = b"data: first part\n\ndata: second part\n\ndata: [DONE]\n\n"
+    with patch('mira_cli.http_client.BackendClient.request', return_value=_response(events, "text/event-stream")):
+        result = CliRunner().invoke(MIRA, ["refactor-suggestions", "app.py", "--json"])
+    assert json.loads(result.output) == {"filePath": "app.py", "content": "first part\nsecond part\n"}
+
+def test_backend_failure_exits_non_zero():
+    with patch('mira_cli.http_client.BackendClient.request', side_effect=requests.exceptions.ConnectionError()):
+        result = CliRunner().invoke(MIRA, ["get-node", "42"])
+    assert result.exit_code == 1
+    assert "연결할 수 없습니다" in result.output
+
+def _lookup_by_endpoint(method, endpoint, **kwargs):
+    if endpoint == "/graph/node/missing":
+        response = _response({"message": "not found"})
+        response.status_code = 404
+        raise requests.exceptions.HTTPError(response=response)
+    return _response({**NODE, "id": endpoint.rsplit("/", 1)[-1]})
+
+def test_bulk_lookup_streams_ndjson_with_per_item_errors():
+    with patch('mira_cli.http_client.BackendClient.request', side_effect=_lookup_by_endpoint) as mock_request:
+        result = CliRunner().invoke(MIRA, ["get-node", "1", "missing", "3", "--concurrency", "2"])
+    assert result.exit_code == 1
+    records = {record["input"]: record for record in map(json.loads, result.output.splitlines())}
+    assert set(records) == {"1", "missing", "3"}
+    assert records["1"]["ok"] and records["3"]["result"]["id"] == "3"
+    assert not records["missing"]["ok"] and "404" in records["missing"]["error"]
+    assert mock_request.call_count == 3
+
+def test_bulk_lookup_reads_items_from_stdin():
+    with patch('mira_cli.http_client.BackendClient.request', side_effect=_lookup_by_endpoint) as mock_request:
+        result = CliRunner().invoke(MIRA, ["get-relationships", "-"], input="7\n\n8\n")
+    assert result.exit_code == 0, result.output
+    assert sorted(json.loads(line)["input"] for line in result.output.splitlines()) == ["7", "8"]
+    assert sorted(call.args[1] for call in mock_request.call_args_list) == ["/graph/relationships/7",
+                                                                           "/graph/relationships/8"]
+
+def test_watch_resolves_relative_path_like_parse(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    with patch('mira_cli.watcher.watch_codebase') as mock_watch:
+        result = CliRunner().invoke(MIRA, ["watch", "."])
+    assert result.exit_code == 0, result.output
+    assert mock_watch.call_args.args[0] == str(tmp_path)
@@ -0,0 +1,82 @@
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import requests
+from click.testing import CliRunner
+
+import mira_cli.daemon
+import mira_cli.parser
+from mira_cli.cli import MIRA
+from mira_cli.daemon import MiraDaemon, call, daemon_status, run_command
+
+from test_cli import NODE, _response
+
+@pytest.fixture
+def running_daemon(monkeypatch):
+    # Unix 소켓 경로 길이 제한 때문에 짧은 임시 디렉토리 사용
+    socket_dir = Path(tempfile.mkdtemp(prefix="mira-"))
+    socket_path = socket_dir / "daemon.sock"
+    monkeypatch.setattr(mira_cli.daemon, 'get_socket_path', lambda: socket_path)
+    daemon = MiraDaemon(idle_timeout=0)
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 10
+    while daemon_status() is None:
+        assert time.monotonic() < deadline
+        time.sleep(0.02)
+    yield daemon
+    call('shutdown')
+    thread.join(10)
+    shutil.rmtree(socket_dir, ignore_errors=True)
+
+def test_commands_are_delegated_to_running_daemon(running_daemon):
+    with patch('mira_cli.http_client.BackendClient.request', return_value=_response(NODE)) as mock_request:
+        assert run_command('node', {"node_id": "42"}) == NODE
+        result = CliRunner().invoke(MIRA, ["get-node", "42", "--json"])
+        assert result.exit_code == 0
+        assert '"MyClass"' in result.output
+    # 두 번째 조회는 데몬의 응답 캐시에서 처리
+    assert mock_request.call_count == 1
+    assert running_daemon.request_count == 2
+
+def test_daemon_forwards_console_output(running_daemon):
+    output = []
+    with patch('mira_cli.http_client.BackendClient.request', side_effect=requests.exceptions.ConnectionError()):
+        assert call('search', {"query_text": "MyClass"}, on_output=output.append) is None
+    assert "백엔드" in "".join(output)
+
+def test_no_daemon_option_runs_in_process(running_daemon):
+    with patch('mira_cli.http_client.BackendClient.request', return_value=_response(NODE)):
+        result = CliRunner().invoke(MIRA, ["--no-daemon", "get-node", "42", "--json"])
+    assert result.exit_code == 0
+    assert running_daemon.request_count == 0
+
+def test_falls_back_to_in_process_without_daemon():
+    assert daemon_status() is None
+    with patch('mira_cli.http_client.BackendClient.request', return_value=_response(NODE)) as mock_request:
+        assert run_command('node', {"node_id": "42"}) == NODE
+    assert mock_request.call_count == 1
+
+def test_daemon_parse_starts_workers_without_fork(running_daemon, tmp_path, monkeypatch):
+    import concurrent.futures
+    codebase = tmp_path / "codebase"
+    codebase.mkdir()
+    for name in ("a", "b", "c"):
+        (codebase / f"{name}.py").write_text(f"def {name}():\n    return 1\n")
+    monkeypatch.setattr(mira_cli.parser, 'SESSION_MAX_SERIAL_FILES', 0) # 세션 대신 워커 프로세스 풀로 파싱
+
+    start_methods = []
+    real_executor = concurrent.futures.ProcessPoolExecutor
+    def spy_executor(*args, mp_context=None, **kwargs):
+        start_methods.append(mp_context and mp_context.get_start_method())
+        return real_executor(*args, mp_context=mp_context, **kwargs)
+
+    with patch('concurrent.futures.ProcessPoolExecutor', side_effect=spy_executor), \
+            patch('mira_cli.http_client.BackendClient.post'):
+        assert call('parse', {"path": str(codebase), "jobs": 2})
+    assert start_methods == ['forkserver']
@@ -0,0 +1,66 @@
+import io
+import mmap
+from unittest.mock import patch, MagicMock
+
+from mira_cli import filefilter
+from mira_cli.filefilter import (SKIP_BINARY, SKIP_GENERATED, check_size, classify_source, read_classified_source,
+                                 read_source)
+from mira_cli.parser import COMPACT_FORMAT, _parse_file, parse_codebase_and_send_to_backend
+
+MINIFIED = b"a=1;" * 4000
+
+def test_classify_source_by_content_and_size(monkeypatch):
+    assert classify_source('python', b"def f():\n    return 1\n" * 500) is None
+    assert classify_source('python', b"x = 1\n\0\x01\x02") == SKIP_BINARY
+    assert classify_source('javascript', MINIFIED) == SKIP_GENERATED
+    assert classify_source('markdown', MINIFIED) is None # 언어별 설정으로 확인하지 않음
+    monkeypatch.setattr(filefilter, 'FILTER_MAX_FILE_BYTES', {'': 100, 'json': 10})
+    assert check_size('python', 99) is None
+    assert check_size('json', 10) == filefilter.SKIP_TOO_LARGE
+
+def test_skipped_files_are_classified_from_the_head_only(tmp_path):
+    class TrackingFile(io.BytesIO):
+        bytes_read = 0
+        def read(self, size=-1):
+            data = super().read(size)
+            TrackingFile.bytes_read += len(data)
+            return data
+
+    blob = b"x = 1\n\0" + b"y = 2\n" * 100000
+    with patch('mira_cli.filefilter.open', create=True, return_value=TrackingFile(blob)):
+        assert read_classified_source("blob.py", 'python', allow_mmap=False) == (None, SKIP_BINARY)
+    # 분류에 필요한 앞부분만 읽고 나머지는 읽지 않음
+    assert TrackingFile.bytes_read == 64 * 1024
+
+    file_path = tmp_path / "ok.py"
+
+    file_path.write_text("def f():\n    return 1\n" * 5000)
+    assert read_classified_source(file_path, 'python', allow_mmap=False) == (file_path.read_bytes(), None)
+
+def test_large_file_is_read_through_mmap_and_parsed(tmp_path, monkeypatch):
+    file_path = tmp_path / "big.py"
+    file_path.write_text("def f(x):\n    return x + 1\n" * 100)
+    monkeypatch.setattr(filefilter, 'FILTER_MMAP_THRESHOLD_BYTES', 1024)
+    source = read_source(file_path)
+    assert isinstance(source, mmap.mmap)
+    status, _, parse_result, _, _ = _parse_file(file_path, ast_format=COMPACT_FORMAT)
+    assert status == 'parsed'
+    assert parse_result["source"] == file_path.read_text()
+
+def test_parse_skips_and_reports_filtered_files(tmp_path, monkeypatch):
+    (tmp_path / "ok.py").write_text("x = 1\n")
+    (tmp_path / "gen.py").write_bytes(b"a = 1\n")
+    (tmp_path / "blob.py").write_bytes(b"\0\x01\x02")
+    (tmp_path / "data.json").write_text('{"a": [' + '1, ' * 100 + '1]}')
+    monkeypatch.setattr(filefilter, 'FILTER_MAX_FILE_BYTES', {'': 0, 'json': 100})
+    with patch('mira_cli.http_client.BackendClient.post', return_value=MagicMock()) as mock_post:
+        assert parse_codebase_and_send_to_backend(str(tmp_path), jobs=1, upload_mode='single')
+        sent = sorted(call.kwargs['json']['filePath'] for call in mock_post.call_args_list)
+        assert sent == [str(tmp_path / "gen.py"), str(tmp_path / "ok.py")]
+
+        # 압축된 파일로 바뀐 파일은 다시 전송하지 않고 백엔드에 삭제로 보고
+        mock_post.reset_mock()
+        (tmp_path / "gen.py").write_bytes(MINIFIED)
+        assert parse_codebase_and_send_to_backend(str(tmp_path), jobs=1, upload_mode='single')
+        assert [(call.args[0], call.kwargs['json']) for call in mock_post.call_args_list] == [
+            ("/parser/remove", {"filePaths": [str(tmp_path / "gen.py")]})]
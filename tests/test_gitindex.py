@@ -0,0 +1,98 @@
+import shutil
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+import mira_cli.parser
+from mira_cli.gitindex import find_git_dir, read_index_paths
+from mira_cli.parser import _iter_codebase_files, load_gitignore_patterns, parse_codebase_and_send_to_backend
+
+pytestmark = pytest.mark.skipif(shutil.which('git') is None, reason="git 실행 파일 필요")
+
+def _git(repo, *args):
+    return subprocess.run(['git', '-C', str(repo), *args], capture_output=True, check=True).stdout
+
+def _make_repo(tmp_path):
+    _git(tmp_path, 'init', '-q')
+    (tmp_path / "pkg" / "sub").mkdir(parents=True)
+    for name in ("a.py", "pkg/b.py", "pkg/sub/c.js", "pkg/sub/긴 이름의 파일.py", "README.md", "notes.txt"):
+        (tmp_path / name).write_text("x = 1\n")
+    (tmp_path / ".gitignore").write_text("build/\n")
+    _git(tmp_path, 'add', '-A')
+    return tmp_path
+
+@pytest.mark.parametrize("version", ["2", "3", "4"])
+def test_index_paths_match_git_ls_files(tmp_path, version):
+    repo = _make_repo(tmp_path)
+    _git(repo, 'update-index', '--index-version', version)
+    expected = [path.decode('utf-8') for path in _git(repo, 'ls-files', '-z').split(b'\0') if path]
+    assert read_index_paths(find_git_dir(repo)) == expected
+
+def test_codebase_files_from_index_filter_extension_and_untracked(tmp_path):
+    repo = _make_repo(tmp_path)
+    (repo / "new.py").write_text("y = 2\n") # 추적하지 않는 파일
+    (repo / "build").mkdir()
+    (repo / "build" / "gen.py").write_text("z = 3\n") # 무시되는 파일
+    (repo / "pkg" / "b.py").unlink() # 작업 트리에서 삭제된 추적 파일은 stat 단계에서 제외됨
+    ignore = load_gitignore_patterns(repo)
+
+    def rel_paths(**kwargs):
+        return sorted(p.relative_to(repo).as_posix() for p in _iter_codebase_files(repo, ignore, 'git', **kwargs))
+
+    assert rel_paths(include_untracked=False) == ["a.py", "pkg/b.py", "pkg/sub/c.js", "pkg/sub/긴 이름의 파일.py"]
+    assert "new.py" in rel_paths(include_untracked=True)
+    assert "build/gen.py" not in rel_paths(include_untracked=True)
+
+def test_non_git_directory_falls_back_to_walk(tmp_path):
+    (tmp_path / "a.py").write_text("x = 1\n")
+    assert find_git_dir(tmp_path) is None
+    ignore = load_gitignore_patterns(tmp_path)
+    assert [p.name for p in _iter_codebase_files(tmp_path, ignore, 'auto')] == ["a.py"]
+
+
+def _parse(repo, **kwargs):
+    """파싱 후 (전송한 파일 이름 목록, 삭제로 보고한 파일 이름 목록)을 반환"""
+    with patch('mira_cli.http_client.BackendClient.post') as mock_post:
+        assert parse_codebase_and_send_to_backend(str(repo), jobs=1, upload_mode="single", **kwargs)
+    sent, removed = [], []
+    for call in mock_post.call_args_list:
+        if call.args[0] == "/parser/remove":
+            removed.extend(Path(file_path).name for file_path in call.kwargs['json']['filePaths'])
+        else:
+            sent.append(Path(call.kwargs['json']['filePath']).name)
+    return sorted(sent), removed
+
+def test_untracked_files_are_not_flip_flopped_between_watch_and_parse(tmp_path):
+    repo = tmp_path
+    _git(repo, 'init', '-q')
+    (repo / "a.py").write_text("x = 1\n")
+    _git(repo, 'add', 'a.py')
+    (repo / "b.py").write_text("y = 2\n") # 추적하지 않는 파일
+
+    assert _parse(repo) == (["a.py", "b.py"], [])
+    (repo / "b.py").write_text("y = 3\n")
+    assert _parse(repo, changed_paths=[""]) == (["b.py"], []) # watch 와 같은 경로
+    assert _parse(repo) == ([], [])
+
+def test_tracked_only_scan_keeps_untracked_files_on_backend(tmp_path, monkeypatch):
+    repo = tmp_path
+    _git(repo, 'init', '-q')
+    (repo / "a.py").write_text("x = 1\n")
+    _git(repo, 'add', 'a.py')
+    (repo / "b.py").write_text("y = 2\n")
+
+    # 디렉토리 순회로 만든 매니페스트에서 추적 파일만 스캔하도록 바꿔도 디스크에 있는 b.py 는 삭제로 보고하지 않음
+    monkeypatch.setattr(mira_cli.parser, 'SCAN_SOURCE', 'walk')
+    assert _parse(repo) == (["a.py", "b.py"], [])
+    monkeypatch.setattr(mira_cli.parser, 'SCAN_SOURCE', 'auto')
+    monkeypatch.setattr(mira_cli.parser, 'SCAN_INCLUDE_UNTRACKED', False)
+    assert _parse(repo) == ([], [])
+
+    # watch 도 parse 와 같이 추적하지 않는 파일은 전송하지 않음
+    (repo / "b.py").write_text("y = 3\n")
+    (repo / "c.py").write_text("z = 4\n")
+    assert _parse(repo, changed_paths=[""]) == ([], [])
+    (repo / "b.py").unlink()
+    assert _parse(repo) == ([], ["b.py"])
@@ -0,0 +1,51 @@
+import pytest
+from unittest.mock import patch, MagicMock
+import requests
+
+from mira_cli.http_client import BackendClient
+
+def _response(status_code):
+    response = MagicMock()
+    response.status_code = status_code
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError(response=response)
+    return response
+
+@pytest.fixture
+def client():
+    client = BackendClient(base_url="http://backend.test/api", max_retries=2, backoff_base=0, backoff_max=0)
+    yield client
+    client.close()
+
+def test_retries_5xx_and_connection_errors_then_succeeds(client):
+    outcomes = [requests.exceptions.ConnectionError("reset"), _response(503), _response(200)]
+    with patch.object(client.session, 'request', side_effect=outcomes) as mock_request:
+        response = client.get("/graph/node/42", stats_key="/graph/node/{id}")
+
+    assert response.status_code == 200
+    assert mock_request.call_count == 3
+    method, url = mock_request.call_args.args
+    assert (method, url) == ("GET", "http://backend.test/api/graph/node/42")
+    assert mock_request.call_args.kwargs['timeout'] == client.timeout
+
+    stats = client.stats()["GET /graph/node/{id}"]
+    assert stats["calls"] == 3
+    assert stats["errors"] == 2
+    assert stats["retries"] == 2
+
+def test_gives_up_after_max_retries(client):
+    with patch.object(client.session, 'request', return_value=_response(500)) as mock_request:
+        with pytest.raises(requests.exceptions.HTTPError):
+            client.post("/query", json={"query": "x"})
+    assert mock_request.call_count == 3
+
+def test_does_not_retry_4xx_or_streaming_bodies(client):
+    with patch.object(client.session, 'request', return_value=_response(404)) as mock_request:
+        with pytest.raises(requests.exceptions.HTTPError):
+            client.get("/graph/search", params={"query": "x"})
+    assert mock_request.call_count == 1
+
+    with patch.object(client.session, 'request', return_value=_response(502)) as mock_request:
+        with pytest.raises(requests.exceptions.HTTPError):
+            client.post("/parser/parse", data=(chunk for chunk in [b"{}"]))
+    assert mock_request.call_count == 1
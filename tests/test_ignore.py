@@ -0,0 +1,83 @@
+import shutil
+import subprocess
+
+import pytest
+
+from mira_cli.ignore import IgnoreMatcher
+
+pytestmark = pytest.mark.skipif(shutil.which('git') is None, reason="git 이 설치되어 있지 않음")
+
+ROOT_GITIGNORE = """\
+# 주석
+*.log
+!important.log
+build/
+/root_only.txt
+docs/**/*.tmp
+**/cache
+foo/bar/
+*.py[co]
+\\#hash.txt
+trailing.txt   
+logs/
+!logs/keep.txt
+a/**/z.txt
+data/*
+!data/keep/
+name?.md
+"""
+
+SUB_GITIGNORE = """\
+!*.log
+local.txt
+/anchored.txt
+"""
+
+FILES = [
+    "app.py", "app.pyc", "mod.pyo", "x.log", "important.log", "sub/x.log", "sub/local.txt",
+    "sub/deep/local.txt", "sub/anchored.txt", "sub/deep/anchored.txt", "build/out.js", "src/build/out.js",
+    "root_only.txt", "src/root_only.txt", "docs/a.tmp", "docs/x/y/b.tmp", "docs/readme.md", "cache/c.bin",
+    "src/cache/c.bin", "src/cache", "foo/bar/baz.txt", "foo/bar.txt", "src/foo/bar/baz.txt", "#hash.txt",
+    "trailing.txt", "logs/keep.txt", "logs/other.txt", "a/z.txt", "a/b/c/z.txt", "b/a/z.txt",
+    "data/x.txt", "data/keep/y.txt", "name1.md", "name12.md", "excluded_by_info.txt", "src/main.go",
+]
+
+@pytest.fixture
+def corpus(tmp_path):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    subprocess.run(["git", "init", "-q", str(repo)], check=True)
+    (repo / ".gitignore").write_text(ROOT_GITIGNORE)
+    for file in FILES:
+        path = repo / file
+        if path.exists():
+            continue
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x")
+    (repo / "sub" / ".gitignore").write_text(SUB_GITIGNORE)
+    (repo / ".git" / "info").mkdir(exist_ok=True)
+    (repo / ".git" / "info" / "exclude").write_text("excluded_by_info.txt\n")
+    return repo
+
+def _git(repo, *args, stdin=None):
+    return subprocess.run(["git", "-C", str(repo), *args], input=stdin, capture_output=True, text=True).stdout
+
+def test_walk_matches_git_untracked_listing(corpus):
+    expected = sorted(_git(corpus, "ls-files", "--others", "--exclude-standard").splitlines())
+    matcher = IgnoreMatcher(corpus)
+    actual = sorted(path.relative_to(corpus).as_posix() for path in matcher.iter_files())
+    assert actual == expected
+
+def test_is_ignored_matches_git_check_ignore(corpus):
+    paths = sorted(FILES + [".gitignore", "sub/.gitignore"])
+    ignored = set(_git(corpus, "check-ignore", "--stdin", stdin="\n".join(paths) + "\n").splitlines())
+    matcher = IgnoreMatcher(corpus)
+    for path in paths:
+        assert matcher.is_ignored(path, is_dir=(corpus / path).is_dir()) == (path in ignored), path
+
+def test_directory_patterns_prune_subtrees(corpus):
+    matcher = IgnoreMatcher(corpus)
+    assert matcher.is_ignored("build", is_dir=True)
+    assert matcher.is_ignored("logs/keep.txt") # 상위 디렉토리가 무시되면 다시 포함할 수 없음
+    assert not matcher.is_ignored("data/keep", is_dir=True)
+    assert not matcher.is_ignored("foo/bar", is_dir=False) # 디렉토리 전용 패턴은 파일에 적용되지 않음
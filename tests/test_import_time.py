@@ -0,0 +1,39 @@
+import subprocess
+import sys
+from pathlib import Path
+
+# 단발성 명령어(version, visualize)가 불러오면 안 되는 무거운 모듈
+HEAVY_MODULES = ["tree_sitter", "tree_sitter_language_pack", "requests", "rich.progress", "mira_cli.parser"]
+# mira_cli.cli 임포트 시간 예산 (마이크로초, python -X importtime 누적값)
+CLI_IMPORT_BUDGET_US = 300_000
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+def _run_python(*args):
+    return subprocess.run([sys.executable, *args], cwd=REPO_ROOT, capture_output=True, text=True, check=True)
+
+def _import_times(module):
+    # python -X importtime 출력: "import time: self [us] | cumulative | imported package"
+    stderr = _run_python("-X", "importtime", "-c", f"import {module}").stderr
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+def test_cli_import_stays_within_budget():
+    times = _import_times("mira_cli.cli")
+    assert not [module for module in HEAVY_MODULES if module in times]
+    assert times["mira_cli.cli"] < CLI_IMPORT_BUDGET_US
+
+def test_version_command_does_not_load_heavy_modules():
+    code = (
+        "import sys\n"
+        "from mira_cli.cli import MIRA\n"
+        "MIRA(['version'], standalone_mode=False)\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))\n"
+    )
+    output = _run_python("-c", code).stdout.splitlines()
+    assert output[-1] == ""
@@ -0,0 +1,128 @@
+import json
+from unittest.mock import patch, MagicMock
+
+import pytest
+import requests
+
+from mira_cli.incremental import IncrementalSession, compute_edit
+from mira_cli.parser import PATCH_FORMAT, parse_codebase_and_send_to_backend
+
+def _module_source(count, changed=None, body="return value * 2"):
+    return "\n".join(
+        f"def handler_{i}(value):\n    {body if i == changed else 'return value + 1'}\n" for i in range(count)
+    ).encode("utf-8")
+
+@pytest.fixture
+def source_file(tmp_path):
+    path = tmp_path / "handlers.py"
+    path.write_bytes(_module_source(200))
+    return path
+
+def test_compute_edit_finds_minimal_range():
+    edit = compute_edit(b"a = 1\nb = 2\nc = 3\n", b"a = 1\nb = 42\nc = 3\n")
+    assert (edit["start_byte"], edit["old_end_byte"], edit["new_end_byte"]) == (10, 10, 11)
+    assert edit["start_point"] == (1, 4)
+    assert edit["new_end_point"] == (1, 5)
+
+    # 멀티바이트 문자 중간에서 나뉘지 않음
+    edit = compute_edit("x = '가'\n".encode("utf-8"), "x = '각'\n".encode("utf-8"))
+    assert (edit["start_byte"], edit["new_end_byte"]) == (5, 8)
+
+# compact 형식의 노드 배열을 (타입, 시작, 끝, 자식) 중첩 구조로 변환
+def _rebuild(ast, index=0):
+    nodes = ast["nodes"]
+    return {
+        "type": ast["typeTable"][str(nodes["type"][index])],
+        "start": nodes["startByte"][index],
+        "end": nodes["endByte"][index],
+        "children": [_rebuild(ast, child) for child in nodes["children"][index]],
+    }
+
+# 패치의 edit 를 Tree.edit 와 같은 규칙으로 적용한 뒤 replacements 로 하위 트리를 교체
+def _apply_patch(tree, ast_patch):
+    edit = ast_patch["edit"]
+    delta = edit["newEndByte"] - edit["oldEndByte"]
+
+    def shift(node):
+        if node["start"] >= edit["oldEndByte"]:
+            node["start"] += delta
+        if node["end"] >= edit["oldEndByte"]:
+            node["end"] += delta
+        for child in node["children"]:
+            shift(child)
+
+    shift(tree)
+    for replacement in ast_patch["replacements"]:
+        parent = tree
+        for index in replacement["path"][:-1]:
+            parent = parent["children"][index]
+        parent["children"][replacement["path"][-1]] = _rebuild(replacement["node"])
+    return tree
+
+def test_patch_reproduces_full_tree_and_is_small(source_file):
+    session = IncrementalSession()
+    status, _, first, _, _ = session.parse_file(source_file, "handlers.py", ast_format="compact-v1")
+    assert status == "parsed" and first["format"] == "compact-v1"
+    session.commit("handlers.py")
+
+    source_file.write_bytes(_module_source(200, changed=120))
+    status, _, result, _, _ = session.parse_file(source_file, "handlers.py", ast_format="compact-v1")
+    assert status == "parsed"
+    assert result["format"] == PATCH_FORMAT
+    assert result["baseFormat"] == "compact-v1"
+
+    full = session.full_result("handlers.py")
+    assert _apply_patch(_rebuild(first["ast"]), result) == _rebuild(full["ast"])
+    assert len(json.dumps(result)) * 20 < len(json.dumps(full))
+
+def test_nested_patch_replaces_only_changed_function(source_file):
+    session = IncrementalSession()
+    session.parse_file(source_file, "handlers.py", ast_format="nested")
+    session.commit("handlers.py")
+
+    source_file.write_bytes(_module_source(200, changed=7, body="return None"))
+    _, _, result, _, _ = session.parse_file(source_file, "handlers.py", ast_format="nested")
+    assert result["format"] == PATCH_FORMAT
+    assert [replacement["path"][0] for replacement in result["replacements"]] == [7]
+    assert "return None" in result["replacements"][0]["node"]["value"]
+    assert result["edit"]["text"] == "None"
+
+def test_uncommitted_parse_is_not_used_as_base(source_file):
+    session = IncrementalSession()
+    session.parse_file(source_file, "handlers.py", ast_format="compact-v1")
+    session.commit("handlers.py")
+
+    # 업로드되지 않은 파싱 결과는 다음 패치의 기준이 되지 않으므로 다음 변경은 전체 전송
+    source_file.write_bytes(_module_source(200, changed=1))
+    session.parse_file(source_file, "handlers.py", ast_format="compact-v1")
+    session.discard_pending()
+    source_file.write_bytes(_module_source(200, changed=2))
+    _, _, result, _, _ = session.parse_file(source_file, "handlers.py", ast_format="compact-v1")
+    assert result["format"] == "compact-v1"
+
+def test_parse_sends_patch_and_falls_back_when_unsupported(source_file):
+    codebase = source_file.parent
+    session = IncrementalSession()
+    with patch('mira_cli.http_client.BackendClient.post') as mock_post:
+        mock_post.return_value = MagicMock()
+        assert parse_codebase_and_send_to_backend(str(codebase), upload_mode='single', session=session)
+        source_file.write_bytes(_module_source(200, changed=3))
+        mock_post.reset_mock()
+        assert parse_codebase_and_send_to_backend(str(codebase), upload_mode='single', session=session,
+                                                  changed_paths=["handlers.py"])
+    assert [call.args[0] for call in mock_post.call_args_list] == ["/parser/patch"]
+
+    not_found = MagicMock()
+    not_found.status_code = 404
+    def fake_post(endpoint, **kwargs):
+        if endpoint == "/parser/patch":
+            raise requests.exceptions.HTTPError(response=not_found)
+        return MagicMock()
+
+    source_file.write_bytes(_module_source(200, changed=3, body="return value * 3"))
+    with patch('mira_cli.http_client.BackendClient.post', side_effect=fake_post) as mock_post:
+        assert parse_codebase_and_send_to_backend(str(codebase), upload_mode='single', session=session,
+                                                  changed_paths=["handlers.py"])
+    assert [call.args[0] for call in mock_post.call_args_list] == ["/parser/patch", "/parser/parse"]
+    assert mock_post.call_args.kwargs["json"]["format"] == "nested"
+    assert session.enabled is False
@@ -4,9 +4,16 @@ from unittest.mock import patch, MagicMock
 from pathlib import Path
 import shutil
 import json
+import gzip
+import requests
 
 from mira_cli.parser import parse_codebase_and_send_to_backend
 
+@pytest.fixture(autouse=True)
+def single_upload_mode(monkeypatch):
+    # 기본 테스트는 파일별 전송(/parser/parse) 경로를 검증
+    monkeypatch.setattr('mira_cli.uploader.UPLOAD_MODE', 'single')
+
 @pytest.fixture
 def temp_codebase(tmp_path):
     # 임시 코드베이스 디렉토리 생성
@@ -76,7 +83,7 @@ public class ComplexJava {
     shutil.rmtree(codebase_path)
 
 def test_parse_codebase_and_send_to_backend(temp_codebase):
-    with patch('requests.post') as mock_post:
+    with patch('mira_cli.http_client.BackendClient.post') as mock_post:
         mock_response = MagicMock()
         mock_response.raise_for_status.return_value = None
         mock_response.text = "Success"
@@ -88,7 +95,7 @@ def test_parse_codebase_and_send_to_backend(temp_codebase):
         # 함수가 성공적으로 실행되었는지 확인
         assert success is True
 
-        # requests.post가 예상대로 호출되었는지 확인
+        # 백엔드 전송(BackendClient.post)이 예상대로 호출되었는지 확인
         # Python 파일과 Java 파일에 대해 각각 한 번씩 호출되어야 함
         assert mock_post.call_count == 2
 
@@ -107,3 +114,220 @@ def test_parse_codebase_and_send_to_backend(temp_codebase):
             assert "rootNode" in json_data
             assert "type" in json_data['rootNode']
             assert "children" in json_data['rootNode']
+
+def _mock_success_response():
+    mock_response = MagicMock()
+    mock_response.raise_for_status.return_value = None
+    mock_response.text = "Success"
+    return mock_response
+
+def test_incremental_parse_skips_unchanged_and_reports_removed(temp_codebase):
+    with patch('mira_cli.http_client.BackendClient.post') as mock_post:
+        mock_post.return_value = _mock_success_response()
+
+        # 첫 실행: 모든 파일 전송 및 매니페스트 생성
+        assert parse_codebase_and_send_to_backend(str(temp_codebase)) is True
+        assert mock_post.call_count == 2
+        assert (temp_codebase / ".mira" / "manifest.json").exists()
+
+        # 두 번째 실행: 변경 사항 없음 -> 전송 없음
+        mock_post.reset_mock()
+        assert parse_codebase_and_send_to_backend(str(temp_codebase)) is True
+        assert mock_post.call_count == 0
+
+        # 파일 하나 수정, 하나 삭제 -> 수정된 파일 전송 + 삭제 보고
+        mock_post.reset_mock()
+        (temp_codebase / "complex_python.py").write_text("x = 1\n")
+        (temp_codebase / "ComplexJava.java").unlink()
+        assert parse_codebase_and_send_to_backend(str(temp_codebase)) is True
+        urls = [call.args[0] for call in mock_post.call_args_list]
+        assert sum(url.endswith("/parser/parse") for url in urls) == 1
+        remove_calls = [call for call in mock_post.call_args_list if call.args[0].endswith("/parser/remove")]
+        assert len(remove_calls) == 1
+        assert remove_calls[0].kwargs['json']['filePaths'][0].endswith("ComplexJava.java")
+
+        # --full: 변경 여부와 관계없이 전체 전송
+        mock_post.reset_mock()
+        assert parse_codebase_and_send_to_backend(str(temp_codebase), full=True) is True
+        assert mock_post.call_count == 1
+
+def test_changing_ast_format_resends_unchanged_files(temp_codebase):
+    with patch('mira_cli.http_client.BackendClient.post') as mock_post:
+        mock_post.return_value = _mock_success_response()
+        assert parse_codebase_and_send_to_backend(str(temp_codebase), jobs=1, ast_format='nested') is True
+
+        # 내용은 그대로지만 마지막 업로드와 전송 형식이 다르면 다시 전송
+        mock_post.reset_mock()
+        assert parse_codebase_and_send_to_backend(str(temp_codebase), jobs=1, ast_format='compact-v1') is True
+        assert sorted(call.kwargs['json']['format'] for call in mock_post.call_args_list) == ['compact-v1'] * 2
+
+        mock_post.reset_mock()
+        assert parse_codebase_and_send_to_backend(str(temp_codebase), jobs=1, ast_format='compact-v1') is True
+        assert mock_post.call_count == 0
+
+def test_parallel_parse_matches_serial(temp_codebase):
+    with patch('mira_cli.http_client.BackendClient.post') as mock_post:
+        mock_post.return_value = _mock_success_response()
+        assert parse_codebase_and_send_to_backend(str(temp_codebase), full=True, jobs=1) is True
+        serial = {call.kwargs['json']['filePath']: call.kwargs['json'] for call in mock_post.call_args_list}
+
+        mock_post.reset_mock()
+        assert parse_codebase_and_send_to_backend(str(temp_codebase), full=True, jobs=2) is True
+        parallel = {call.kwargs['json']['filePath']: call.kwargs['json'] for call in mock_post.call_args_list}
+
+        assert serial == parallel
+
+def test_bulk_upload_sends_compressed_ndjson_batches(temp_codebase):
+    with patch('mira_cli.http_client.BackendClient.post') as mock_post:
+        mock_post.return_value = _mock_success_response()
+
+        assert parse_codebase_and_send_to_backend(str(temp_codebase), jobs=1, upload_mode='bulk') is True
+
+        # 두 파일이 하나의 배치로 전송되고 파일별 엔드포인트는 사용되지 않음
+        assert mock_post.call_count == 1
+        call = mock_post.call_args
+        assert call.args[0] == "/parser/parse/bulk"
+        assert call.kwargs['headers']['Content-Encoding'] == 'gzip'
+        records = [json.loads(line) for line in gzip.decompress(call.kwargs['data']).splitlines()]
+        assert sorted(Path(record['filePath']).name for record in records) == ["ComplexJava.java", "complex_python.py"]
+
+def test_bulk_upload_falls_back_to_single_endpoint(temp_codebase):
+    not_found = MagicMock()
+    not_found.status_code = 404
+
+    # bulk 경로는 404, 파일별 경로는 성공으로 응답
+    def fake_post(endpoint, **kwargs):
+        if endpoint == "/parser/parse/bulk":
+            raise requests.exceptions.HTTPError(response=not_found)
+        return _mock_success_response()
+
+    with patch('mira_cli.http_client.BackendClient.post', side_effect=fake_post) as mock_post:
+        assert parse_codebase_and_send_to_backend(str(temp_codebase), jobs=1, upload_mode='bulk') is True
+        endpoints = [call.args[0] for call in mock_post.call_args_list]
+        assert endpoints == ["/parser/parse/bulk", "/parser/parse", "/parser/parse"]
+
+def test_compact_format_matches_nested_tree(temp_codebase):
+    with patch('mira_cli.http_client.BackendClient.post') as mock_post:
+        mock_post.return_value = _mock_success_response()
+        parse_codebase_and_send_to_backend(str(temp_codebase), full=True, jobs=1, ast_format='nested')
+        nested = {call.kwargs['json']['filePath']: call.kwargs['json'] for call in mock_post.call_args_list}
+
+        mock_post.reset_mock()
+        parse_codebase_and_send_to_backend(str(temp_codebase), full=True, jobs=1, ast_format='compact-v1')
+        compact = {call.kwargs['json']['filePath']: call.kwargs['json'] for call in mock_post.call_args_list}
+
+    assert nested.keys() == compact.keys()
+    for file_path, result in compact.items():
+        assert result['format'] == 'compact-v1'
+        assert nested[file_path]['format'] == 'nested'
+        source = result['source'].encode('utf-8')
+        nodes = result['ast']['nodes']
+        type_table = result['ast']['typeTable']
+
+        # compact 노드를 다시 중첩 형태(타입/값/자식)로 복원하여 nested 결과와 비교
+        def rebuild(index):
+            value = ""
+            if nodes['named'][index]:
+                value = source[nodes['startByte'][index]:nodes['endByte'][index]].decode('utf-8')
+            return {
+                "type": type_table[str(nodes['type'][index])],
+                "value": value,
+                "children": [rebuild(child) for child in nodes['children'][index]],
+            }
+
+        def strip_positions(node):
+            return {
+                "type": node['type'],
+                "value": node['value'],
+                "children": [strip_positions(child) for child in node['children']],
+            }
+
+        assert rebuild(0) == strip_positions(nested[file_path]['rootNode'])
+        assert len(json.dumps(result)) < len(json.dumps(nested[file_path]))
+
+# 기존 재귀 방식 변환기 (반복 방식 변환기와 출력이 같은지 비교하기 위한 기준 구현)
+def _reference_convert_to_ast_node(sitter_node):
+    node_value = ""
+    if sitter_node.is_named and sitter_node.text:
+        node_value = sitter_node.text.decode('utf-8')
+    return {
+        "type": sitter_node.type,
+        "value": node_value,
+        "startPosition": {"row": sitter_node.start_point[0], "column": sitter_node.start_point[1]},
+        "endPosition": {"row": sitter_node.end_point[0], "column": sitter_node.end_point[1]},
+        "children": [_reference_convert_to_ast_node(child) for child in sitter_node.children],
+    }
+
+def test_iterative_converter_matches_recursive_reference(temp_codebase):
+    from mira_cli.parser import convert_to_ast_node, _get_parser
+
+    for file_path in temp_codebase.iterdir():
+        parser, _ = _get_parser(file_path.suffix)
+        if not parser:
+            continue
+        tree = parser.parse(file_path.read_bytes())
+        expected = _reference_convert_to_ast_node(tree.root_node)
+        assert convert_to_ast_node(tree.root_node) == expected
+        assert json.dumps(convert_to_ast_node(tree.root_node)) == json.dumps(expected)
+        # 하위 노드에서 시작하는 변환도 동일해야 함
+        subtree = tree.root_node.children[-1]
+        assert convert_to_ast_node(subtree) == _reference_convert_to_ast_node(subtree)
+
+def test_iterative_converter_handles_deep_nesting():
+    from mira_cli.parser import convert_to_ast_node, _get_parser
+
+    parser, _ = _get_parser('.json')
+    depth = 5000
+    tree = parser.parse(b"[" * depth + b"]" * depth)
+    ast_node = convert_to_ast_node(tree.root_node)
+
+    # 가장 깊은 array 노드까지 내려가며 중첩 깊이 확인
+    nesting = 0
+    node = ast_node
+    while True:
+        arrays = [child for child in node["children"] if child["type"] == "array"]
+        if not arrays:
+            break
+        node = arrays[0]
+        nesting += 1
+    assert nesting == depth
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_deeply_nested_files_are_streamed_end_to_end(tmp_path, jobs):
+    depth = 500
+    (tmp_path / "deep.py").write_text("x = " + "(" * depth + "1" + ")" * depth + "\n")
+    (tmp_path / "deep.json").write_text("[" * depth + "]" * depth)
+    (tmp_path / "ok.py").write_text("y = 1\n")
+    bodies = {}
+    def _post(endpoint, **kwargs):
+        if 'data' in kwargs and endpoint == "/parser/parse":
+            # 스트리밍 본문은 비재귀 인코더로 생성되므로 재귀 한도에 걸리지 않음
+            bodies[str(kwargs['data'].file_path)] = b''.join(kwargs['data'])
+        return MagicMock()
+    with patch('mira_cli.http_client.BackendClient.post', side_effect=_post) as mock_post:
+        assert parse_codebase_and_send_to_backend(str(tmp_path), jobs=jobs, upload_mode='bulk')
+    assert sorted(bodies) == sorted(str(tmp_path / name) for name in ("deep.json", "deep.py"))
+    assert bodies[str(tmp_path / "deep.json")].count(b'"type":"array"') == depth
+    assert [call.args[0] for call in mock_post.call_args_list].count("/parser/parse/bulk") == 1
+
+def test_resume_continues_interrupted_full_run(temp_codebase):
+    (temp_codebase / "extra.py").write_text("y = 2\n")
+    server_error = MagicMock()
+    server_error.status_code = 500
+    responses = [_mock_success_response(), requests.exceptions.HTTPError(response=server_error),
+                 requests.exceptions.ConnectionError()]
+
+    # 첫 파일은 성공, 두 번째는 500 응답, 세 번째에서 백엔드 연결이 끊김
+    with patch('mira_cli.http_client.BackendClient.post', side_effect=responses) as mock_post:
+        assert parse_codebase_and_send_to_backend(str(temp_codebase), full=True, jobs=1) is False
+    sent = [Path(call.kwargs['json']['filePath']).name for call in mock_post.call_args_list]
+    journal_path = temp_codebase / ".mira" / "journal.jsonl"
+    assert journal_path.exists()
+
+    # --full 실행을 이어받아 성공한 파일은 건너뛰고, 실패한 파일과 전송하지 못한 파일만 다시 전송
+    with patch('mira_cli.http_client.BackendClient.post') as mock_post:
+        mock_post.return_value = _mock_success_response()
+        assert parse_codebase_and_send_to_backend(str(temp_codebase), jobs=1, resume=True) is True
+    resent = sorted(Path(call.kwargs['json']['filePath']).name for call in mock_post.call_args_list)
+    assert resent == sorted(sent[1:])
+    assert not journal_path.exists()
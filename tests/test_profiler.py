@@ -0,0 +1,53 @@
+import json
+from unittest.mock import patch
+
+import pytest
+
+from mira_cli.parser import parse_codebase_and_send_to_backend
+from mira_cli.profiler import PhaseProfiler, percentile
+
+
+def test_percentile_nearest_rank():
+    values = sorted(float(v) for v in range(1, 101))
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 95) == 95.0
+    assert percentile(values, 99) == 99.0
+    assert percentile([3.0], 99) == 3.0
+    assert percentile([], 50) == 0.0
+
+
+def test_disabled_profiler_records_nothing():
+    profiler = PhaseProfiler(enabled=False)
+    with profiler.phase('read', 'a.py', 'python') as event:
+        event['bytes'] = 10
+    assert profiler.events == []
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+@pytest.mark.parametrize("upload_mode", ["single", "bulk"])
+def test_parse_profile_records_phases_and_trace(tmp_path, jobs, upload_mode):
+    codebase = tmp_path / "codebase"
+    codebase.mkdir()
+    (codebase / "a.py").write_text("def a():\n    return 1\n")
+    (codebase / "B.java").write_text("class B { int b() { return 2; } }\n")
+
+    profiler = PhaseProfiler()
+    with patch('mira_cli.http_client.BackendClient.post'):
+        assert parse_codebase_and_send_to_backend(str(codebase), jobs=jobs, upload_mode=upload_mode, profiler=profiler)
+
+    summary = profiler.summary(top_n=1)
+    # 워커 프로세스에서 측정한 단계도 메인 프로세스의 프로파일러에 합쳐져야 함
+    for phase in ("scan", "read", "hash", "parse", "convert", "debug_dump", "upload"):
+        assert phase in summary["phases"]
+    if upload_mode == "bulk":
+        assert summary["phases"]["encode"]["count"] == 2
+    assert summary["phases"]["read"]["bytes"] == (codebase / "a.py").stat().st_size + (codebase / "B.java").stat().st_size
+    assert set(summary["languages"]) == {"python", "java"}
+    assert len(summary["slowestFiles"]) == 1
+    assert summary["fileLatency"]["p50"] <= summary["fileLatency"]["p99"]
+
+    trace_path = tmp_path / "trace.json"
+    profiler.write_chrome_trace(trace_path)
+    trace = json.loads(trace_path.read_text())
+    assert len(trace["traceEvents"]) == len(profiler.events)
+    assert all(event["ph"] == "X" and event["dur"] >= 0 for event in trace["traceEvents"])
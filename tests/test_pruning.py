@@ -0,0 +1,90 @@
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+import mira_cli.pruning
+from mira_cli.parser import _get_parser, convert_to_ast_node, convert_to_compact_ast, parse_codebase_and_send_to_backend
+from mira_cli.pruning import PruneProfile
+from mira_cli.utils import console
+
+SOURCE = b"""# greeting helpers
+def greet(name):
+    print("Hello, " + name)  # inline
+"""
+
+def _types(ast_node):
+    return [ast_node["type"]] + [t for child in ast_node["children"] for t in _types(child)]
+
+@pytest.fixture
+def tree():
+    parser, _ = _get_parser('.py')
+    return parser.parse(SOURCE)
+
+def test_profile_from_options():
+    assert PruneProfile.from_options({"enabled": "false", "drop_anonymous": "true"}) is None
+    assert PruneProfile.from_options({"enabled": "true"}) is None # 적용할 항목이 없음
+    profile = PruneProfile.from_options({"enabled": "yes", "drop_types": "comment, string_content",
+                                         "max_value_length": "40"})
+    assert profile.describe() == {"dropTypes": ["comment", "string_content"], "maxValueLength": 40}
+
+def test_drop_anonymous_and_types(tree):
+    stats = {}
+    ast_node = convert_to_ast_node(tree.root_node, PruneProfile(drop_anonymous=True, drop_types=["comment"]), stats)
+    types = _types(ast_node)
+    assert "comment" not in types
+    assert not {"def", "(", ")", ":", "+"} & set(types)
+    assert "function_definition" in types and "call" in types
+    assert stats["nodes"] == tree.root_node.descendant_count
+    assert stats["keptNodes"] == len(types)
+
+def test_collapse_single_child_chains_and_value_cap(tree):
+    profile = PruneProfile(drop_anonymous=True, drop_types=["comment"], collapse_single_child=True, max_value_length=10)
+    stats = {}
+    ast_node = convert_to_ast_node(tree.root_node, profile, stats)
+    body = ast_node["children"][0]["children"][-1]
+    # expression_statement(범위가 같은 call 하나만 가짐)는 call 로 대체
+    assert body["type"] == "block"
+    assert [child["type"] for child in body["children"]] == ["call"]
+    assert all(len(node_value) <= 10 for node_value in _values(ast_node))
+    assert stats["truncatedChars"] > 0
+
+def _values(ast_node):
+    return [ast_node["value"]] + [v for child in ast_node["children"] for v in _values(child)]
+
+def test_compact_and_nested_prune_the_same_nodes(tree):
+    profile = PruneProfile(drop_anonymous=True, drop_types=["comment"], collapse_single_child=True)
+    nested = convert_to_ast_node(tree.root_node, profile)
+    compact = convert_to_compact_ast(tree, profile)
+    type_table, nodes = compact["typeTable"], compact["nodes"]
+    assert [type_table[str(kind_id)] for kind_id in nodes["type"]] == _types(nested)
+
+def test_parse_applies_profile_and_reports_saved_bytes(tmp_path, monkeypatch):
+    (tmp_path / "app.py").write_bytes(SOURCE)
+    monkeypatch.setitem(mira_cli.pruning._profiles, 'python', PruneProfile(drop_anonymous=True, drop_types=["comment"]))
+    with patch('mira_cli.http_client.BackendClient.post', return_value=MagicMock()) as mock_post, \
+            console.capture() as capture:
+        assert parse_codebase_and_send_to_backend(str(tmp_path), upload_mode='single', prune_report=True)
+    sent = mock_post.call_args.kwargs["json"]
+    assert sent["pruning"]["dropAnonymous"] is True
+    assert "report" not in sent["pruning"]
+    assert "comment" not in _types(sent["rootNode"])
+    output = capture.get()
+    assert "AST 가지치기" in output and "python" in output
+
+def test_changing_profile_resends_unchanged_files(tmp_path, monkeypatch):
+    (tmp_path / "app.py").write_bytes(SOURCE)
+    with patch('mira_cli.http_client.BackendClient.post', return_value=MagicMock()) as mock_post:
+        monkeypatch.setitem(mira_cli.pruning._profiles, 'python', None)
+        assert parse_codebase_and_send_to_backend(str(tmp_path), upload_mode='single')
+        assert "pruning" not in mock_post.call_args.kwargs["json"]
+
+        # 가지치기를 켜거나 설정을 바꾸면 내용이 같아도 다시 전송
+        for profile in (PruneProfile(drop_anonymous=True), PruneProfile(drop_anonymous=True, drop_types=["comment"])):
+            mock_post.reset_mock()
+            monkeypatch.setitem(mira_cli.pruning._profiles, 'python', profile)
+            assert parse_codebase_and_send_to_backend(str(tmp_path), upload_mode='single')
+            assert mock_post.call_args.kwargs["json"]["pruning"]["dropAnonymous"] is True
+
+        mock_post.reset_mock()
+        assert parse_codebase_and_send_to_backend(str(tmp_path), upload_mode='single')
+        assert mock_post.call_count == 0
@@ -0,0 +1,73 @@
+import json
+from unittest.mock import patch, MagicMock
+
+import pytest
+from click.testing import CliRunner
+
+from mira_cli.cli import MIRA
+from mira_cli.parser import parse_codebase_and_send_to_backend
+from mira_cli.sharding import assign_shards, parse_shard_spec
+
+def test_assignment_is_deterministic_complete_and_size_balanced():
+    files = [(f"src/file_{i}.py", (i * 7919) % 1000 + 1) for i in range(200)]
+    assignment = assign_shards(files, 4)
+    assert assignment == assign_shards(list(reversed(files)), 4)
+    assert set(assignment) == {rel_path for rel_path, _ in files}
+    loads = [sum(size for rel_path, size in files if assignment[rel_path] == shard) for shard in range(1, 5)]
+    assert max(loads) - min(loads) <= max(size for _, size in files)
+
+def test_parse_shard_spec():
+    assert parse_shard_spec("2/8") == (2, 8)
+    for spec in ("0/2", "3/2", "2", "a/b"):
+        with pytest.raises(ValueError):
+            parse_shard_spec(spec)
+
+def test_shards_cover_every_file_once_and_merge(tmp_path, monkeypatch):
+    for i in range(5):
+        (tmp_path / f"m{i}.py").write_text(f"x = {i}\n" * (i + 1))
+    sent = []
+    with patch('mira_cli.http_client.BackendClient.post', return_value=MagicMock()) as mock_post:
+        for shard in ((1, 2), (2, 2)):
+            assert parse_codebase_and_send_to_backend(str(tmp_path), upload_mode='single', shard=shard)
+        sent = [call.kwargs['json']['filePath'] for call in mock_post.call_args_list]
+    assert sorted(sent) == sorted(str(tmp_path / f"m{i}.py") for i in range(5))
+
+    shard_manifests = [str(tmp_path / ".mira" / f"shard-{i}-of-2.json") for i in (1, 2)]
+    runner = CliRunner()
+    # 샤드 하나가 빠지면 병합 실패
+    result = runner.invoke(MIRA, ["merge-manifests", shard_manifests[0], "--path", str(tmp_path), "--no-notify"])
+    assert result.exit_code == 1
+    assert "누락된 샤드: 2/2" in result.output
+
+    (tmp_path / ".mira" / "manifest.json").unlink()
+    with patch('mira_cli.http_client.BackendClient.post', return_value=MagicMock()) as mock_post:
+        result = runner.invoke(MIRA, ["merge-manifests", *shard_manifests, "--path", str(tmp_path)])
+    assert result.exit_code == 0, result.output
+    assert mock_post.call_args.args[0] == "/parser/complete"
+    assert mock_post.call_args.kwargs['json']['totalFiles'] == 5
+    merged = json.loads((tmp_path / ".mira" / "manifest.json").read_text())
+    assert sorted(merged['files']) == [f"m{i}.py" for i in range(5)]
+
+def test_each_shard_reports_deletions_from_its_own_checkout(tmp_path):
+    checkouts = [tmp_path / "machine1", tmp_path / "machine2"]
+    for checkout in checkouts:
+        checkout.mkdir()
+        for i in range(4):
+            (checkout / f"m{i}.py").write_text(f"x = {i}\n" * (i + 1))
+    with patch('mira_cli.http_client.BackendClient.post', return_value=MagicMock()):
+        for shard, checkout in enumerate(checkouts, 1):
+            assert parse_codebase_and_send_to_backend(str(checkout), upload_mode='single', shard=(shard, 2))
+    # 두 번째 샤드가 처리한 파일을 양쪽 체크아웃에서 삭제
+    shard2_files = json.loads((checkouts[1] / ".mira" / "shard-2-of-2.json").read_text())['files']
+    deleted = sorted(shard2_files)[0]
+    for checkout in checkouts:
+        (checkout / deleted).unlink()
+
+    removed = []
+    with patch('mira_cli.http_client.BackendClient.post', return_value=MagicMock()) as mock_post:
+        for shard, checkout in enumerate(checkouts, 1):
+            assert parse_codebase_and_send_to_backend(str(checkout), upload_mode='single', shard=(shard, 2))
+            removed.extend(call.kwargs['json']['filePaths'] for call in mock_post.call_args_list
+                           if call.args[0] == "/parser/remove")
+            mock_post.reset_mock()
+    assert removed == [[str(checkouts[1] / deleted)]]
@@ -0,0 +1,78 @@
+from unittest.mock import patch, MagicMock
+
+import pytest
+import requests
+from click.testing import CliRunner
+
+from mira_cli.cli import MIRA
+from mira_cli.parser import parse_codebase_and_send_to_backend
+from mira_cli.spool import SpoolWriter, iter_records
+
+def test_parse_spools_offline_and_replay_sends_in_order(tmp_path):
+    codebase = tmp_path / "code"
+    codebase.mkdir()
+    (codebase / "a.py").write_text("x = 1\n")
+    (codebase / "b.py").write_text("y = 2\n")
+    spool_path = tmp_path / "out.spool"
+
+    # 백엔드 없이 파싱 결과를 스풀에 기록하고, 기록한 파일은 다음 실행에서 건너뜀
+    with patch('mira_cli.http_client.BackendClient.post') as mock_post:
+        assert parse_codebase_and_send_to_backend(str(codebase), spool_path=str(spool_path))
+        (codebase / "b.py").unlink()
+        assert parse_codebase_and_send_to_backend(str(codebase), spool_path=str(spool_path))
+    mock_post.assert_not_called()
+    records = list(iter_records(spool_path))
+    assert [record["type"] for record in records] == ["parse", "parse", "remove"]
+    assert records[2]["filePaths"] == [str(codebase / "b.py")]
+
+    with patch('mira_cli.http_client.BackendClient.post', return_value=MagicMock()) as mock_post:
+        result = CliRunner().invoke(MIRA, ["replay", str(spool_path), "--upload-mode", "single"])
+    assert result.exit_code == 0, result.output
+    endpoints = [call.args[0] for call in mock_post.call_args_list]
+    assert endpoints == ["/parser/parse", "/parser/parse", "/parser/remove"]
+    assert {call.kwargs["json"]["filePath"] for call in mock_post.call_args_list[:2]} == \
+        {str(codebase / "a.py"), str(codebase / "b.py")}
+    assert not spool_path.exists()
+
+def test_replay_keeps_only_unsent_records(tmp_path):
+    spool_path = tmp_path / "out.spool"
+    spool = SpoolWriter(spool_path)
+    for name in ("a.py", "b.py", "c.py"):
+        spool.add({"filePath": name, "language": "python"})
+    spool.close()
+    with open(spool_path, 'ab') as f:
+        f.write(b'\x00\x00\x10') # 강제 종료로 잘린 레코드
+
+    bad_request = MagicMock()
+    bad_request.status_code = 400
+    def fake_post(endpoint, json=None, **kwargs):
+        if json["filePath"] == "b.py":
+            raise requests.exceptions.HTTPError(response=bad_request)
+        return MagicMock()
+
+    with patch('mira_cli.http_client.BackendClient.post', side_effect=fake_post):
+        result = CliRunner().invoke(MIRA, ["replay", str(spool_path), "--upload-mode", "single"])
+    assert result.exit_code == 1
+    assert [record["result"]["filePath"] for record in iter_records(spool_path)] == ["b.py"]
+
+    # 스풀 파일이 아닌 파일은 거부
+    (tmp_path / "other.txt").write_text("hello")
+    result = CliRunner().invoke(MIRA, ["replay", str(tmp_path / "other.txt")])
+    assert result.exit_code == 1
+    assert "스풀 파일 형식이 아닙니다" in result.output
+
+
+@pytest.mark.parametrize("tail", [b'\x00\x00', b'\x00\x00\x00\x40partial'])
+def test_writer_repairs_truncated_tail_before_appending(tmp_path, tail):
+    spool_path = tmp_path / "out.spool"
+    spool = SpoolWriter(spool_path)
+    for name in ("a.py", "b.py"):
+        spool.add({"filePath": name, "language": "python"})
+    spool.close()
+    with open(spool_path, 'ab') as f:
+        f.write(tail) # 강제 종료로 잘린 레코드
+
+    spool = SpoolWriter(spool_path)
+    spool.add({"filePath": "c.py", "language": "python"})
+    spool.close()
+    assert [record["result"]["filePath"] for record in iter_records(spool_path)] == ["a.py", "b.py", "c.py"]
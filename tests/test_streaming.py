@@ -0,0 +1,84 @@
+import json
+import tracemalloc
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+import mira_cli.parser
+import mira_cli.pruning
+from mira_cli.parser import _build_parse_result, _get_parser, parse_codebase_and_send_to_backend
+from mira_cli.pruning import PruneProfile
+from mira_cli.streaming import StreamingParseResult
+
+SOURCE = """# 인사 함수
+def greet(name):
+    print("Hello, \\"" + name + "\\" ✓")  # inline
+
+class Greeter:
+    pass
+""".encode('utf-8')
+
+def _parse(source):
+    parser, lang_name = _get_parser('.py')
+    return parser.parse(source), lang_name
+
+def _dumps(data):
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+@pytest.mark.parametrize("ast_format", ["nested", "compact-v1"])
+@pytest.mark.parametrize("profile", [None, PruneProfile(drop_anonymous=True, drop_types=["comment"]),
+                                     PruneProfile(collapse_single_child=True, max_value_length=8)])
+def test_stream_matches_parse_result(monkeypatch, ast_format, profile):
+    monkeypatch.setitem(mira_cli.pruning._profiles, 'python', profile)
+    tree, lang_name = _parse(SOURCE)
+    expected = _build_parse_result("app.py", lang_name, tree, SOURCE, ast_format)
+
+    body = StreamingParseResult("app.py", lang_name, tree, SOURCE, ast_format, buffer_size=16)
+    chunks = list(body)
+    assert len(chunks) > 1
+    assert b''.join(chunks) == _dumps(expected)
+    assert body.pruning == expected.get("pruning")
+    # 재시도할 때 같은 본문을 다시 생성
+    assert b''.join(body) == b''.join(chunks)
+
+def test_stream_peak_memory_is_bounded_by_buffer():
+    source = "".join(f"def function_{i}(a, b):\n    return helper(a + {i}, b * 2)\n\n" for i in range(3000)).encode()
+    tree, lang_name = _parse(source)
+    full_size = len(_dumps(_build_parse_result("big.py", lang_name, tree, source, "nested")))
+
+    buffer_size = 64 * 1024
+    body = StreamingParseResult("big.py", lang_name, tree, source, "nested", buffer_size=buffer_size)
+    total = 0
+    tracemalloc.start()
+    try:
+        for chunk in body:
+            total += len(chunk)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert total == full_size
+    # 최대 메모리는 전체 JSON 크기가 아니라 소스(루트 노드의 value)와 청크 버퍼 크기에 비례
+    assert peak < 5 * len(source) + 4 * buffer_size
+    assert peak < full_size // 10
+
+def test_large_files_are_streamed_to_single_endpoint(tmp_path, monkeypatch):
+    (tmp_path / "small.py").write_text("x = 1\n")
+    (tmp_path / "big.py").write_bytes(SOURCE)
+    monkeypatch.setattr(mira_cli.parser, 'UPLOAD_STREAM_THRESHOLD_BYTES', len(SOURCE))
+    sent = []
+    def _post(endpoint, data=None, **kwargs):
+        sent.append((endpoint, b''.join(data) if isinstance(data, StreamingParseResult) else data))
+        return MagicMock()
+
+    with patch('mira_cli.http_client.BackendClient.post', side_effect=_post):
+        assert parse_codebase_and_send_to_backend(str(tmp_path), upload_mode='bulk', jobs=1)
+    # 큰 파일은 배치에 넣지 않고 파싱 직후 전송, 나머지는 마지막 배치로 전송
+    assert [endpoint for endpoint, _ in sent] == ["/parser/parse", "/parser/parse/bulk"]
+    streamed = json.loads(sent[0][1])
+    assert streamed["filePath"] == str(tmp_path / "big.py")
+    assert streamed["rootNode"]["type"] == "module"
+
+    # 스트리밍 전송한 파일도 매니페스트에 기록되어 다음 실행에서 건너뜀
+    with patch('mira_cli.http_client.BackendClient.post') as mock_post:
+        assert parse_codebase_and_send_to_backend(str(tmp_path), upload_mode='bulk', jobs=1)
+    mock_post.assert_not_called()
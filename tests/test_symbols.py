@@ -0,0 +1,62 @@
+import json
+from unittest.mock import patch, MagicMock
+
+from click.testing import CliRunner
+
+from mira_cli.cli import MIRA
+from mira_cli.parser import parse_codebase_and_send_to_backend
+from mira_cli.symbols import SymbolIndex
+
+SOURCE = """class Greeter:
+    def greet(self, name):
+        return format_greeting(name)
+
+def format_greeting(name):
+    return "Hello " + name
+
+greeter = Greeter()
+"""
+
+def test_lookup_orders_definitions_first_and_supports_prefix(tmp_path):
+    index = SymbolIndex.open(tmp_path)
+    index.replace_file("a.py", "h1", [("Greeter", "reference", "call", 9, 11), ("Greeter", "definition",
+                                      "class_definition", 1, 7), ("greeting", "definition", "function_definition", 3, 5)])
+    index.replace_file("b.py", "h2", [("GREETER", "definition", "assignment", 2, 1)])
+
+    results = index.lookup("greeter")
+    assert [(r["filePath"], r["kind"]) for r in results] == [("a.py", "definition"), ("b.py", "definition"),
+                                                             ("a.py", "reference")]
+    assert {r["name"] for r in index.lookup("greet*")} == {"Greeter", "GREETER", "greeting"}
+    assert index.lookup("greet*", definitions_only=True, limit=1)[0]["name"] == "Greeter"
+
+    # 파일을 다시 인덱싱하거나 삭제하면 해당 파일의 항목만 교체
+    index.replace_file("a.py", "h3", [])
+    index.remove_files(["b.py"])
+    assert index.lookup("greet*") == []
+    assert index.file_hashes() == {"a.py": "h3"}
+    index.close()
+
+def test_parse_builds_index_and_search_local_answers_offline(tmp_path, monkeypatch):
+    (tmp_path / "app.py").write_text(SOURCE)
+    with patch('mira_cli.http_client.BackendClient.post', return_value=MagicMock()):
+        assert parse_codebase_and_send_to_backend(str(tmp_path), upload_mode='single')
+
+    monkeypatch.chdir(tmp_path)
+    with patch('mira_cli.http_client.BackendClient.request') as mock_request:
+        result = CliRunner().invoke(MIRA, ["search", "--local", "format_greeting", "--json"])
+    mock_request.assert_not_called()
+    assert result.exit_code == 0, result.output
+    hits = json.loads(result.output)
+    assert hits[0] == {"name": "format_greeting", "kind": "definition", "nodeType": "function_definition",
+                       "filePath": "app.py", "line": 5, "column": 5}
+    assert [hit["kind"] for hit in hits[1:]] == ["reference"]
+
+    # 인덱스가 없는 상태에서 미변경 파일은 다시 파싱하지 않고 인덱스만 보충
+    (tmp_path / ".mira" / "symbols.sqlite3").unlink()
+    with patch('mira_cli.http_client.BackendClient.post') as mock_post:
+        assert parse_codebase_and_send_to_backend(str(tmp_path), upload_mode='single')
+    mock_post.assert_not_called()
+    index, root = SymbolIndex.find(tmp_path / ".mira")
+    assert root == tmp_path.resolve()
+    assert index.lookup("Greeter", definitions_only=True)[0]["line"] == 1
+    index.close()
@@ -0,0 +1,137 @@
+import threading
+import time
+from unittest.mock import patch, MagicMock
+
+import pytest
+import requests
+
+from mira_cli.uploader import AdaptiveConcurrency, ParseResultUploader
+
+def _http_error(status_code):
+    response = MagicMock()
+    response.status_code = status_code
+    return requests.exceptions.HTTPError(response=response)
+
+def test_aimd_limit_grows_on_fast_responses_and_halves_on_overload():
+    limiter = AdaptiveConcurrency(max_limit=4, target_latency=1.0)
+    for _ in range(20):
+        limiter.acquire()
+        limiter.release(0.01)
+    assert limiter.limit == 4
+
+    limiter.acquire()
+    limiter.release(0.01, overloaded=True)
+    assert limiter.limit == 2
+    # 같은 과부하 구간에서 끝난 느린 응답은 상한을 다시 줄이지 않음
+    limiter.acquire()
+    limiter.release(5.0)
+    assert limiter.limit == 2
+
+def test_pipeline_overlaps_uploads_and_respects_limit():
+    active = []
+    peak = []
+    lock = threading.Lock()
+    def slow_post(endpoint, **kwargs):
+        with lock:
+            active.append(1)
+            peak.append(len(active))
+        time.sleep(0.02)
+        with lock:
+            active.pop()
+        return MagicMock()
+
+    uploaded = []
+    with patch('mira_cli.http_client.BackendClient.post', side_effect=slow_post):
+        uploader = ParseResultUploader(on_uploaded=uploaded.append, mode='single', max_concurrency=3, queue_size=2)
+        try:
+            for i in range(30):
+                uploader.add({"filePath": f"f{i}.py", "language": "python"}, i)
+            uploader.flush()
+        finally:
+            uploader.close()
+    assert sorted(uploaded) == list(range(30))
+    assert max(peak) <= 3
+    assert max(peak) > 1 # 응답이 빠르면 동시 요청 수가 늘어남
+
+def test_overload_responses_are_retried_and_failures_reported(monkeypatch):
+    monkeypatch.setattr('mira_cli.http_client.BackendClient.sleep_before_retry', lambda self, attempt: None)
+    responses = {"a.py": [_http_error(429), MagicMock()], "b.py": [_http_error(400)]}
+    def fake_post(endpoint, json=None, **kwargs):
+        result = responses[json["filePath"]].pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    uploaded, failed = [], []
+    with patch('mira_cli.http_client.BackendClient.post', side_effect=fake_post):
+        uploader = ParseResultUploader(on_uploaded=uploaded.append, on_failed=lambda ctx, err: failed.append(ctx),
+                                       mode='single', max_concurrency=1)
+        try:
+            uploader.add({"filePath": "a.py"}, "a")
+            uploader.add({"filePath": "b.py"}, "b")
+            uploader.flush()
+        finally:
+            uploader.close()
+    assert uploaded == ["a"] and failed == ["b"]
+    assert uploader.failed_count == 1
+
+def test_overload_is_retried_by_a_single_layer(monkeypatch):
+    monkeypatch.setattr('mira_cli.http_client.BackendClient.sleep_before_retry', lambda self, attempt: None)
+    calls = []
+    def overloaded(method, url, **kwargs):
+        calls.append(url)
+        response = MagicMock()
+        response.status_code = 503
+        response.raise_for_status.side_effect = _http_error(503)
+        return response
+
+    failed = []
+    with patch('requests.Session.request', side_effect=overloaded):
+        uploader = ParseResultUploader(on_failed=lambda ctx, err: failed.append(ctx), mode='single',
+                                       max_concurrency=1)
+        try:
+            uploader.add({"filePath": "a.py"}, "a")
+            uploader.flush()
+        finally:
+            uploader.close()
+    # HTTP 클라이언트는 503 을 재시도하지 않고 업로더만 max_retries 만큼 다시 보냄
+    assert len(calls) == uploader._client.max_retries + 1
+    assert failed == ["a"]
+
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_unexpected_sender_errors_fail_the_file_and_dead_senders_do_not_hang_flush(monkeypatch):
+    def bad_post(endpoint, json=None, **kwargs):
+        raise ValueError("인코딩할 수 없는 값")
+
+    failed = []
+    with patch('mira_cli.http_client.BackendClient.post', side_effect=bad_post):
+        uploader = ParseResultUploader(on_failed=lambda ctx, err: failed.append((ctx, str(err))), mode='bulk',
+                                       max_concurrency=2)
+        try:
+            uploader.add({"filePath": "a.py"}, "a")
+            uploader.add({"filePath": "b.py"}, "b")
+            uploader.flush()
+        finally:
+            uploader.close()
+    assert failed == [("a", "인코딩할 수 없는 값"), ("b", "인코딩할 수 없는 값")]
+
+    # 전송 스레드가 결과 없이 종료되면 flush 는 기다리지 않고 예외 발생
+    def dying_send(self, parse_result):
+        raise SystemExit
+    monkeypatch.setattr(ParseResultUploader, '_send_single', dying_send)
+    uploader = ParseResultUploader(mode='single', max_concurrency=1)
+    uploader.add({"filePath": "c.py"}, "c")
+    with pytest.raises(RuntimeError):
+        uploader.flush()
+    uploader.close()
+
+def test_connection_error_stops_the_pipeline():
+    with patch('mira_cli.http_client.BackendClient.post', side_effect=requests.exceptions.ConnectionError()):
+        uploader = ParseResultUploader(mode='single', max_concurrency=2)
+        try:
+            with pytest.raises(requests.exceptions.ConnectionError):
+                for i in range(5):
+                    uploader.add({"filePath": f"f{i}.py"}, i)
+                uploader.flush()
+        finally:
+            uploader.close()
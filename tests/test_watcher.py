@@ -0,0 +1,100 @@
+import sys
+import threading
+import time
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from mira_cli.manifest import Manifest
+from mira_cli.parser import load_gitignore_patterns, parse_codebase_and_send_to_backend
+from mira_cli.watcher import CodebaseWatcher, InotifyObserver, PollingObserver
+
+@pytest.fixture
+def codebase(tmp_path):
+    root = tmp_path / "codebase"
+    (root / "pkg").mkdir(parents=True)
+    (root / "node_modules").mkdir()
+    (root / "app.py").write_text("a = 1\n")
+    (root / "pkg" / "mod.py").write_text("b = 2\n")
+    return root
+
+# 최대 timeout 초 동안 감시기에서 변경 경로를 모아 반환
+def _collect(observer, timeout=3.0):
+    changed = set()
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        changed.update(observer.read(0.1))
+        if changed:
+            # 같은 동작에서 이어지는 이벤트까지 모음
+            changed.update(observer.read(0.2))
+            return changed
+    return changed
+
+def test_polling_observer_reports_changes_and_skips_ignored(codebase):
+    observer = PollingObserver(codebase, load_gitignore_patterns(codebase), interval=0.05)
+    (codebase / "pkg" / "new.py").write_text("c = 3\n")
+    (codebase / "node_modules" / "lib.js").write_text("x")
+    (codebase / "app.py").write_text("a = 10\n")
+    (codebase / "pkg" / "mod.py").unlink()
+    assert _collect(observer) == {"pkg/new.py", "app.py", "pkg/mod.py"}
+
+@pytest.mark.skipif(not sys.platform.startswith('linux'), reason="inotify 는 Linux 전용")
+def test_inotify_observer_follows_new_directories_and_renames(codebase):
+    observer = InotifyObserver(codebase, load_gitignore_patterns(codebase))
+    try:
+        (codebase / "node_modules" / "lib.js").write_text("x")
+        (codebase / "sub").mkdir()
+        assert _collect(observer) == {"sub"}
+
+        # 새로 만든 디렉토리도 감시 대상에 추가됨
+        (codebase / "sub" / "inner.py").write_text("d = 4\n")
+        assert _collect(observer) == {"sub/inner.py"}
+
+        (codebase / "pkg" / "mod.py").rename(codebase / "pkg" / "renamed.py")
+        assert _collect(observer) == {"pkg/mod.py", "pkg/renamed.py"}
+    finally:
+        observer.close()
+
+def test_watcher_debounces_bursts_into_one_sync(codebase):
+    batches = []
+    synced = threading.Event()
+
+    def sync(changed_paths):
+        batches.append(changed_paths)
+        synced.set()
+        return True
+
+    watcher = CodebaseWatcher(codebase, sync, polling=True, debounce=0.3, max_delay=5, poll_interval=0.05)
+    stop = threading.Event()
+    thread = threading.Thread(target=watcher.run, args=(stop,))
+    thread.start()
+    try:
+        for index in range(3):
+            (codebase / f"burst{index}.py").write_text(f"x = {index}\n")
+            time.sleep(0.1)
+        assert synced.wait(5)
+        time.sleep(0.5)
+    finally:
+        stop.set()
+        thread.join()
+        watcher.close()
+    assert batches == [["burst0.py", "burst1.py", "burst2.py"]]
+
+def test_changed_paths_only_report_removals_within_scope(codebase):
+    # 이전 실행에서 업로드된 것으로 기록된 파일들
+    manifest = Manifest.load(codebase)
+    for rel_path in ("app.py", "pkg/mod.py", "gone.py"):
+        manifest.record(rel_path, "hash", "python", (codebase / "app.py").stat())
+    manifest.save()
+    (codebase / "pkg" / "mod.py").unlink()
+    (codebase / "pkg").rmdir()
+
+    with patch('mira_cli.http_client.BackendClient.post') as mock_post:
+        mock_post.return_value = MagicMock()
+        assert parse_codebase_and_send_to_backend(str(codebase), changed_paths=["pkg"]) is True
+
+    # 감시 범위(pkg) 밖의 gone.py 는 이번 동기화에서 건드리지 않음
+    assert mock_post.call_count == 1
+    assert mock_post.call_args.args[0] == "/parser/remove"
+    assert [path.endswith("mod.py") for path in mock_post.call_args.kwargs['json']['filePaths']] == [True]
+    assert set(Manifest.load(codebase).files) == {"app.py", "gone.py"}